@@ -637,6 +637,11 @@ class CCApp(qtw.QApplication):
             self.tab_report.window_bldg_components.set_treeView_bldg_components
         )
 
+        # -- Show the [Model] progress in the [View]
+        self.model.sig_load_progress.connect(self.view.show_load_progress)
+        self.model.sig_json_file_written.connect(self.view.show_file_saved)
+        self.model.sig_json_file_write_failed.connect(self.view.show_file_save_failed)
+
         # -- Read data form [View] treeView
         self.model.sig_read_treeView_team.connect(
             self.tab_report.window_team_and_site.get_treeView_data_team
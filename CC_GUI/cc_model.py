@@ -2,13 +2,14 @@
 
 """Main Application Model."""
 
-import json
+import copy
 import logging
 import os
 import pathlib
 import sys
+from functools import partial
 from types import ModuleType
-from typing import Any, Dict, Generator, List, Optional, Union, get_type_hints
+from typing import Any, Dict, Generator, List, Optional, Set, Union, get_type_hints
 
 try:
     from PyQt6 import QtCore as qtc
@@ -26,6 +27,7 @@ try:
         WorkerSetPHPPBaseline,
         WorkerSetWUFIBaseline,
         WorkerWriteExcelReport,
+        WorkerWriteJSONFile,
     )
     from CC_GUI.views.tree_view_tools import (
         NBDM_Object_from_treeView,
@@ -36,6 +38,7 @@ except Exception as e:
     raise Exception("Error importing App library?", e)
 
 try:
+    from NBDM.from_JSON.read import NBDM_Project_from_json_file
     from NBDM.model import (
         appliances,
         building,
@@ -49,9 +52,12 @@ try:
         team,
         ventilation_systems,
     )
+    from NBDM.model.collections import Collection
     from NBDM.model.project import NBDM_Project
-    from NBDM.model.serialization import build_NBDM_obj_from_treeView
-    from NBDM.to_JSON.write import NBDM_Project_to_json_file
+    from NBDM.model.serialization import (
+        build_NBDM_obj_from_treeView,
+        get_deserialization_plan,
+    )
 except Exception as e:
     raise Exception("Error importing NBDM library?", e)
 
@@ -86,6 +92,15 @@ class CCModel(qtw.QWidget):
     sig_read_treeView_baseline_segments = qtc.pyqtSignal()
     sig_read_treeView_bldg_components = qtc.pyqtSignal()
 
+    # -------------------------------------------------------------------------
+    # -- Progress (0-100%) while loading a project file
+    sig_load_progress = qtc.pyqtSignal(int)
+
+    # -------------------------------------------------------------------------
+    # -- The result of saving the project file (on the worker thread)
+    sig_json_file_written = qtc.pyqtSignal(pathlib.Path)
+    sig_json_file_write_failed = qtc.pyqtSignal(pathlib.Path, str)
+
     # -------------------------------------------------------------------------
     # -- Thread workers for reading / writing PHPP and WUFI data
     sig_read_project_data_from_file = qtc.pyqtSignal(NBDM_Project, pathlib.Path)
@@ -96,6 +111,7 @@ class CCModel(qtw.QWidget):
     # -------------------------------------------------------------------------
     # -- Thread workers for writing NBDM data to Excel report
     sig_write_excel_report = qtc.pyqtSignal(NBDM_Project, pathlib.Path)
+    sig_write_json_file = qtc.pyqtSignal(NBDM_Project, pathlib.Path)
     sig_write_baseline = qtc.pyqtSignal(pathlib.Path, BaselineCode, dict)
     sig_write_PHPP_baseline = qtc.pyqtSignal(pathlib.Path, BaselineCode, dict)
     sig_write_WUFI_baseline = qtc.pyqtSignal(pathlib.Path, BaselineCode, dict)
@@ -110,6 +126,8 @@ class CCModel(qtw.QWidget):
         self.output_format = _output_format
         self.application_path = _application_path
         self.NBDM_project = NBDM_Project()
+        # -- The treeViews which have not been filled in since a Project was loaded
+        self.unfilled_treeviews: Set[str] = set()
         self._configure_worker_threads()
 
         self.logger.debug("CCModel successfully initialized.")
@@ -161,6 +179,11 @@ class CCModel(qtw.QWidget):
         self.worker_write_report_thread = qtc.QThread()
         self.worker_write_report_thread.setObjectName("Worker Thread: Write Excel Report")
 
+        self.worker_write_json = WorkerWriteJSONFile()
+        self.worker_write_json.setObjectName("Worker: Write JSON File")
+        self.worker_write_json_thread = qtc.QThread()
+        self.worker_write_json_thread.setObjectName("Worker Thread: Write JSON File")
+
         self.worker_set_baseline_PHPP = WorkerSetPHPPBaseline()
         self.worker_set_baseline_PHPP.setObjectName("Worker: Set PHPP Baseline")
         self.worker_set_baseline_phpp_thread = qtc.QThread()
@@ -200,6 +223,9 @@ class CCModel(qtw.QWidget):
         self.worker_write_report.moveToThread(self.worker_write_report_thread)
         self.worker_write_report_thread.start()
 
+        self.worker_write_json.moveToThread(self.worker_write_json_thread)
+        self.worker_write_json_thread.start()
+
         self.worker_set_baseline_PHPP.moveToThread(self.worker_set_baseline_phpp_thread)
         self.worker_set_baseline_phpp_thread.start()
 
@@ -231,6 +257,10 @@ class CCModel(qtw.QWidget):
         self.worker_write_report.written.connect(self.set_NBDM_project)
         self.sig_write_excel_report.connect(self.worker_write_report.run)
 
+        self.worker_write_json.written.connect(self.sig_json_file_written)
+        self.worker_write_json.failed.connect(self.sig_json_file_write_failed)
+        self.sig_write_json_file.connect(self.worker_write_json.run)
+
         self.sig_write_PHPP_baseline.connect(self.worker_set_baseline_PHPP.run)
         self.sig_write_WUFI_baseline.connect(self.worker_set_baseline_WUFI.run)
 
@@ -245,6 +275,7 @@ class CCModel(qtw.QWidget):
     def update_treeview_team(self) -> None:
         """Build the treeView data dict from the Project and pass back to the view."""
         self.logger.debug("Updating treeView team data.")
+        self.unfilled_treeviews.discard("team")
 
         tree_project_data = {}
         tree_project_data.update(
@@ -282,6 +313,8 @@ class CCModel(qtw.QWidget):
     def update_treeview_bldg_components(self) -> None:
         """Build the treeView data dict from the Project, and pass the dict back to the view."""
         self.logger.debug("Updating treeView building-component data.")
+        self.unfilled_treeviews.discard("bldg_components")
+        self.load_bldg_components()
         tree_bldg_component_data = {
             "ASSEMBLIES": {},
             "GLAZING": {},
@@ -379,53 +412,90 @@ class CCModel(qtw.QWidget):
         """Build up an NBDM_Project from a save file and set as the active."""
         self.logger.info(f"Loading CarbonCheck data from file: {_filepath}")
 
-        data = self.load_json_file_as_dict(_filepath)
-
-        self.logger.debug("Building NBDM_project object from file data.")
-        self.NBDM_project = project.NBDM_Project.from_dict(data)
+        self.NBDM_project = self.load_json_file_as_project(_filepath)
 
+        # -- The Team/Site and Building-Component windows are filled in when they are
+        # -- next shown, so those parts of the Project are only built if they are used.
         self.logger.debug("Updating treeViews with new NBDM Project data.")
-        self.update_treeview_team()
+        self.unfilled_treeviews.update(("team", "bldg_components"))
         self.update_treeview_baseline()
         self.update_treeview_proposed()
-        self.update_treeview_bldg_components()
         self.logger.info("Successfully loaded data from file.")
 
-    def load_json_file_as_dict(self, _filepath: pathlib.Path) -> Dict:
-        """Read in a dict from a JSON file."""
+    def load_json_file_as_project(self, _filepath: pathlib.Path) -> project.NBDM_Project:
+        """Read in an NBDM_Project from a JSON file, emitting the progress as it goes."""
         self.logger.info(f"Reading in JSON file: {_filepath}")
 
         try:
             if not os.path.exists(_filepath):
                 self.logger.info(f"Warning: No file named: {_filepath} found?")
-                return {}
+                return project.NBDM_Project()
 
-            with open(_filepath, "r") as read_file:
-                return json.load(read_file)
+            new_project = NBDM_Project_from_json_file(
+                pathlib.Path(_filepath), self._emit_load_progress, _lazy=True
+            )
+
+            # -- The Building Segments are shown as soon as the file is loaded, so build
+            # -- them here, where any error in their data falls back to a new Project.
+            new_project.variants.baseline.building_segments
+            new_project.variants.proposed.building_segments
+            return new_project
 
         except Exception as e:
             self.logger.error(f"Error trying to read in JSON file: {_filepath}")
             self.logger.error(e, exc_info=True)
-            return {}
+            return project.NBDM_Project()
+
+    def _emit_load_progress(self, _fraction: float) -> None:
+        self.sig_load_progress.emit(int(_fraction * 100))
+
+    def load_bldg_components(self) -> None:
+        """Build any of the Project's building components which are not built yet.
+
+        A project file is loaded lazily, so each building component is only built from
+        the file's data when it is first used. A component with an error in its data is
+        logged and removed, so the rest of the Project can still be used.
+        """
+        for group_name in get_deserialization_plan(NBDM_Project).field_types:
+            group = getattr(self.NBDM_project, group_name)
+            for field_name in getattr(group, "__dataclass_fields__", {}):
+                collection = getattr(group, field_name)
+                if isinstance(collection, Collection):
+                    collection.load_all(partial(self._log_component_error, group_name))
+
+    def _log_component_error(self, _group_name: str, _key: str, _e: Exception) -> None:
+        self.logger.error(
+            f"Error reading the '{_group_name}' component '{_key}' from the project "
+            "file. The component has been removed from the Project."
+        )
+        self.logger.error(_e, exc_info=_e)
 
     def write_json_file(self, _filepath: pathlib.Path) -> None:
         self.logger.info(f"Writing out JSON file: {_filepath}")
         self.logger.debug("Call: self.set_project_from_gui()")
         self.set_project_from_gui()
-        self.logger.debug(
-            f"Call: self.write_NBDM_Project_to_json_file(self.NBDM_project, {_filepath})"
-        )
-        NBDM_Project_to_json_file(self.NBDM_project, _filepath)
+
+        # -- The GUI thread keeps changing the Project (ie: when the treeView data is
+        # -- read back in), so the worker thread gets its own copy to write out.
+        self.logger.debug(f"Emit: self.sig_write_json_file(<Project copy>, {_filepath})")
+        self.sig_write_json_file.emit(copy.deepcopy(self.NBDM_project), _filepath)
 
     def set_project_from_gui(self) -> None:
         """Read in all the data in the GUI fields and build a new NBDM project."""
         print("- " * 50)
         self.logger.info("Updating all Project data.")
-        self.sig_read_treeView_team.emit()
-        self.sig_read_treeView_site.emit()
+        # -- Build everything now, on the GUI thread, before the Project is used by any
+        # -- of the worker threads (ie: to save the file, or write the report).
+        self.load_bldg_components()
+        # -- An unfilled treeView still has the old Project's data (if any), and the
+        # -- user can't have edited it, so the Project data is already up to date.
+        if "team" not in self.unfilled_treeviews:
+            self.sig_read_treeView_team.emit()
+            self.sig_read_treeView_site.emit()
         self.sig_read_treeView_proposed_segments.emit()
         self.sig_read_treeView_baseline_segments.emit()
-        self.sig_read_treeView_bldg_components.emit()
+        if "bldg_components" not in self.unfilled_treeviews:
+            self.sig_read_treeView_bldg_components.emit()
 
     # -------------------------------------------------------------------------
     # -- Slots for executing treeView get/set data calls
@@ -481,12 +551,14 @@ class CCModel(qtw.QWidget):
             )
             return
 
-        self.NBDM_project.variants.proposed.clear_variant_building_segments()
-        for segment_data in _data.values():
-            new_segment = NBDM_Object_from_treeView(
+        # -- Only the segments which were edited are replaced, so that the unchanged
+        # -- segments' results (ie: the change from baseline) are not re-calculated.
+        self.NBDM_project.variants.proposed.update_building_segments(
+            NBDM_Object_from_treeView(
                 self.output_format, segment_data, building.NBDM_BuildingSegment
             )
-            self.NBDM_project.add_new_proposed_segment(new_segment)
+            for segment_data in _data.values()
+        )
 
     @qtc.pyqtSlot(dict)
     def set_project_baseline_segments_from_treeView_data(
@@ -500,12 +572,14 @@ class CCModel(qtw.QWidget):
             )
             return
 
-        self.NBDM_project.variants.baseline.clear_variant_building_segments()
-        for segment_data in _data.values():
-            new_segment = NBDM_Object_from_treeView(
+        # -- Only the segments which were edited are replaced, so that the unchanged
+        # -- segments' results (ie: the change from baseline) are not re-calculated.
+        self.NBDM_project.variants.baseline.update_building_segments(
+            NBDM_Object_from_treeView(
                 self.output_format, segment_data, building.NBDM_BuildingSegment
             )
-            self.NBDM_project.add_new_baseline_segment(new_segment)
+            for segment_data in _data.values()
+        )
 
     @qtc.pyqtSlot(dict)
     def set_project_bldg_components_from_treeView_data(
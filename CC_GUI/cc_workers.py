@@ -50,6 +50,8 @@ try:
         create_NBDM_Ventilation_Systems,
     )
     from NBDM.from_WUFI_PDF import (
+        SITE_PDF_SECTIONS,
+        TEAM_PDF_SECTIONS,
         create_NBDM_Appliances_from_WufiPDF,
         create_NBDM_BuildingSegmentFromWufiPDF,
         create_NBDM_Cooling_Systems_from_WufiPDF,
@@ -60,10 +62,11 @@ try:
         create_NBDM_Site_from_WufiPDF,
         create_NBDM_Team_from_WufiPDF,
         create_NBDM_Vent_Systems_from_WufiPDF,
-        pdf_reader,
+        pdf_reader_cache,
     )
     from NBDM.model.project import NBDM_Project
     from NBDM.to_Excel import report
+    from NBDM.to_JSON.write import NBDM_Project_to_json_file
 except Exception as e:
     raise Exception("Error importing NBDM library?", e)
 
@@ -212,8 +215,9 @@ class WorkerReadProjectData(qtc.QObject):
             self.output(
                 f"Reading in Team and Site data from WUFI-PDF file: '{_filepath.name}'"
             )
-            pdf_reader_obj = pdf_reader.PDFReader(self.logger)
-            pdf_data = pdf_reader_obj.extract_pdf_text_from_file(_filepath)
+            pdf_data = pdf_reader_cache.PDF_READER_CACHE.extract_pdf_text_from_file(
+                _filepath, self.logger, {*TEAM_PDF_SECTIONS, *SITE_PDF_SECTIONS}
+            )
         except Exception as e:
             msg = f"Error reading WUFI-PDF file: '{_filepath}'\n{e}"
             print_error(msg, e)
@@ -320,8 +324,9 @@ class _WorkerReadSegmentData(qtc.QObject):
             self.output(
                 f"Reading '{self.segment_typename.value}' Building-Segment from WUFI-PDF file: '{_filepath.name}'"
             )
-            pdf_reader_obj = pdf_reader.PDFReader(self.logger)
-            pdf_data = pdf_reader_obj.extract_pdf_text_from_file(_filepath)
+            pdf_data = pdf_reader_cache.PDF_READER_CACHE.extract_pdf_text_from_file(
+                _filepath, self.logger
+            )
         except Exception as e:
             msg = f"Error reading WUFI-PDF file: '{_filepath}'\n{e}"
             print_error(msg, e)
@@ -448,6 +453,35 @@ class WorkerWriteExcelReport(qtc.QObject):
         self.written.emit(_project)
 
 
+class WorkerWriteJSONFile(qtc.QObject):
+    """Thread Worker for saving the Project to a JSON file, so the GUI does not freeze."""
+
+    written = qtc.pyqtSignal(pathlib.Path)
+    failed = qtc.pyqtSignal(pathlib.Path, str)
+    logger = logging.getLogger()
+
+    @qtc.pyqtSlot(NBDM_Project, pathlib.Path)
+    def run(self, _project: NBDM_Project, _filepath: pathlib.Path) -> None:
+        """Write the Project to the file.
+
+        Note: The Project must be a copy which the GUI thread will not change while
+        it is being written (see: 'CCModel.write_json_file').
+        """
+        self.logger.info(f"Writing out JSON file: {_filepath}")
+
+        try:
+            NBDM_Project_to_json_file(_project, _filepath)
+        except Exception as e:
+            msg = f"Error writing the Project to the JSON file: '{_filepath}'"
+            print_error(msg, e)
+            self.logger.error(e, exc_info=True)
+            self.failed.emit(_filepath, str(e))
+            return
+
+        self.logger.info(f"Done writing JSON file: {_filepath}")
+        self.written.emit(_filepath)
+
+
 class WorkerSetPHPPBaseline(qtc.QObject):
     """Thread Worker for setting the Baseline values in PHPP."""
 
@@ -696,8 +730,9 @@ class WorkerReadBldgComponentData(qtc.QObject):
         # -- Read in the WUFI-PDF file
         try:
             self.output(f"Opening WUFI-PDF file: '{_filepath.name}'")
-            pdf_reader_obj = pdf_reader.PDFReader(self.logger)
-            pdf_data = pdf_reader_obj.extract_pdf_text_from_file(_filepath)
+            pdf_data = pdf_reader_cache.PDF_READER_CACHE.extract_pdf_text_from_file(
+                _filepath, self.logger
+            )
         except Exception as e:
             msg = f"Error reading WUFI-PDF file: '{_filepath}'\n{e}"
             print_error(msg, e)
@@ -7,14 +7,18 @@ import enum
 import json
 from collections import namedtuple
 from types import ModuleType
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, get_type_hints
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from ph_units.unit_type import Unit
 from PyQt6 import QtCore as qtc
 from PyQt6 import QtGui as qtg
 from PyQt6 import QtWidgets as qtw
 
-from NBDM.model.serialization import build_NBDM_obj_from_treeView
+from NBDM.model.performance import MONTHS, NBDM_MonthlySeries
+from NBDM.model.serialization import (
+    build_NBDM_obj_from_treeView,
+    get_deserialization_plan,
+)
 
 treeView_dataItem = namedtuple("treeView_dataItem", ["row_value", "row_unit"])
 
@@ -249,7 +253,7 @@ def replace_key_names(
 
             if isinstance(v, dict):
                 # -- Is an NBDM field, get the type and recurse
-                obj = get_type_hints(_obj)[dict_field_name]
+                obj = get_deserialization_plan(_obj).field_types[dict_field_name]
                 d_[dict_field_name] = replace_key_names(v, _output_format, obj)
             else:
                 # -- Is an valid NBDM object field, add it to the new dict
@@ -260,10 +264,18 @@ def replace_key_names(
 def create_tree_data(_output_format, _obj: Any) -> Dict[str, Any]:
     """Recursively build up a dict of string values for the Project Data TreeView."""
     # Note: cannot use dataclasses.fields() 'cus __future__ annotations
-    # breaks it and all .type comes as str.
+    # breaks it and all .type comes as str. Use the (cached) resolved types instead.
+
+    if isinstance(_obj, NBDM_MonthlySeries):
+        # -- The values are a single array, so show each month as its own Unit row.
+        return {
+            get_formatted_field_name(_output_format, _obj, month): getattr(_obj, month)
+            for month in MONTHS
+        }
 
     d = {}
-    for field_name, field_type in get_type_hints(_obj.__class__).items():
+    field_types = get_deserialization_plan(_obj.__class__).field_types
+    for field_name, field_type in field_types.items():
         # -- Exclude the Variants and Envelope from the Project data view.
         if field_name in ["variants", "envelope"]:
             continue
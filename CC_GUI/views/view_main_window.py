@@ -107,6 +107,34 @@ class CCMainWindow(qtw.QMainWindow):
         data = get_treeView_model_as_dict(_treeview_model) if _treeview_model else {}
         self.sig_got_baseline_building_data.emit(data)
 
+    # -------------------------------------------------------------------------
+    # Status Bar
+
+    @qtc.pyqtSlot(int)
+    def show_load_progress(self, _percent: int) -> None:
+        """Show the progress of loading a project file in the status bar."""
+        if _percent >= 100:
+            self.ui.statusbar.showMessage("Loading project file: done.", 3_000)
+        else:
+            self.ui.statusbar.showMessage(f"Loading project file: {_percent}%")
+        # -- Loading runs on the GUI thread, so paint the change right away.
+        self.ui.statusbar.repaint()
+
+    @qtc.pyqtSlot(pathlib.Path)
+    def show_file_saved(self, _filepath: pathlib.Path) -> None:
+        """Show that the project file was saved in the status bar."""
+        self.ui.statusbar.showMessage(f"Saved project file: {_filepath}", 5_000)
+
+    @qtc.pyqtSlot(pathlib.Path, str)
+    def show_file_save_failed(self, _filepath: pathlib.Path, _error: str) -> None:
+        """Show a warning that the project file could not be saved."""
+        self.ui.statusbar.showMessage(f"Error saving project file: {_filepath}")
+        qtw.QMessageBox.warning(
+            self,
+            "Error Saving Project",
+            f"The project could not be saved to the file:\n\n{_filepath}\n\n{_error}",
+        )
+
     # -------------------------------------------------------------------------
     # treView Setters
 
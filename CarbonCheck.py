@@ -3,6 +3,7 @@
 """Run to see GUI."""
 
 import logging
+import multiprocessing
 import sys
 
 try:
@@ -21,6 +22,9 @@ except Exception as e:
     raise Exception("Error importing App library?", e)
 
 if __name__ == "__main__":
+    # -- Required for the WUFI-PDF reader's process-pool to work in the frozen app.
+    multiprocessing.freeze_support()
+
     # -- When using cx_Freeze to create the .exe file, it will set
     # -- stdout to 'None' which causes all sorts of trouble. So wrap
     # -- the execution here in a file object to redirect the stdout
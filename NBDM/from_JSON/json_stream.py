@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Read a JSON document from a file one piece at a time, instead of all at once."""
+
+import codecs
+import json
+import os
+import re
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Tuple
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_CHARS = re.compile(r"[0-9eE.+-]*")
+
+
+class JSONStreamReader:
+    """Read a JSON document from a (binary) file, one value at a time.
+
+    Only the text which has not been read yet is kept in memory. Objects can be walked
+    key by key (see: 'iter_object'), and any value can be read in full as a Python
+    object (see: 'read_value'), so large documents can be turned into objects one
+    part at a time.
+
+    Arguments:
+    ----------
+        * _file: (BinaryIO) The open (binary mode) file to read from.
+        * _progress: (Optional[Callable[[float], None]]) Called with the fraction
+            (0.0 to 1.0) of the file read so far, each time more is read.
+        * _chunk_size: (int) The number of bytes to read from the file at a time.
+    """
+
+    def __init__(
+        self,
+        _file: BinaryIO,
+        _progress: Optional[Callable[[float], None]] = None,
+        _chunk_size: int = 65_536,
+    ) -> None:
+        self.file = _file
+        self.progress = _progress
+        self.chunk_size = _chunk_size
+        self.total_bytes = os.fstat(_file.fileno()).st_size
+        self.bytes_read = 0
+
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+
+    def _fill(self, _min_chars: int = 1) -> bool:
+        """Read at least '_min_chars' more text into the buffer. Return False at the end."""
+        if self.eof:
+            return False
+
+        # -- Drop the text which has already been read
+        self.buffer = self.buffer[self.pos :]
+        self.pos = 0
+
+        target_length = len(self.buffer) + _min_chars
+        while len(self.buffer) < target_length:
+            chunk = self.file.read(self.chunk_size)
+            self.bytes_read += len(chunk)
+            self.buffer += self._text_decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                self.eof = True
+                break
+
+        if self.progress:
+            self.progress(self.bytes_read / self.total_bytes if self.total_bytes else 1.0)
+        return True
+
+    def _error(self, _msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(_msg, self.buffer, self.pos)
+
+    def _peek(self) -> str:
+        """Skip over any whitespace and return the next character (without reading it)."""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise self._error("Unexpected end of the JSON document")
+
+    def _expect(self, _char: str) -> None:
+        if self._peek() != _char:
+            raise self._error(f"Expecting '{_char}'")
+        self.pos += 1
+
+    def _decode(self) -> Tuple[Any, int]:
+        """Decode the next value, returning it along with the position of its end.
+
+        The position is left at the start of the value.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # -- Most likely the value is not all in the buffer yet
+                if not self._fill(max(len(self.buffer) - self.pos, self.chunk_size)):
+                    raise
+                continue
+
+            # -- A number at the end of the buffer might continue in the next chunk
+            # -- (ie: '1e' is read as '1' until the rest of '1e3' is in the buffer)
+            if NUMBER_CHARS.match(self.buffer, end).end() == len(self.buffer):
+                if self._fill():
+                    continue
+
+            return value, end
+
+    def read_value(self) -> Any:
+        """Read the next value (of any type) in full, and return it as a Python object."""
+        value, self.pos = self._decode()
+        return value
+
+    def read_raw_value(self) -> str:
+        """Read the next value (of any type) in full, and return its JSON text.
+
+        The text can be decoded later on (ie: with 'json.loads') if it is needed.
+        """
+        _, end = self._decode()
+        text = self.buffer[self.pos : end]
+        self.pos = end
+        return text
+
+    def iter_object(self) -> Iterator[str]:
+        """Walk over the next JSON object, yielding each key in turn.
+
+        The key's value must be read (ie: with 'read_value', or a nested 'iter_object')
+        before moving on to the next key.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name enclosed in double quotes")
+            self._expect(":")
+            yield key
+
+            next_char = self._peek()
+            self.pos += 1
+            if next_char == "}":
+                return
+            elif next_char != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def check_end(self) -> None:
+        """Raise an error if there is anything other than whitespace left in the file."""
+        try:
+            self._peek()
+        except json.JSONDecodeError:
+            return
+        raise self._error("Extra data")
@@ -5,13 +5,150 @@
 
 import json
 import pathlib
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Type
 
-from NBDM.model.project import NBDM_Project
+from NBDM.from_JSON.json_stream import JSONStreamReader
+from NBDM.model import enums
+from NBDM.model.building import NBDM_Building, NBDM_BuildingSegment
+from NBDM.model.collections import Collection, LazyDict
+from NBDM.model.project import NBDM_Project, NBDM_Variant, NBDM_Variants
+from NBDM.model.serialization import FromDictException, get_deserialization_plan
 
+# -- Classes whose from_dict is the default 'build_NBDM_obj_from_dict', so their
+# -- fields can be read one by one from the stream.
+_STREAMED_CLASSES = (NBDM_Project, NBDM_Variants, NBDM_Variant)
 
-def NBDM_Project_from_json_file(_json_file: pathlib.Path) -> NBDM_Project:
-    # -- Load the file contents as a python dict
-    with _json_file.open() as f:
-        d = json.load(f)
 
-    return NBDM_Project.from_dict(d)
+def _is_collection_type(_field_type: Any) -> bool:
+    return getattr(_field_type, "__origin__", None) is Collection
+
+
+def _has_collections(_cls: Type) -> bool:
+    """Return True if the class is a group of Collections (ie: NBDM_BuildingSegmentEnvelope)."""
+    field_types = get_deserialization_plan(_cls).field_types.values()
+    return bool(field_types) and all(_is_collection_type(t) for t in field_types)
+
+
+def _from_json_text(_cls: Type, _text: str) -> Any:
+    """Build the NBDM Object from the JSON text of its dict."""
+    return _cls.from_dict(json.loads(_text))
+
+
+def _read_collections(_reader: JSONStreamReader, _cls: Type, _lazy: bool) -> Any:
+    """Build an object with Collection fields, adding each item as soon as it is read."""
+    obj = _cls()
+    field_types = get_deserialization_plan(_cls).field_types
+    for key in _reader.iter_object():
+        if key not in field_types:
+            _reader.read_value()
+            continue
+
+        collection = getattr(obj, key)
+        item_type = field_types[key].__args__[0]
+        for item_key in _reader.iter_object():
+            if _lazy:
+                loader = partial(_from_json_text, item_type, _reader.read_raw_value())
+                collection.add_lazy_item(item_key, loader)
+            else:
+                collection.add_item(item_type.from_dict(_reader.read_value()))
+    return obj
+
+
+def _read_building(_reader: JSONStreamReader, _lazy: bool) -> NBDM_Building:
+    """Build the NBDM_Building, adding each Building Segment as soon as it is read."""
+    d: Dict[str, Any] = {}
+    segments = []
+    lazy_segments = LazyDict()
+    for key in _reader.iter_object():
+        if key != "_building_segments":
+            d[key] = _reader.read_value()
+            continue
+
+        d[key] = None
+        for segment_name in _reader.iter_object():
+            if _lazy:
+                loader = partial(
+                    _from_json_text, NBDM_BuildingSegment, _reader.read_raw_value()
+                )
+                lazy_segments.set_loader(segment_name, loader)
+            else:
+                segments.append(NBDM_BuildingSegment.from_dict(_reader.read_value()))
+
+    # -- Same as NBDM_Building.from_dict
+    field_names = NBDM_Building.__dataclass_fields__.keys()
+    assert field_names == d.keys(), "Error: Key mismatch: {} <--> {}".format(
+        field_names, d.keys()
+    )
+
+    obj = NBDM_Building(
+        building_name=d["building_name"],
+        building_type=enums.building_type(d["building_type"]),
+        _building_segments=lazy_segments if _lazy else {},
+    )
+    for segment in segments:
+        obj.add_building_segment(segment)
+    return obj
+
+
+def _read_NBDM_obj(_reader: JSONStreamReader, _cls: Type, _lazy: bool) -> Any:
+    """Same as 'build_NBDM_obj_from_dict', but reading each field from the stream."""
+    plan = get_deserialization_plan(_cls)
+    fields = {f.name: f for f in plan.fields}
+
+    d = {}
+    for key in _reader.iter_object():
+        field = fields.get(key)
+        if not field:
+            _reader.read_value()
+        elif field.type in _STREAMED_CLASSES:
+            d[key] = _read_NBDM_obj(_reader, field.type, _lazy)
+        elif field.type is NBDM_Building:
+            d[key] = _read_building(_reader, _lazy)
+        elif _has_collections(field.type):
+            d[key] = _read_collections(_reader, field.type, _lazy)
+        else:
+            d[key] = field.from_dict(_reader.read_value())
+
+    for field in plan.fields:
+        if field.name not in d and field.required:
+            raise FromDictException(_cls.__name__, field.name, d.keys())
+
+    return _cls(**d)
+
+
+def NBDM_Project_from_json_file(
+    _json_file: pathlib.Path,
+    _progress: Optional[Callable[[float], None]] = None,
+    _lazy: bool = False,
+) -> NBDM_Project:
+    """Build an NBDM_Project from a .JSON file.
+
+    The file is read a piece at a time, and each Building Segment and building
+    component is built as soon as its data is read, so the whole file (and the
+    whole dict) is never held in memory at once.
+
+    If '_lazy' is True, each Building Segment and building component (assembly,
+    glazing, appliance, device...) is instead kept as its JSON text, and is only
+    built the first time it is used (see: 'LazyDict'). The Project can be used
+    exactly as normal, but opening a large file is much faster. Note that any error
+    in a part's data is then only raised when that part is built.
+
+    Arguments:
+    ----------
+        * _json_file: (pathlib.Path) The .JSON file to read.
+        * _progress: (Optional[Callable[[float], None]]) Called with the fraction
+            (0.0 to 1.0) of the file read so far. ie: to update a progress bar.
+        * _lazy: (bool) Default=False. Build the Building Segments and building
+            components only when they are first used.
+
+    Returns:
+    --------
+        * (NBDM_Project) The new NBDM_Project.
+    """
+    with _json_file.open("rb") as f:
+        reader = JSONStreamReader(f, _progress)
+        project = _read_NBDM_obj(reader, NBDM_Project, _lazy)
+        reader.check_end()
+
+    return project
@@ -61,8 +61,8 @@ from NBDM.from_WUFI_PDF.pdf_sections.zones_and_components import (
 from NBDM.from_WUFI_PDF.renewable_systems import (
     create_NBDM_Renewable_Systems_from_WufiPDF,
 )
-from NBDM.from_WUFI_PDF.site import create_NBDM_Site_from_WufiPDF
-from NBDM.from_WUFI_PDF.team import create_NBDM_Team_from_WufiPDF
+from NBDM.from_WUFI_PDF.site import SITE_PDF_SECTIONS, create_NBDM_Site_from_WufiPDF
+from NBDM.from_WUFI_PDF.team import TEAM_PDF_SECTIONS, create_NBDM_Team_from_WufiPDF
 from NBDM.from_WUFI_PDF.ventilation_systems import create_NBDM_Vent_Systems_from_WufiPDF
 
 # -- Register each of the PDF sections with the PDF Reader class
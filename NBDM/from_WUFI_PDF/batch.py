@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Build NBDM Projects from many baseline/proposed WUFI-PDF pairs, without the GUI.
+
+Each project is built from a pair of WUFI-PDF files:
+    * Team, Site and the Baseline Building-Segment from the baseline PDF.
+    * The Proposed Building-Segment and all the Building Components from the proposed PDF.
+
+The projects are built in parallel (one per process) and each is written out
+to its own NBDM .JSON file.
+
+Usage:
+    python -m NBDM.from_WUFI_PDF.batch SOURCE [options]
+
+    SOURCE               A folder of '*_baseline.pdf' / '*_proposed.pdf' file pairs, or a
+                         .JSON manifest file: [{"name": ..., "baseline": ..., "proposed": ...}]
+    --output-dir DIR     Write the project .JSON files here. Default=the SOURCE folder.
+    --max-workers N      The number of projects to build at once. Default=all CPUs.
+    --summary FILE       Also write the timings and any failures to this .JSON file.
+    --no-store           Do not save (or re-use) the raw page data in the extraction-store.
+"""
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from NBDM.from_WUFI_PDF.appliances import create_NBDM_Appliances_from_WufiPDF
+from NBDM.from_WUFI_PDF.bldg_segment import create_NBDM_BuildingSegmentFromWufiPDF
+from NBDM.from_WUFI_PDF.cooling_systems import create_NBDM_Cooling_Systems_from_WufiPDF
+from NBDM.from_WUFI_PDF.dhw_systems import create_NBDM_DHW_Systems_from_WufiPDF
+from NBDM.from_WUFI_PDF.envelope import create_NBDM_Envelope_from_WufiPDF
+from NBDM.from_WUFI_PDF.heating_systems import create_NBDM_Heating_Systems_from_WufiPDF
+from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore
+from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+from NBDM.from_WUFI_PDF.pdf_reader_sections import PDFSectionsCollection
+from NBDM.from_WUFI_PDF.renewable_systems import (
+    create_NBDM_Renewable_Systems_from_WufiPDF,
+)
+from NBDM.from_WUFI_PDF.site import create_NBDM_Site_from_WufiPDF
+from NBDM.from_WUFI_PDF.team import create_NBDM_Team_from_WufiPDF
+from NBDM.from_WUFI_PDF.ventilation_systems import create_NBDM_Vent_Systems_from_WufiPDF
+from NBDM.model.project import NBDM_Project
+from NBDM.to_JSON.write import NBDM_Project_to_json_file
+
+BASELINE_SUFFIX = "_baseline"
+PROPOSED_SUFFIX = "_proposed"
+
+
+@dataclass
+class BatchJob:
+    """A single project to build from a pair of WUFI-PDF files."""
+
+    name: str
+    baseline: pathlib.Path
+    proposed: pathlib.Path
+    output: pathlib.Path
+
+
+@dataclass
+class BatchResult:
+    """The outcome of a single BatchJob."""
+
+    name: str
+    output: Optional[str] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def find_pdf_pairs(
+    _source_dir: pathlib.Path, _output_dir: Optional[pathlib.Path] = None
+) -> Tuple[List[BatchJob], List[BatchResult]]:
+    """Return a BatchJob for each baseline/proposed pair of PDF files in the folder.
+
+    Any baseline (or proposed) PDF without a matching partner is returned as a failure.
+    """
+    output_dir = _output_dir or _source_dir
+    pdfs: Dict[str, Dict[str, pathlib.Path]] = {}
+    for filepath in sorted(_source_dir.glob("*.pdf")):
+        for suffix in (BASELINE_SUFFIX, PROPOSED_SUFFIX):
+            if filepath.stem.lower().endswith(suffix):
+                name = filepath.stem[: -len(suffix)]
+                pdfs.setdefault(name, {})[suffix] = filepath
+
+    jobs, failures = [], []
+    for name, pair in pdfs.items():
+        if BASELINE_SUFFIX in pair and PROPOSED_SUFFIX in pair:
+            jobs.append(
+                BatchJob(
+                    name,
+                    pair[BASELINE_SUFFIX],
+                    pair[PROPOSED_SUFFIX],
+                    output_dir / f"{name}.json",
+                )
+            )
+        else:
+            missing = PROPOSED_SUFFIX if BASELINE_SUFFIX in pair else BASELINE_SUFFIX
+            failures.append(
+                BatchResult(name, error=f"No '{name}{missing}.pdf' file was found.")
+            )
+    return jobs, failures
+
+
+def load_manifest(
+    _manifest: pathlib.Path, _output_dir: Optional[pathlib.Path] = None
+) -> List[BatchJob]:
+    """Return the BatchJobs listed in a .JSON manifest file.
+
+    Relative file paths are relative to the manifest file's folder.
+    """
+    base_dir = _manifest.parent
+    output_dir = _output_dir or base_dir
+    jobs = []
+    for item in json.loads(_manifest.read_text()):
+        try:
+            name = item["name"]
+            output = base_dir / item["output"] if "output" in item else None
+            jobs.append(
+                BatchJob(
+                    name,
+                    base_dir / item["baseline"],
+                    base_dir / item["proposed"],
+                    output or output_dir / f"{name}.json",
+                )
+            )
+        except KeyError as e:
+            raise ValueError(
+                f"Error: The manifest item {item} is missing the key: {e}."
+            ) from e
+    return jobs
+
+
+def build_project(
+    _baseline: PDFSectionsCollection, _proposed: PDFSectionsCollection, _name: str
+) -> NBDM_Project:
+    """Return a new NBDM_Project built from the baseline and proposed WUFI-PDF data.
+
+    Both Building-Segments are given the project's name, since the Baseline and
+    Proposed segment names must match.
+    """
+    project = NBDM_Project()
+    project.project_name = _name
+    project.team = create_NBDM_Team_from_WufiPDF(_baseline)
+    project.site = create_NBDM_Site_from_WufiPDF(_baseline)
+
+    baseline_segment = create_NBDM_BuildingSegmentFromWufiPDF(_baseline)
+    baseline_segment.segment_name = _name
+    project.add_new_baseline_segment(baseline_segment)
+    proposed_segment = create_NBDM_BuildingSegmentFromWufiPDF(_proposed)
+    proposed_segment.segment_name = _name
+    project.add_new_proposed_segment(proposed_segment)
+
+    project.envelope = create_NBDM_Envelope_from_WufiPDF(_proposed)
+    project.appliances = create_NBDM_Appliances_from_WufiPDF(_proposed)
+    project.heating_systems = create_NBDM_Heating_Systems_from_WufiPDF(_proposed)
+    project.cooling_systems = create_NBDM_Cooling_Systems_from_WufiPDF(_proposed)
+    project.ventilation_systems = create_NBDM_Vent_Systems_from_WufiPDF(_proposed)
+    project.dhw_systems = create_NBDM_DHW_Systems_from_WufiPDF(_proposed)
+    project.renewable_systems = create_NBDM_Renewable_Systems_from_WufiPDF(_proposed)
+    return project
+
+
+def read_pdf_file(
+    _filepath: pathlib.Path, _logger: logging.Logger, _store: Optional[PDFExtractionStore]
+) -> PDFSectionsCollection:
+    """Read in all the PDF-Sections from a WUFI-PDF file.
+
+    The sections are streamed in, so each one's raw text is freed as soon as it is
+    processed, rather than holding the raw text of every page until the end. Several
+    projects are built at once, so this keeps the peak memory of each worker down.
+    """
+    reader = PDFReader(_logger, _extraction_store=_store)
+    for pdf_section in reader.iter_pdf_sections(_filepath):
+        _logger.info(
+            f"Done reading the PDF Section: {pdf_section.__pdf_heading_string__}"
+        )
+    return reader.pdf_sections
+
+
+def run_job(_job: BatchJob, _use_store: bool = True) -> BatchResult:
+    """Build and write out a single project. Any error is returned in the result, not raised."""
+    result = BatchResult(_job.name)
+    logger = logging.getLogger(f"CarbonCheck.batch.{_job.name}")
+    store = PDFExtractionStore() if _use_store else None
+    start = time.perf_counter()
+    try:
+        pdf_data = {}
+        for variant, filepath in (
+            ("baseline", _job.baseline),
+            ("proposed", _job.proposed),
+        ):
+            t0 = time.perf_counter()
+            pdf_data[variant] = read_pdf_file(filepath, logger, store)
+            result.timings[f"read_{variant}"] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        project = build_project(pdf_data["baseline"], pdf_data["proposed"], _job.name)
+        result.timings["build"] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        _job.output.parent.mkdir(parents=True, exist_ok=True)
+        NBDM_Project_to_json_file(project, _job.output)
+        result.timings["write"] = time.perf_counter() - t0
+        result.output = str(_job.output)
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        result.error = "".join(traceback.format_exception_only(type(e), e)).strip()
+    result.timings["total"] = time.perf_counter() - start
+    return result
+
+
+def run_jobs(
+    _jobs: Sequence[BatchJob], _max_workers: Optional[int] = None, _use_store: bool = True
+) -> List[BatchResult]:
+    """Run all of the jobs, in a process-pool if there is more than one worker."""
+    max_workers = min(_max_workers or os.cpu_count() or 1, len(_jobs) or 1)
+    if max_workers == 1:
+        return [run_job(job, _use_store) for job in _jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_job, _jobs, [_use_store] * len(_jobs)))
+
+
+def print_summary(_results: Sequence[BatchResult], _wall_time: float) -> None:
+    print(f"\n{'Project':<32} {'Status':<8} {'Read (s)':>10} {'Total (s)':>10}")
+    for r in _results:
+        read_time = r.timings.get("read_baseline", 0.0) + r.timings.get(
+            "read_proposed", 0.0
+        )
+        status = "OK" if r.ok else "FAILED"
+        print(
+            f"{r.name:<32} {status:<8} {read_time:>10.2f} {r.timings.get('total', 0.0):>10.2f}"
+        )
+    for r in _results:
+        if not r.ok:
+            print(f"\nFAILED: {r.name}\n    {r.error}")
+    num_ok = sum(r.ok for r in _results)
+    print(
+        f"\n{num_ok} of {len(_results)} projects built in {_wall_time:.1f}s "
+        f"({len(_results) - num_ok} failed)."
+    )
+
+
+def main(_argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=pathlib.Path)
+    parser.add_argument("--output-dir", type=pathlib.Path, default=None)
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--summary", type=pathlib.Path, default=None)
+    parser.add_argument("--no-store", action="store_true")
+    args = parser.parse_args(_argv)
+
+    if args.source.is_dir():
+        jobs, results = find_pdf_pairs(args.source, args.output_dir)
+    else:
+        jobs, results = load_manifest(args.source, args.output_dir), []
+    if not jobs and not results:
+        print(f"Error: No WUFI-PDF file pairs found in: '{args.source}'")
+        return 1
+
+    start = time.perf_counter()
+    results.extend(run_jobs(jobs, args.max_workers, not args.no_store))
+    wall_time = time.perf_counter() - start
+    print_summary(results, wall_time)
+
+    if args.summary:
+        args.summary.write_text(
+            json.dumps(
+                {"wall_time": wall_time, "results": [asdict(r) for r in results]},
+                indent=4,
+            )
+        )
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
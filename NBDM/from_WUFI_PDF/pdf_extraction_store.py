@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Persistent on-disk store of the raw text and tables extracted from WUFI-PDF files.
+
+Extracting the text from a large WUFI-PDF with pdfplumber is slow, while running the
+section parsers over that text is fast. The raw per-page output is saved here so that
+re-opening the same PDF (or re-running the parsers after a fix) can skip pdfplumber.
+
+File Layout (all integers little-endian):
+-----------------------------------------
+    * Header:           magic (8s), format-version (H), page-count (I),
+                        meta-offset (Q), meta-length (Q)
+    * Page Records:     one per page: lines-offset (Q), lines-length (I),
+                        tables-offset (Q), tables-length (I)
+    * Page Data:        the UTF-8 text lines ('\\n' separated), and the page
+                        tables as JSON: one list of tables for each part of the
+                        page (split at the section headings), or null for any
+                        part whose tables were not extracted. A tables-length
+                        of 0 means no tables were extracted for that page.
+    * Meta:             JSON with the source file name and hash, the headings that
+                        were looked for, and the section boundaries:
+                        [page-index, line-index, heading-string]
+
+The fixed-size page records allow any page to be read directly from a memory-map
+of the file without loading or decoding the rest of it.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import struct
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from NBDM.from_WUFI_PDF.pdf_section_index import PDFSectionIndex
+
+# -- Increment whenever the file layout, or the way the text is extracted, changes.
+STORE_FORMAT_VERSION = 3
+STORE_MAGIC = b"CCPDFX\x00\x00"
+STORE_FILE_SUFFIX = ".ccpdf"
+INDEX_FILE_SUFFIX = ".index.json"
+
+HEADER = struct.Struct("<8sHIQQ")
+PAGE_RECORD = struct.Struct("<QIQI")
+
+# -- A table, as returned by pdfplumber: rows of cells
+PDFTable = List[List[Optional[str]]]
+
+# -- The tables for each part of a page (split at the section headings), or None if not extracted
+PDFPageTables = List[Optional[List[PDFTable]]]
+
+# -- (page-index, line-index, heading-string)
+SectionBoundary = Tuple[int, int, str]
+
+
+class PDFPageData(NamedTuple):
+    """The raw data extracted from a single PDF page."""
+
+    lines: List[str]
+    tables: Optional[PDFPageTables] = None
+
+
+def get_file_hash(_filepath: pathlib.Path, _chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex-digest of the file's contents."""
+    file_hash = hashlib.sha256()
+    with open(_filepath, "rb") as f:
+        while chunk := f.read(_chunk_size):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def default_store_dir() -> pathlib.Path:
+    """Return the user's (OS-specific) cache directory for CarbonCheck."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", pathlib.Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
+    return pathlib.Path(base) / "CarbonCheck" / "pdf_extraction"
+
+
+def find_section_boundaries(
+    _pages: Iterable[PDFPageData], _heading_strings: Iterable[str]
+) -> List[SectionBoundary]:
+    """Return the location of every section heading found in the page lines."""
+    headings = set(_heading_strings)
+    return [
+        (page_index, line_index, line)
+        for page_index, page in enumerate(_pages)
+        for line_index, line in enumerate(page.lines)
+        if line in headings
+    ]
+
+
+class PDFExtractionFile:
+    """A read-only, memory-mapped, view of a single stored PDF extraction file."""
+
+    def __init__(self, _path: pathlib.Path) -> None:
+        self.path = _path
+        with open(_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, num_pages, meta_offset, meta_length = HEADER.unpack_from(
+                self._mmap, 0
+            )
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"Error: '{_path}' is not a valid PDF extraction file.", e)
+
+        if magic != STORE_MAGIC or version != STORE_FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"Error: '{_path}' is not a valid version-{STORE_FORMAT_VERSION} "
+                "PDF extraction file."
+            )
+
+        self.num_pages: int = num_pages
+        try:
+            self.meta: Dict[str, Any] = json.loads(
+                self._mmap[meta_offset : meta_offset + meta_length]
+            )
+        except ValueError as e:
+            self.close()
+            raise ValueError(f"Error: '{_path}' has invalid meta data.", e)
+
+    @property
+    def source_file_hash(self) -> str:
+        return self.meta["source_file_hash"]
+
+    @property
+    def section_boundaries(self) -> List[SectionBoundary]:
+        return [tuple(_) for _ in self.meta["section_boundaries"]]  # type: ignore
+
+    def _page_record(self, _page_index: int) -> Tuple[int, int, int, int]:
+        if not 0 <= _page_index < self.num_pages:
+            raise IndexError(f"Error: No page number {_page_index} in '{self.path}'?")
+        return PAGE_RECORD.unpack_from(
+            self._mmap, HEADER.size + _page_index * PAGE_RECORD.size
+        )
+
+    def page_lines(self, _page_index: int) -> List[str]:
+        """Return the text lines for the page."""
+        lines_offset, lines_length, _, _ = self._page_record(_page_index)
+        return self._mmap[lines_offset : lines_offset + lines_length].decode().split("\n")
+
+    def page_tables(self, _page_index: int) -> Optional[PDFPageTables]:
+        """Return the tables for the page, or None if they were not extracted."""
+        _, _, tables_offset, tables_length = self._page_record(_page_index)
+        if not tables_length:
+            return None
+        return json.loads(self._mmap[tables_offset : tables_offset + tables_length])
+
+    def page(self, _page_index: int) -> PDFPageData:
+        return PDFPageData(self.page_lines(_page_index), self.page_tables(_page_index))
+
+    def __iter__(self):
+        return (self.page(i) for i in range(self.num_pages))
+
+    def __len__(self) -> int:
+        return self.num_pages
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "PDFExtractionFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def replace_file(_path: pathlib.Path, _blobs: Iterable[bytes]) -> None:
+    """Write the data to a new temp file, then move it into place at the path.
+
+    A half-written file is never read. Each writer gets its own (uniquely named) temp
+    file, so two writers of the same file (ie: two GUI workers reading the same PDF)
+    don't clash: the file is just replaced by whichever finishes last.
+    """
+    _path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=_path.parent, prefix=f"{_path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        temp_path = f.name
+        try:
+            f.writelines(_blobs)
+        except BaseException:
+            f.close()
+            os.unlink(temp_path)
+            raise
+
+    try:
+        os.replace(temp_path, _path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def write_extraction_file(
+    _path: pathlib.Path,
+    _pages: List[PDFPageData],
+    _meta: Dict[str, Any],
+) -> None:
+    """Write the page data out to a new PDF extraction file."""
+    blobs: List[bytes] = []
+    records: List[bytes] = []
+    offset = HEADER.size + PAGE_RECORD.size * len(_pages)
+
+    for page in _pages:
+        lines_blob = "\n".join(page.lines).encode()
+        tables_blob = b"" if page.tables is None else json.dumps(page.tables).encode()
+        records.append(
+            PAGE_RECORD.pack(
+                offset,
+                len(lines_blob),
+                offset + len(lines_blob),
+                len(tables_blob),
+            )
+        )
+        blobs.extend((lines_blob, tables_blob))
+        offset += len(lines_blob) + len(tables_blob)
+
+    meta_blob = json.dumps(_meta).encode()
+    header = HEADER.pack(
+        STORE_MAGIC, STORE_FORMAT_VERSION, len(_pages), offset, len(meta_blob)
+    )
+
+    replace_file(_path, (header, *records, *blobs, meta_blob))
+
+
+class PDFExtractionStore:
+    """A directory of stored PDF extraction files, one per PDF file (keyed by file-hash)."""
+
+    def __init__(
+        self, _store_dir: Optional[pathlib.Path] = None, _next_to_source: bool = False
+    ) -> None:
+        """
+        Arguments:
+        ----------
+            * _store_dir: (Optional[pathlib.Path]) The directory to save the files to.
+                Default is the user's cache directory.
+            * _next_to_source: (bool) Set True to save the file next to the source PDF
+                instead (ie: "my_file.pdf" -> "my_file.pdf.ccpdf").
+        """
+        self.store_dir = _store_dir or default_store_dir()
+        self.next_to_source = _next_to_source
+
+    def store_path(
+        self, _filepath: pathlib.Path, _file_hash: str, _suffix: str = STORE_FILE_SUFFIX
+    ) -> pathlib.Path:
+        """Return the path of the extraction file for the source PDF file."""
+        if self.next_to_source:
+            return _filepath.with_name(f"{_filepath.name}{_suffix}")
+        return self.store_dir / f"{_file_hash}{_suffix}"
+
+    def open(
+        self,
+        _filepath: pathlib.Path,
+        _headings: Optional[Iterable[str]] = None,
+        _file_hash: Optional[str] = None,
+    ) -> Optional[PDFExtractionFile]:
+        """Return the stored extraction for the source PDF, or None if not found or out of date.
+
+        If headings are supplied, the extraction is only valid if it was saved looking
+        for the same set of headings (the stored tables are split up at the headings).
+        The file-hash is computed if not supplied.
+        """
+        file_hash = _file_hash or get_file_hash(_filepath)
+        store_path = self.store_path(_filepath, file_hash)
+        if not store_path.exists():
+            return None
+
+        try:
+            extraction_file = PDFExtractionFile(store_path)
+        except (OSError, ValueError):
+            return None
+
+        if extraction_file.source_file_hash != file_hash or (
+            _headings is not None
+            and extraction_file.meta.get("headings") != sorted(_headings)
+        ):
+            extraction_file.close()
+            return None
+
+        return extraction_file
+
+    def save(
+        self,
+        _filepath: pathlib.Path,
+        _pages: List[PDFPageData],
+        _heading_strings: Iterable[str],
+        _file_hash: Optional[str] = None,
+    ) -> pathlib.Path:
+        """Save the page data for the source PDF file and return the path it was saved to."""
+        file_hash = _file_hash or get_file_hash(_filepath)
+        store_path = self.store_path(_filepath, file_hash)
+        meta = {
+            "source_file_name": _filepath.name,
+            "source_file_hash": file_hash,
+            "headings": sorted(_heading_strings),
+            "section_boundaries": find_section_boundaries(_pages, _heading_strings),
+        }
+        write_extraction_file(store_path, _pages, meta)
+        return store_path
+
+    def open_section_index(
+        self,
+        _filepath: pathlib.Path,
+        _headings: Iterable[str],
+        _file_hash: Optional[str] = None,
+    ) -> Optional[PDFSectionIndex]:
+        """Return the stored section-index for the source PDF, or None if not found or out of date.
+
+        The index is only valid if it was built looking for the same set of headings.
+        """
+        file_hash = _file_hash or get_file_hash(_filepath)
+        index_path = self.store_path(_filepath, file_hash, INDEX_FILE_SUFFIX)
+        try:
+            d = json.loads(index_path.read_text())
+            if d["source_file_hash"] != file_hash or d["headings"] != sorted(_headings):
+                return None
+            return PDFSectionIndex.from_dict(d)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save_section_index(
+        self,
+        _filepath: pathlib.Path,
+        _section_index: PDFSectionIndex,
+        _headings: Iterable[str],
+        _file_hash: Optional[str] = None,
+    ) -> pathlib.Path:
+        """Save the section-index for the source PDF file and return the path it was saved to."""
+        file_hash = _file_hash or get_file_hash(_filepath)
+        index_path = self.store_path(_filepath, file_hash, INDEX_FILE_SUFFIX)
+        d = _section_index.to_dict()
+        d["source_file_hash"] = file_hash
+        d["headings"] = sorted(_headings)
+
+        replace_file(index_path, (json.dumps(d).encode(),))
+        return index_path
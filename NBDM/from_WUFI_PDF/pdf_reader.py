@@ -3,28 +3,163 @@
 
 """PDFReader class for loading and reading WUFI-PDF files."""
 
+import multiprocessing
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from logging import Logger
-from typing import Dict, Optional, Type, TypeVar
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar
 
 import pdfplumber
+from pdfplumber.page import Page
 
-from NBDM.from_WUFI_PDF.pdf_reader_sections import PDFSectionsCollection
+from NBDM.from_WUFI_PDF.pdf_extraction_store import (
+    PDFExtractionFile,
+    PDFExtractionStore,
+    PDFPageData,
+    PDFPageTables,
+    PDFTable,
+    get_file_hash,
+)
+from NBDM.from_WUFI_PDF.pdf_reader_sections import (
+    PDFSectionsCollection,
+    release_raw_data,
+)
+from NBDM.from_WUFI_PDF.pdf_section_index import PDFSectionIndex, scan_pdf_headings
 from NBDM.from_WUFI_PDF.pdf_sections.__typing import SupportsWufiPDF_Section
 from NBDM.from_WUFI_PDF.pdf_sections._default import _WufiPDF_DefaultSection
 
 T = TypeVar("T", bound=SupportsWufiPDF_Section)
+T_Item = TypeVar("T_Item")
+
+
+def extract_page_lines(_page: Page) -> List[str]:
+    """Return a list of all the lines of text found on the PDF page."""
+    text = _page.extract_text(
+        x_tolerance=3,
+        y_tolerance=3,
+        layout=False,
+        x_density=7.25,
+        y_density=13,
+    )
+    return text.split("\n")
+
+
+def _extract_pages_lines(
+    _filepath: pathlib.Path, _page_numbers: List[int]
+) -> List[List[str]]:
+    """Return the lines of text for each of the pages. Run in a worker process."""
+    with pdfplumber.open(_filepath) as pdf:
+        return [extract_page_lines(pdf.pages[i]) for i in _page_numbers]
+
+
+def find_heading_tops(_page: Page, _headings: List[str]) -> Optional[List[float]]:
+    """Return the 'top' of each of the heading lines on the page, or None if any are not found.
+
+    The headings must be given in the order they appear on the page.
+    """
+    tops: List[float] = []
+    for line in _page.extract_text_lines(
+        x_tolerance=3, y_tolerance=3, return_chars=False
+    ):
+        if len(tops) == len(_headings):
+            break
+        if line["text"] == _headings[len(tops)]:
+            tops.append(line["top"])
+    return tops if len(tops) == len(_headings) else None
+
+
+def extract_page_section_tables(
+    _page: Page, _headings: List[str], _get_tables: List[bool]
+) -> PDFPageTables:
+    """Return the tables found in each part of the page, split at the section headings.
+
+    Arguments:
+    ----------
+        * _page: (Page) The PDF page to extract the tables from.
+        * _headings: (List[str]) The section-heading lines found on the page, in order.
+        * _get_tables: (List[bool]) For each part of the page (one more than the
+            number of headings), True if the tables should be extracted.
+
+    Returns:
+    --------
+        * (PDFPageTables) The tables for each part of the page, or None for any
+            part which did not want its tables extracted.
+    """
+    x0, page_top, x1, page_bottom = _page.bbox
+    heading_tops = find_heading_tops(_page, _headings)
+    if heading_tops is None:
+        # -- Can't split the page up, so treat the whole page as belonging to the
+        # -- last section found on it.
+        heading_tops = [page_top] * len(_headings)
+
+    bounds = [page_top, *heading_tops, page_bottom]
+    page_tables: PDFPageTables = []
+    for get_tables, top, bottom in zip(_get_tables, bounds, bounds[1:]):
+        if not get_tables:
+            page_tables.append(None)
+        elif bottom <= top:
+            page_tables.append([])
+        else:
+            page_tables.append(_page.crop((x0, top, x1, bottom)).extract_tables())
+    return page_tables
+
+
+def _extract_pages_tables(
+    _filepath: pathlib.Path, _page_requests: List[Tuple[int, List[str], List[bool]]]
+) -> List[PDFPageTables]:
+    """Return the tables for each of the (page, headings, get-tables) requests. Run in a worker process."""
+    with pdfplumber.open(_filepath) as pdf:
+        return [
+            extract_page_section_tables(pdf.pages[i], headings, get_tables)
+            for i, headings, get_tables in _page_requests
+        ]
+
+
+def _chunk(_items: List[T_Item], _num_chunks: int) -> List[List[T_Item]]:
+    """Split the list into (at most) the specified number of contiguous chunks."""
+    size, remainder = divmod(len(_items), _num_chunks)
+    chunks, start = [], 0
+    for i in range(_num_chunks):
+        end = start + size + (1 if i < remainder else 0)
+        if end > start:
+            chunks.append(_items[start:end])
+        start = end
+    return chunks
 
 
 class PDFReader:
     """PDFReader class for loading and reading data from WUFI-PDF files."""
 
+    # -- Increment whenever the extracted data changes, so that any stored data is invalidated
+    reader_version: int = 2
+
     # -- Store a reference to each of the PDF-Section classes registered with the PDF-Reader
     pdf_section_classes: Dict[str, Type[SupportsWufiPDF_Section]] = {}
 
-    def __init__(self, _logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        _logger: Optional[Logger] = None,
+        _max_workers: int = 1,
+        _parallel_min_pages: int = 40,
+        _extraction_store: Optional[PDFExtractionStore] = None,
+    ) -> None:
+        """
+        Arguments:
+        ----------
+            * _logger: (Optional[Logger]) The logger to use.
+            * _max_workers: (int) The number of processes to use when extracting the
+                text from the PDF pages. Default=1 (no parallel processing).
+            * _parallel_min_pages: (int) PDF files with fewer pages than this are
+                always read in serially since the process-pool startup is not worth it.
+            * _extraction_store: (Optional[PDFExtractionStore]) If supplied, the raw
+                page data is saved to (and re-loaded from) this on-disk store.
+        """
         self.logger = _logger or Logger("PDF_Reader")
         self.logger.info("Initializing PDFReader")
+        self.max_workers = _max_workers
+        self.parallel_min_pages = _parallel_min_pages
+        self.extraction_store = _extraction_store
 
         # -------
         self.pdf_sections = PDFSectionsCollection(self.logger)
@@ -45,60 +180,498 @@ class PDFReader:
             pdf_section_class
         )
 
-    def load_pdf_file_data(self, _filepath: pathlib.Path) -> None:
-        """Populate the .sections with data from a PDF file."""
+    def use_parallel_extraction(self, _num_pages: int) -> bool:
+        """Return True if the PDF pages should be read in using a process-pool."""
+        return self.max_workers > 1 and _num_pages >= self.parallel_min_pages
+
+    def add_lines_to_sections(
+        self, _section: SupportsWufiPDF_Section, _lines: List[str]
+    ) -> SupportsWufiPDF_Section:
+        """Add each line to the 'active' section, and return the section active at the end.
+
+        Any line which is one of the 'Section-Markers' changes the active section.
+        """
+        section = _section
+        for line in _lines:
+            # -- See if the line is one of the 'Section-Markers'
+            # -- like "BUILDING INFORMATION", etc...
+            if section_marker := self.pdf_sections.get(line, None):
+                # -- If it is, make that section the 'active' one
+                self.logger.info(f"Found PDF Section-Marker: in line '{line}'.")
+                self.logger.info(
+                    f"Changing section to {section_marker.__pdf_heading_string__}."
+                )
+                section = section_marker
+
+            else:
+                # -- otherwise, just add the line to the 'active' section
+                section.add_line(line)
+        return section
+
+    def find_page_sections(
+        self, _section: SupportsWufiPDF_Section, _lines: List[str]
+    ) -> List[SupportsWufiPDF_Section]:
+        """Return the sections the page's lines belong to, in order, starting with the active section."""
+        return [
+            _section,
+            *(self.pdf_sections[l] for l in _lines if l in self.pdf_sections.keys()),
+        ]
+
+    def add_tables_to_section(
+        self, _section: SupportsWufiPDF_Section, _tables: List[PDFTable]
+    ) -> None:
+        """Add each of the tables to the section."""
+        for table in _tables:
+            try:
+                _section.add_table(table)
+            except AttributeError:
+                pass
+
+    def add_page_tables_to_sections(
+        self, _sections: List[SupportsWufiPDF_Section], _page_tables: PDFPageTables
+    ) -> None:
+        """Add the tables from each part of the page to the section that part belongs to."""
+        for section, tables in zip(_sections, _page_tables):
+            if tables:
+                self.add_tables_to_section(section, tables)
+
+    def load_pdf_file_data(
+        self, _filepath: pathlib.Path, _file_hash: Optional[str] = None
+    ) -> None:
+        """Populate the .sections with data from a PDF file.
+
+        Arguments:
+        ----------
+            * _filepath: (pathlib.Path) The WUFI-PDF file to read.
+            * _file_hash: (Optional[str]) The file's hash, if already known. Only
+                used to find the file's data in the extraction-store.
+        """
 
         self.logger.info(f"Reading in the PDF file: {_filepath}")
         self.logger.info(
             f"Looking for sections: '{[section_name for section_name in list(self.pdf_sections.keys())]}'"
         )
 
+        if self.extraction_store:
+            _file_hash = _file_hash or get_file_hash(_filepath)
+            if extraction_file := self.extraction_store.open(
+                _filepath, self.pdf_sections.keys(), _file_hash
+            ):
+                with extraction_file:
+                    if self._load_pdf_pages_from_store(extraction_file):
+                        return
+                # -- Start over with clean sections and read the PDF file
+                self.setup_pdf_sections()
+
+        with pdfplumber.open(_filepath) as pdf:
+            num_pages = len(pdf.pages)
+            parallel = self.use_parallel_extraction(num_pages)
+            if not parallel:
+                pages = self._load_pdf_pages_serial(pdf)
+
+        if parallel:
+            pages = self._load_pdf_pages_parallel(_filepath, num_pages)
+
+        self._save_to_extraction_store(_filepath, pages, _file_hash)
+
+    def _save_to_extraction_store(
+        self,
+        _filepath: pathlib.Path,
+        _pages: List[PDFPageData],
+        _file_hash: Optional[str] = None,
+    ) -> None:
+        """Save the data read in from every page of the PDF, if there is an extraction-store."""
+        if not self.extraction_store:
+            return
+
+        # -- The store is only a speed-up, so failing to write it must not fail the read.
+        try:
+            store_path = self.extraction_store.save(
+                _filepath, _pages, self.pdf_sections.keys(), _file_hash
+            )
+            self.logger.info(f"Saved the PDF page data to: {store_path}")
+
+            # -- The text is all known now, so the section-index can be exact.
+            section_index = PDFSectionIndex.from_pages_lines(
+                (page.lines for page in _pages), self.pdf_sections.keys()
+            )
+            self.extraction_store.save_section_index(
+                _filepath, section_index, self.pdf_sections.keys(), _file_hash
+            )
+        except OSError as e:
+            self.logger.warning(f"Unable to save the PDF page data for: {_filepath}: {e}")
+
+    def get_section_index(
+        self, _filepath: pathlib.Path, _file_hash: Optional[str] = None
+    ) -> PDFSectionIndex:
+        """Return the index of the pages each of the sections is on.
+
+        The stored index is used, if there is one, otherwise it is built from the PDF's
+        outline or a quick scan of the PDF's text (and then stored).
+        """
+        headings = self.pdf_sections.keys()
+        if self.extraction_store:
+            _file_hash = _file_hash or get_file_hash(_filepath)
+            if section_index := self.extraction_store.open_section_index(
+                _filepath, headings, _file_hash
+            ):
+                return section_index
+
+        section_index = PDFSectionIndex.from_pdf_file(_filepath, headings)
+        self.logger.info(f"Built the PDF section-index: {section_index}")
+        if self.extraction_store:
+            try:
+                self.extraction_store.save_section_index(
+                    _filepath, section_index, headings, _file_hash
+                )
+            except OSError as e:
+                self.logger.warning(
+                    f"Unable to save the PDF section-index for: {_filepath}: {e}"
+                )
+        return section_index
+
+    def load_pdf_sections_data(
+        self,
+        _filepath: pathlib.Path,
+        _section_names: Set[str],
+        _file_hash: Optional[str] = None,
+    ) -> None:
+        """Populate only the named sections with data from a PDF file.
+
+        A quick first pass over the PDF finds the pages with any of the section's
+        headings on them. Only those pages are read in fully, continuing on to the
+        following pages for as long as one of the named sections is still active.
+        Any other section's data will be incomplete. If any of the named sections
+        are not found on those pages, the entire PDF is read in instead.
+        """
+        self.logger.info(f"Reading in the PDF file: {_filepath}")
+        self.logger.info(f"Looking for sections: '{sorted(_section_names)}'")
+
+        # -- If the whole PDF has already been stored, just use that.
+        if self.extraction_store:
+            _file_hash = _file_hash or get_file_hash(_filepath)
+            if extraction_file := self.extraction_store.open(
+                _filepath, self.pdf_sections.keys(), _file_hash
+            ):
+                with extraction_file:
+                    if self._load_pdf_pages_from_store(extraction_file):
+                        return
+                self.setup_pdf_sections()
+
+        section_index = self.get_section_index(_filepath, _file_hash)
+        if missing := {_ for _ in _section_names if _ not in section_index}:
+            self.logger.info(
+                f"Sections: {sorted(missing)} not found in the section-index "
+                f"({section_index.source}). Reading in the entire PDF file."
+            )
+            self.load_pdf_file_data(_filepath, _file_hash)
+            return
+
+        start_pages = sorted(
+            set(chain.from_iterable(section_index.start_pages(_) for _ in _section_names))
+        )
+
         with pdfplumber.open(_filepath) as pdf:
+            last_page_index = -1
+            for page_index in start_pages:
+                if page_index <= last_page_index:
+                    continue
+
+                # -- The lines before the first heading belong to some section
+                # -- which is not wanted, so they are just thrown away.
+                section: SupportsWufiPDF_Section = _WufiPDF_DefaultSection()
+                section_pages = 0
+                for page in pdf.pages[page_index:]:
+                    next_section, _ = self._load_pdf_page(page, section, _section_names)
+                    section_pages = section_pages + 1 if next_section is section else 1
+                    section = next_section
+                    last_page_index = page.page_number - 1
+
+                    # -- Keep going only while one of the requested sections is active
+                    if section.__pdf_heading_string__ not in _section_names:
+                        break
+                    max_pages = getattr(section, "max_pages", None)
+                    if max_pages and section_pages >= max_pages:
+                        break
+
+        # -- The section-index may have found a heading which pdfplumber did not
+        if empty := {
+            _
+            for _ in _section_names
+            if not self.pdf_sections[_]._lines and not self.pdf_sections[_]._tables
+        }:
+            self.logger.info(
+                f"Sections: {sorted(empty)} not found on the indexed pages "
+                f"({section_index.source}). Reading in the entire PDF file."
+            )
+            self.setup_pdf_sections()
+            self.load_pdf_file_data(_filepath, _file_hash)
+
+    def _load_pdf_pages_from_store(self, _extraction_file: PDFExtractionFile) -> bool:
+        """Replay the stored page data through the section-markers, the same as a PDF read.
+
+        Returns False if any page now needs tables which were not stored (ie: a section's
+        'get_tables' has changed since the file was saved), in which case the PDF
+        file itself must be read in again.
+        """
+        self.logger.info(f"Reading the stored PDF page data: {_extraction_file.path}")
+
+        # -- Start with the default section
+        section = self.pdf_sections[_WufiPDF_DefaultSection.__pdf_heading_string__]
+
+        for page_index in range(len(_extraction_file)):
+            lines = _extraction_file.page_lines(page_index)
+            sections = self.find_page_sections(section, lines)
+            section = self.add_lines_to_sections(section, lines)
+
+            # -- Add the stored tables, if relevant
+            get_tables = [getattr(s, "get_tables", False) for s in sections]
+            if not any(get_tables):
+                continue
+
+            page_tables = _extraction_file.page_tables(page_index)
+            if page_tables is None or any(
+                get and tables is None for get, tables in zip(get_tables, page_tables)
+            ):
+                self.logger.info(f"No stored tables for page: {page_index + 1}")
+                return False
+            self.add_page_tables_to_sections(sections, page_tables)
+
+        return True
+
+    def _load_pdf_page(
+        self,
+        _page: Page,
+        _section: SupportsWufiPDF_Section,
+        _section_names: Optional[Set[str]] = None,
+    ) -> Tuple[SupportsWufiPDF_Section, PDFPageData]:
+        """Read in the text (and tables) from a single page, and return the section active at the end.
+
+        Arguments:
+        ----------
+            * _page: (Page) The PDF page to read.
+            * _section: (SupportsWufiPDF_Section) The section active at the start of the page.
+            * _section_names: (Optional[Set[str]]) If supplied, only these sections
+                will have their tables extracted.
+
+        Returns:
+        --------
+            * (Tuple[SupportsWufiPDF_Section, PDFPageData]) The section active at
+                the end of the page, and the data read in from the page.
+        """
+        self.logger.info(f"Extracting Text from page: {_page.page_number}")
+        lines = extract_page_lines(_page)
+        sections = self.find_page_sections(_section, lines)
+        section = self.add_lines_to_sections(_section, lines)
+
+        # -- Try and pull out the tables, only if any section on the page wants them
+        get_tables = [
+            getattr(s, "get_tables", False)
+            and (_section_names is None or s.__pdf_heading_string__ in _section_names)
+            for s in sections
+        ]
+        if not any(get_tables):
+            return section, PDFPageData(lines)
+
+        self.logger.info(f"Extracting Table from page: {_page.page_number}")
+        headings = [s.__pdf_heading_string__ for s in sections[1:]]
+        page_tables = extract_page_section_tables(_page, headings, get_tables)
+        self.add_page_tables_to_sections(sections, page_tables)
+        return section, PDFPageData(lines, page_tables)
+
+    def _load_pdf_pages_serial(self, _pdf: pdfplumber.PDF) -> List[PDFPageData]:
+        """Read in the text (and tables) from each page, one at a time."""
+        # -- Start with the default section
+        section = self.pdf_sections[_WufiPDF_DefaultSection.__pdf_heading_string__]
+
+        pages: List[PDFPageData] = []
+        for page in _pdf.pages[0:]:
+            section, page_data = self._load_pdf_page(page, section)
+            pages.append(page_data)
+
+        return pages
+
+    def _load_pdf_pages_parallel(
+        self, _filepath: pathlib.Path, _num_pages: int
+    ) -> List[PDFPageData]:
+        """Read in the text (and tables) from the pages using a pool of worker processes.
+
+        The page text is extracted in parallel, then fed through the section-markers
+        in page order, exactly the same as the serial read. Only then is it known which
+        pages need their tables extracted, so those are read in as a second parallel step.
+        """
+        self.logger.info(
+            f"Extracting Text from {_num_pages} pages using {self.max_workers} processes."
+        )
+        # -- 'spawn' is used since 'fork' is not safe when called from a GUI thread.
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            # -- Get the text of every page, in page order
+            chunks = _chunk(list(range(_num_pages)), self.max_workers * 4)
+            pages_lines = chain.from_iterable(
+                executor.map(_extract_pages_lines, repeat(_filepath), chunks)
+            )
+
             # -- Start with the default section
             section = self.pdf_sections[_WufiPDF_DefaultSection.__pdf_heading_string__]
+            pages: List[PDFPageData] = []
+            table_pages: List[Tuple[int, List[SupportsWufiPDF_Section]]] = []
+            for page_index, lines in enumerate(pages_lines):
+                self.logger.info(f"Extracting Text from page: {page_index + 1}")
+                sections = self.find_page_sections(section, lines)
+                section = self.add_lines_to_sections(section, lines)
+                pages.append(PDFPageData(lines))
+
+                # -- Note the pages that need their tables extracted, if relevant
+                if any(getattr(s, "get_tables", False) for s in sections):
+                    table_pages.append((page_index, sections))
 
-            for page in pdf.pages[0:]:
-                self.logger.info(f"Extracting Text from page: {page.page_number}")
+            if not table_pages:
+                return pages
 
-                lines = page.extract_text(
-                    x_tolerance=3,
-                    y_tolerance=3,
-                    layout=False,
-                    x_density=7.25,
-                    y_density=13,
+            # -- Get the tables for only the required pages, in page order
+            self.logger.info(f"Extracting Tables from {len(table_pages)} pages.")
+            page_requests = [
+                (
+                    page_index,
+                    [s.__pdf_heading_string__ for s in sections[1:]],
+                    [getattr(s, "get_tables", False) for s in sections],
                 )
-                for line in lines.split("\n"):
-                    # -- See if the line is one of the 'Section-Markers'
-                    # -- like "BUILDING INFORMATION", etc...
-                    if section_marker := self.pdf_sections.get(line, None):
-                        # -- If it is, make that section the 'active' one
-                        self.logger.info(f"Found PDF Section-Marker: in line '{line}'.")
-                        self.logger.info(
-                            f"Changing section to {section_marker.__pdf_heading_string__}."
-                        )
-                        section = section_marker
-
-                    else:
-                        # -- otherwise, just add the line to the 'active' section
-                        section.add_line(line)
-
-                # -- Try and pull out the tables, if relevant
-                if not getattr(section, "get_tables", False):
-                    continue
+                for page_index, sections in table_pages
+            ]
+            chunks = _chunk(page_requests, self.max_workers)
+            pages_tables = chain.from_iterable(
+                executor.map(_extract_pages_tables, repeat(_filepath), chunks)
+            )
+            for (page_index, sections), page_tables in zip(table_pages, pages_tables):
+                self.logger.info(f"Extracting Table from page: {page_index + 1}")
+                self.add_page_tables_to_sections(sections, page_tables)
+                pages[page_index] = PDFPageData(pages[page_index].lines, page_tables)
 
-                self.logger.info(f"Extracting Table from page: {page.page_number}")
-                for table in page.extract_tables():
-                    try:
-                        section.add_table(table)
-                    except AttributeError:
-                        pass
+        return pages
 
     def extract_pdf_text_from_file(
-        self, _filepath: pathlib.Path
+        self,
+        _filepath: pathlib.Path,
+        _section_classes: Optional[Iterable[Type[SupportsWufiPDF_Section]]] = None,
+        _file_hash: Optional[str] = None,
     ) -> PDFSectionsCollection:
-        """Extract the text from a WUFI-PDF file and return it as a dict of PDFSection objects."""
+        """Extract the text from a WUFI-PDF file and return it as a dict of PDFSection objects.
+
+        Arguments:
+        ----------
+            * _filepath: (pathlib.Path) The WUFI-PDF file to read.
+            * _section_classes: (Optional[Iterable[Type[SupportsWufiPDF_Section]]]) If
+                supplied, only the pages for these sections are read in, and only these
+                sections are returned. Default=None (read in all the sections).
+            * _file_hash: (Optional[str]) The file's hash, if already known. Only
+                used to find the file's data in the extraction-store.
+
+        Returns:
+        --------
+            * (PDFSectionsCollection) The PDF-Sections with their data.
+        """
         self.pdf_sections.__file_name__ = pathlib.Path(_filepath.name).stem
         self.setup_pdf_sections()
-        self.load_pdf_file_data(_filepath)
+        if _section_classes is None:
+            self.load_pdf_file_data(_filepath, _file_hash)
+        else:
+            # -- Only read in the requested sections, and leave out all the others
+            section_names = {_.__pdf_heading_string__ for _ in _section_classes}
+            self.load_pdf_sections_data(_filepath, section_names, _file_hash)
+            for section_name in list(self.pdf_sections.keys()):
+                if section_name not in section_names:
+                    del self.pdf_sections[section_name]
         self.pdf_sections.process_all_sections()
+        # -- Only the processed data is used, so the raw text is not kept around.
+        self.pdf_sections.release_raw_data()
         return self.pdf_sections
+
+    def _process_and_yield(
+        self, _pdf_section: SupportsWufiPDF_Section
+    ) -> Iterator[SupportsWufiPDF_Section]:
+        """Process the PDF-Section and yield it, then release its raw data once the caller moves on."""
+        self.pdf_sections.process_section(_pdf_section)
+        yield _pdf_section
+        release_raw_data(_pdf_section)
+
+    def iter_pdf_sections(
+        self, _filepath: pathlib.Path, _file_hash: Optional[str] = None
+    ) -> Iterator[SupportsWufiPDF_Section]:
+        """Read in a WUFI-PDF file, yielding each PDF-Section as soon as it is complete.
+
+        A section is complete once the last page with its heading on it (according to
+        the section-index) has been read in, and a later heading has made some other
+        section active. Each section is processed before it is yielded, and its raw
+        text and tables are released as soon as the caller asks for the next one.
+        Sections which are not found in the section-index are yielded at the very end.
+
+        Arguments:
+        ----------
+            * _filepath: (pathlib.Path) The WUFI-PDF file to read.
+            * _file_hash: (Optional[str]) The file's hash, if already known. Only
+                used to find the file's data in the extraction-store.
+
+        Yields:
+        -------
+            * (SupportsWufiPDF_Section) Each of the processed PDF-Sections.
+        """
+        self.pdf_sections.__file_name__ = pathlib.Path(_filepath.name).stem
+        self.setup_pdf_sections()
+
+        # -- If the whole PDF has already been stored, there is no point in streaming.
+        if self.extraction_store:
+            _file_hash = _file_hash or get_file_hash(_filepath)
+            if extraction_file := self.extraction_store.open(
+                _filepath, self.pdf_sections.keys(), _file_hash
+            ):
+                with extraction_file:
+                    loaded = self._load_pdf_pages_from_store(extraction_file)
+                if loaded:
+                    for pdf_section in list(self.pdf_sections.values()):
+                        yield from self._process_and_yield(pdf_section)
+                    return
+                self.setup_pdf_sections()
+
+        section_index = self.get_section_index(_filepath, _file_hash)
+        if section_index.source == "outline":
+            # -- An outline may only list a heading once, even if the section turns up
+            # -- again later on, so look for every one of the headings in the text instead.
+            section_index = PDFSectionIndex(
+                scan_pdf_headings(_filepath, self.pdf_sections.keys()), "scan"
+            )
+
+        # -- The page each section's heading is last found on
+        last_start_pages = {_: section_index.start_pages(_)[-1] for _ in section_index}
+        last_start_pages[_WufiPDF_DefaultSection.__pdf_heading_string__] = 0
+
+        remaining = dict(self.pdf_sections.items())
+        section = self.pdf_sections[_WufiPDF_DefaultSection.__pdf_heading_string__]
+        pages: List[PDFPageData] = []
+        with pdfplumber.open(_filepath) as pdf:
+            for page_index, page in enumerate(pdf.pages):
+                previous_section = section
+                section, page_data = self._load_pdf_page(page, section)
+                if self.extraction_store:
+                    pages.append(page_data)
+                if (
+                    section is not previous_section
+                    and section.__pdf_heading_string__ not in remaining
+                ):
+                    self.logger.warning(
+                        f"The PDF Section: {section.__pdf_heading_string__} was found again "
+                        f"on page {page_index + 1} after it had already been completed "
+                        f"({section_index.source} section-index). Its data will be incomplete."
+                    )
+
+                for section_name, pdf_section in list(remaining.items()):
+                    if pdf_section is section:
+                        continue
+                    if last_start_pages.get(section_name, page_index + 1) <= page_index:
+                        del remaining[section_name]
+                        yield from self._process_and_yield(pdf_section)
+
+        self._save_to_extraction_store(_filepath, pages, _file_hash)
+        for pdf_section in remaining.values():
+            yield from self._process_and_yield(pdf_section)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Process-wide cache of the data extracted from WUFI-PDF files.
+
+The Project, Segment and Building-Component GUI workers all read the same WUFI-PDF
+file. Reading a large PDF with pdfplumber is slow, so the fully processed
+PDFSectionsCollection is kept here, and each of the callers is given its own copy.
+"""
+
+import copy
+import os
+import pathlib
+import threading
+from collections import OrderedDict
+from logging import Logger
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore, get_file_hash
+from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+from NBDM.from_WUFI_PDF.pdf_reader_sections import PDFSectionsCollection
+from NBDM.from_WUFI_PDF.pdf_sections.__typing import SupportsWufiPDF_Section
+
+# -- (reader-version, file-name, file-hash)
+CacheKey = Tuple[int, str, str]
+
+
+class PDFReaderCache:
+    """A size-bounded (LRU) cache of PDFSectionsCollections, keyed by file content.
+
+    The key includes the PDFReader.reader_version so that any change to the
+    parsing logic invalidates the stored data. The file-name is also part of the
+    key since it is used as the Building-Segment name.
+    """
+
+    def __init__(
+        self,
+        _max_size: int = 8,
+        _max_workers: int = 1,
+        _extraction_store: Optional[PDFExtractionStore] = None,
+    ) -> None:
+        self.max_size = _max_size
+        self.max_workers = _max_workers
+        self.extraction_store = _extraction_store
+        self._d: OrderedDict[CacheKey, PDFSectionsCollection] = OrderedDict()
+        self._path_keys: Dict[str, CacheKey] = {}
+        self._lock = threading.Lock()
+        # -- One lock for each file being read in, so it is only read in once
+        self._read_locks: Dict[CacheKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, _filepath: pathlib.Path) -> CacheKey:
+        """Return the cache-key for the file, based on its current contents."""
+        return (
+            PDFReader.reader_version,
+            pathlib.Path(_filepath.name).stem,
+            get_file_hash(_filepath),
+        )
+
+    def get(self, _filepath: pathlib.Path) -> Optional[PDFSectionsCollection]:
+        """Return the cached PDF data for the file, or None if not found."""
+        return self._get(self.key(_filepath))
+
+    def _get(self, _key: CacheKey) -> Optional[PDFSectionsCollection]:
+        with self._lock:
+            try:
+                pdf_data = self._d[_key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._d.move_to_end(_key)
+            self.hits += 1
+            return pdf_data
+
+    def set(self, _filepath: pathlib.Path, _pdf_data: PDFSectionsCollection) -> None:
+        """Add the PDF data for the file to the cache."""
+        self._set(_filepath, self.key(_filepath), _pdf_data)
+
+    def _set(
+        self, _filepath: pathlib.Path, _key: CacheKey, _pdf_data: PDFSectionsCollection
+    ) -> None:
+        with self._lock:
+            # -- If the file has changed on disk since it was last read,
+            # -- the old data is no longer any use to anyone.
+            path_name = str(pathlib.Path(_filepath).resolve())
+            old_key = self._path_keys.get(path_name, None)
+            if old_key and old_key != _key:
+                self._d.pop(old_key, None)
+            self._path_keys[path_name] = _key
+
+            self._d[_key] = _pdf_data
+            self._d.move_to_end(_key)
+            while len(self._d) > self.max_size:
+                self._d.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all of the PDF data from the cache."""
+        with self._lock:
+            self._d.clear()
+            self._path_keys.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def extract_pdf_text_from_file(
+        self,
+        _filepath: pathlib.Path,
+        _logger: Optional[Logger] = None,
+        _section_classes: Optional[Iterable[Type[SupportsWufiPDF_Section]]] = None,
+    ) -> PDFSectionsCollection:
+        """Return the PDF data for the file, reading it in only if it is not already cached.
+
+        Each caller is given its own copy of the cached PDFSectionsCollection, so the
+        callers (ie: GUI worker threads) may safely use it at the same time. If several
+        callers ask for the same file at once, it is only read in by the first, and the
+        others wait for it. If only some sections are requested, and the file is
+        not already cached, only those sections are read in and the result is not cached.
+        """
+        key = self.key(_filepath)
+        if (pdf_data := self._get(key)) is not None:
+            if _logger:
+                _logger.info(f"Using the cached PDF data for file: {_filepath}")
+            return copy.deepcopy(pdf_data)
+
+        reader = PDFReader(
+            _logger,
+            _max_workers=self.max_workers,
+            _extraction_store=self.extraction_store,
+        )
+        if _section_classes is not None:
+            return reader.extract_pdf_text_from_file(_filepath, _section_classes, key[2])
+
+        with self._lock:
+            read_lock = self._read_locks.setdefault(key, threading.Lock())
+        try:
+            with read_lock:
+                # -- Some other caller may have read in the file while this one waited
+                with self._lock:
+                    pdf_data = self._d.get(key, None)
+                if pdf_data is None:
+                    pdf_data = reader.extract_pdf_text_from_file(
+                        _filepath, _file_hash=key[2]
+                    )
+                    self._set(_filepath, key, pdf_data)
+                elif _logger:
+                    _logger.info(f"Using the cached PDF data for file: {_filepath}")
+        finally:
+            with self._lock:
+                if (
+                    self._read_locks.get(key, None) is read_lock
+                    and not read_lock.locked()
+                ):
+                    del self._read_locks[key]
+        return copy.deepcopy(pdf_data)
+
+    def __contains__(self, _filepath: pathlib.Path) -> bool:
+        return self.key(_filepath) in self._d
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_size={self.max_size}, size={len(self)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+# -- The single, shared, cache used by all the PDF readers in the process
+PDF_READER_CACHE = PDFReaderCache(
+    _max_workers=os.cpu_count() or 1, _extraction_store=PDFExtractionStore()
+)
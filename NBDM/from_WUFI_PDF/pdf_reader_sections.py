@@ -3,6 +3,7 @@
 
 """Wrapper Class to organize the PDF Sections."""
 
+import copy
 from logging import Logger
 from typing import (
     Any,
@@ -11,6 +12,7 @@ from typing import (
     Iterator,
     KeysView,
     Optional,
+    Set,
     Type,
     TypeVar,
     ValuesView,
@@ -20,6 +22,34 @@ from NBDM.from_WUFI_PDF.pdf_sections.__typing import SupportsWufiPDF_Section
 
 T = TypeVar("T", bound=SupportsWufiPDF_Section)
 
+RAW_DATA_ATTRS = ("_lines", "_tables")
+
+
+def _holds_raw_data(_obj: Any) -> bool:
+    """Return True if the object keeps any of the raw text or tables read from the PDF-file."""
+    return any(_ in getattr(_obj, "__dict__", {}) for _ in RAW_DATA_ATTRS)
+
+
+def release_raw_data(_obj: Any, _released: Optional[Set[int]] = None) -> None:
+    """Free the raw text and tables held by the object, and by all the objects nested in it.
+
+    Some PDF-Sections split their text up between sub-section objects (ie: the HVAC
+    device-groups and devices) which keep their own raw text as well.
+    """
+    _released = set() if _released is None else _released
+    if id(_obj) in _released:
+        return
+    _released.add(id(_obj))
+
+    for attr_name, attr_value in list(vars(_obj).items()):
+        if attr_name in RAW_DATA_ATTRS:
+            setattr(_obj, attr_name, [])
+            continue
+        items = attr_value if isinstance(attr_value, (list, tuple)) else (attr_value,)
+        for item in items:
+            if _holds_raw_data(item):
+                release_raw_data(item, _released)
+
 
 class PDFSectionsCollection:
     """A Wrapper Class to organize the PDF Sections."""
@@ -49,6 +79,9 @@ class PDFSectionsCollection:
     ) -> None:
         self._d[_section_class_type_name] = _section
 
+    def __delitem__(self, _section_class_type_name: str) -> None:
+        del self._d[_section_class_type_name]
+
     def __contains__(self, _section_class_type: SupportsWufiPDF_Section) -> bool:
         return _section_class_type.__pdf_heading_string__ in self._d
 
@@ -73,10 +106,27 @@ class PDFSectionsCollection:
     def __repr__(self) -> str:
         return f"PDFSectionsCollection({self._d})"
 
+    def __deepcopy__(self, _memo: Dict[int, Any]) -> "PDFSectionsCollection":
+        # -- The PDF-Sections are all copied, but the logger is shared
+        new_obj = PDFSectionsCollection(self.logger)
+        new_obj.__file_name__ = self.__file_name__
+        new_obj._d = copy.deepcopy(self._d, _memo)
+        return new_obj
+
+    def process_section(self, _pdf_section: SupportsWufiPDF_Section) -> None:
+        """Process the raw data which was read from the PDF-file for a single PDF-Section."""
+        self.logger.info(
+            f"Processing Text from the PDF Section: {_pdf_section.__pdf_heading_string__}"
+        )
+        _pdf_section.process_section_text()
+
     def process_all_sections(self) -> None:
         """Walk through all the PDF-Sections and process the raw data which was read from the PDF-file"""
         for pdf_section in self.values():
-            self.logger.info(
-                f"Processing Text from the PDF Section: {pdf_section.__pdf_heading_string__}"
-            )
-            pdf_section.process_section_text()
+            self.process_section(pdf_section)
+
+    def release_raw_data(self) -> None:
+        """Free the raw text and tables read from the PDF-file, once all the sections are processed."""
+        released: Set[int] = set()
+        for pdf_section in self.values():
+            release_raw_data(pdf_section, released)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""PDFSectionIndex class for finding which pages each section of a WUFI-PDF file is on."""
+
+import pathlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pypdfium2
+
+# -- Increment whenever the way the index is built changes, so that any stored index is invalidated
+INDEX_VERSION = 1
+
+
+def scan_pdf_headings(
+    _filepath: pathlib.Path, _headings: Iterable[str]
+) -> List[List[str]]:
+    """Return the section-heading lines found on each page of the PDF, in order.
+
+    This uses pdfium's (much faster, but slightly different) text extraction, so
+    it is only good enough to find which pages the headings are on.
+    """
+    headings = set(_headings)
+    pages_headings: List[List[str]] = []
+    pdf = pypdfium2.PdfDocument(_filepath)
+    try:
+        for page in pdf:
+            text = page.get_textpage().get_text_range()
+            lines = (line.strip() for line in text.splitlines())
+            pages_headings.append([line for line in lines if line in headings])
+            page.close()
+    finally:
+        pdf.close()
+    return pages_headings
+
+
+def read_pdf_outline_headings(
+    _filepath: pathlib.Path, _headings: Iterable[str]
+) -> Optional[List[List[str]]]:
+    """Return the section-headings on each page of the PDF, using the PDF's outline (bookmarks).
+
+    Returns None if the PDF has no outline, or none of the outline items are section headings.
+    """
+    headings = set(_headings)
+    pdf = pypdfium2.PdfDocument(_filepath)
+    try:
+        pages_headings: List[List[str]] = [[] for _ in range(len(pdf))]
+        found = False
+        for item in pdf.get_toc():
+            title = item.get_title().strip()
+            page_index = item.get_dest().get_index() if item.get_dest() else None
+            if title in headings and page_index is not None:
+                pages_headings[page_index].append(title)
+                found = True
+    finally:
+        pdf.close()
+    return pages_headings if found else None
+
+
+class PDFSectionIndex:
+    """The pages that each of the sections of a WUFI-PDF file are on.
+
+    A section starts on the page with its heading, and runs until (and including)
+    the page with the next heading on it. Headings may appear more than once.
+    """
+
+    def __init__(self, _pages_headings: List[List[str]], _source: str = "") -> None:
+        """
+        Arguments:
+        ----------
+            * _pages_headings: (List[List[str]]) The section-headings found on each
+                page of the PDF, in order.
+            * _source: (str) How the index was built ("outline", "scan", "text").
+        """
+        self.pages_headings = _pages_headings
+        self.source = _source
+        self._page_ranges: Dict[str, List[range]] = defaultdict(list)
+
+        occurrences = [
+            (page_index, heading)
+            for page_index, headings in enumerate(self.pages_headings)
+            for heading in headings
+        ]
+        next_pages = [page_index for page_index, _ in occurrences[1:]]
+        next_pages.append(self.num_pages - 1)
+        for (start_page, heading), end_page in zip(occurrences, next_pages):
+            self._page_ranges[heading].append(range(start_page, end_page + 1))
+
+    @classmethod
+    def from_pdf_file(
+        cls, _filepath: pathlib.Path, _headings: Iterable[str]
+    ) -> "PDFSectionIndex":
+        """Build the index from the PDF's outline, if it has one, or else from a quick text scan."""
+        headings = list(_headings)
+        if pages_headings := read_pdf_outline_headings(_filepath, headings):
+            return cls(pages_headings, "outline")
+        return cls(scan_pdf_headings(_filepath, headings), "scan")
+
+    @classmethod
+    def from_pages_lines(
+        cls, _pages_lines: Iterable[List[str]], _headings: Iterable[str]
+    ) -> "PDFSectionIndex":
+        """Build the (exact) index from the text lines already extracted for each page."""
+        headings = set(_headings)
+        return cls(
+            [[l for l in lines if l in headings] for lines in _pages_lines], "text"
+        )
+
+    @property
+    def is_exact(self) -> bool:
+        """True if the index was built from the same text the PDFReader reads in."""
+        return self.source == "text"
+
+    @property
+    def num_pages(self) -> int:
+        return len(self.pages_headings)
+
+    def page_ranges(self, _heading: str) -> List[range]:
+        """Return the range of pages for each time the section appears in the PDF."""
+        return self._page_ranges.get(_heading, [])
+
+    def start_pages(self, _heading: str) -> List[int]:
+        """Return the page-index for each time the section's heading appears in the PDF."""
+        return [page_range.start for page_range in self.page_ranges(_heading)]
+
+    def section_pages(self, _heading: str) -> List[int]:
+        """Return all of the page-indexes the section is found on, in order."""
+        return sorted(
+            {i for page_range in self.page_ranges(_heading) for i in page_range}
+        )
+
+    def headings(self) -> List[str]:
+        """Return all of the section-headings found in the PDF."""
+        return list(self._page_ranges.keys())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index_version": INDEX_VERSION,
+            "source": self.source,
+            "pages_headings": self.pages_headings,
+        }
+
+    @classmethod
+    def from_dict(cls, _d: Dict[str, Any]) -> "PDFSectionIndex":
+        if _d.get("index_version") != INDEX_VERSION:
+            raise ValueError(
+                f"Error: Cannot load a version-{_d.get('index_version')} section "
+                f"index. Expected version-{INDEX_VERSION}."
+            )
+        return cls(_d["pages_headings"], _d["source"])
+
+    def __contains__(self, _heading: str) -> bool:
+        return _heading in self._page_ranges
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._page_ranges)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(num_pages={self.num_pages}, "
+            f"source={self.source}, sections={len(self._page_ranges)})"
+        )
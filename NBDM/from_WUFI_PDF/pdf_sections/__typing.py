@@ -3,7 +3,7 @@
 """WUFI-PDF Section: Base"""
 
 # from abc import ABC, abstractmethod
-from typing import List, Protocol
+from typing import List, Optional, Protocol
 
 
 class SupportsWufiPDF_Section(Protocol):
@@ -11,6 +11,8 @@ class SupportsWufiPDF_Section(Protocol):
 
     __pdf_heading_string__: str = ""
     get_tables: bool = False
+    # -- When only some sections are read in, stop after this many pages of the section
+    max_pages: Optional[int] = None
     _lines: List
     _tables: List
 
@@ -0,0 +1,72 @@
+# -*- Python Version: 3.11 -*-
+
+"""Declarative line-rules for sorting through the text lines of a WUFI-PDF Section."""
+
+import re
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+LineHandler = Callable[[re.Match], Any]
+
+
+class LineRules:
+    """A table of named line-patterns, which are all searched for in a single pass over each line.
+
+    All of the patterns are compiled together into one regex, so the cost of sorting
+    through a section's text depends on the number of lines, not the number of rules.
+    If more than one rule is found in a line, the one found left-most in the line wins
+    (or, at the same place, the one listed first in the table).
+
+    The rule's own named groups (ie: 'value') are returned in the match, so different
+    rules may use the same group names.
+
+    ie: LineRules({"cop": r"Rated COP 1 .*]", "qty": r"Quantity (?P<value>[0-9]+)"})
+    """
+
+    def __init__(self, _rules: Mapping[str, str]) -> None:
+        """
+        Arguments:
+        ----------
+            * _rules: (Mapping[str, str]) The rule-name, and the regex-pattern for the
+                rule, in order of priority. The rule-names must be valid identifiers.
+        """
+        self.rules: Dict[str, re.Pattern] = {
+            name: re.compile(pattern) for name, pattern in _rules.items()
+        }
+        # -- The rule's own groups are left out of the combined pattern, so the names
+        # -- don't clash. The winning rule's pattern is then re-matched to get them.
+        self._combined = re.compile(
+            "|".join(
+                f"(?P<{name}>{_without_named_groups(p.pattern)})"
+                for name, p in self.rules.items()
+            )
+        )
+
+    def match(self, _line: str) -> Tuple[Optional[str], Optional[re.Match]]:
+        """Return the name of the rule found in the line, and its match, or (None, None)."""
+        found = self._combined.search(_line)
+        if not found:
+            return None, None
+        name = found.lastgroup
+        assert name is not None
+        return name, self.rules[name].match(_line, found.start(name))
+
+    def dispatch(
+        self, _lines: Iterable[str], _handlers: Mapping[str, LineHandler]
+    ) -> None:
+        """Call the handler for the rule found in each line. Lines with no rule found are skipped.
+
+        Rules without a handler are still searched for, so that they can 'block' any lower
+        priority rules on the same line.
+        """
+        for line in _lines:
+            name, match = self.match(line)
+            if name and (handler := _handlers.get(name, None)):
+                handler(match)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self.rules.keys())})"
+
+
+def _without_named_groups(_pattern: str) -> str:
+    """Return the regex-pattern with any named groups '(?P<name>' changed to non-capturing '(?:'."""
+    return re.sub(r"(?<!\\)\(\?P<\w+>", "(?:", _pattern)
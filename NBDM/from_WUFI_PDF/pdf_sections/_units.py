@@ -0,0 +1,63 @@
+# -*- Python Version: 3.11 -*-
+
+"""Cached conversion of the WUFI-PDF text values (ie: '58,327.2 Btu/hr') to Unit objects.
+
+The same few dozen unit strings are found over and over in the PDF, so both the
+parsing of the text and the lookup of the standard unit-name are cached.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ph_units.converter import (
+    UnitTypeNameNotFound,
+    _standardize_unit_name,
+    unit_type_alias_dict,
+)
+from ph_units.parser import parse_input
+from ph_units.unit_type import Unit
+
+# -- The max number of text-values, and unit-names, to remember
+VALUE_CACHE_SIZE = 4096
+UNIT_NAME_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE)
+def parse_value_text(_text: str) -> Tuple[str, Optional[str]]:
+    """Return the (value, unit) parts of the text. ie: '45,567 ft2' -> ('45567', 'FT2')"""
+    return parse_input(_text)
+
+
+@lru_cache(maxsize=UNIT_NAME_CACHE_SIZE)
+def standard_unit_name(_unit: str) -> Optional[str]:
+    """Return the standard name for the unit (ie: 'FT3/M' -> 'CFM'), or None if not a known unit."""
+    try:
+        return _standardize_unit_name(_unit, unit_type_alias_dict)
+    except UnitTypeNameNotFound:
+        return None
+
+
+def text_to_unit(_text: str) -> Union[Unit, str]:
+    """Return a new Unit from the text, or the text itself if it has no known unit-part."""
+    val, unit = parse_value_text(_text)
+    if not unit:
+        return _text
+
+    unit_name = standard_unit_name(unit)
+    if unit_name is None:
+        return _text
+    return Unit(val, unit_name)
+
+
+def unit_cache_info() -> Dict[str, Any]:
+    """Return the hits, misses and size of each of the caches (see: 'lru_cache.cache_info')."""
+    return {
+        "value_text": parse_value_text.cache_info(),
+        "unit_name": standard_unit_name.cache_info(),
+    }
+
+
+def clear_unit_cache() -> None:
+    """Empty the caches, and reset their hit / miss counters."""
+    parse_value_text.cache_clear()
+    standard_unit_name.cache_clear()
@@ -2,16 +2,19 @@
 
 """WUFI-PDF Section: Annual Heating / Cooling Demand"""
 
+import re
 from typing import Any, List, Optional
 
-from ph_units.converter import (
-    UnitTypeNameNotFound,
-    _standardize_unit_name,
-    unit_type_alias_dict,
-)
-from ph_units.parser import parse_input
 from ph_units.unit_type import Unit
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+from NBDM.from_WUFI_PDF.pdf_sections._units import text_to_unit
+
+
+def _attr_name(_text: str) -> str:
+    """Return the PDF text as an attribute name. ie: 'Cooling demand - sensible' -> 'cooling_demand_sensible'"""
+    return _text.strip().replace(" - ", "_").lower().replace(" ", "_")
+
 
 class AnnualDemand:
     def __init__(self, _name: str) -> None:
@@ -42,15 +45,7 @@ class AnnualDemand:
             return super().__setattr__(__name, __value)
 
         # -- Try and pull out any unit part of the string
-        val, unit = parse_input(__value)
-        if not unit:
-            return super().__setattr__(__name, __value)
-
-        try:
-            unit = _standardize_unit_name(unit, unit_type_alias_dict)
-            return super().__setattr__(__name, Unit(val, unit))
-        except UnitTypeNameNotFound:
-            return super().__setattr__(__name, __value)
+        return super().__setattr__(__name, text_to_unit(__value))
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({vars(self).items()})"
@@ -60,6 +55,25 @@ class WufiPDF_AnnualHeatingAndCoolingDemand:
     __pdf_heading_string__ = "ANNUAL HEAT DEMAND ANNUAL COOLING DEMAND"
     get_tables = False
 
+    # -- The heating-demand column and the cooling-demand column are run together
+    line_rules = LineRules(
+        {
+            # -- ie: "Specific annual heat demand: 382,240.3 Btu/ft²yr Cooling demand - latent: 168,414 kBtu/yr"
+            "specific_heat_demand": (
+                r"^\s*Specific annual heat demand:[^:]*?yr (?P<clg_name>[^:]*):(?P<clg_value>[^:]*)$"
+            ),
+            # -- ie: "Annual cooling demand: 207,205 kBtu/yr"
+            "cooling_demand": r"^\s*(?P<clg_name>Annual cooling demand):(?P<clg_value>[^:]*)$",
+            # -- ie: "Utilization factor: 88.1 % Utilization factor: 6 %"
+            "utilization_factor": r"^\s*Utilization factor:\s*(?P<htg_value>[^:]*?) % ",
+            # -- ie: "Total heat losses: 2,118,583 kBtu/yr Total heat gains: 228,218 kBtu/yr"
+            "demand": (
+                r"^(?P<htg_name>[^:]*):\s*(?P<htg_value>[^:]*?)/yr (?P<clg_name>[^:]*):"
+                r"(?:.*:)?(?P<clg_value>[^:]*)$"
+            ),
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
@@ -88,53 +102,29 @@ class WufiPDF_AnnualHeatingAndCoolingDemand:
         Specific annual cooling demand: 40.1 kBtu/ft²yr
         ....
         """
-        for line in self._lines:
-            line = line.split(":")
-            if len(line) < 2:
-                continue
-
-            htg_attr_name = line[0].lower().strip().replace(" ", "_")
-            # -- Handle all the weird lines...
-            if htg_attr_name == "annual_heat_demand":
-                # line = ["Annual heat demand", "1,974,718 kBtu/yr Cooling demand - sensible", "38,791 kBtu/yr"]
-                middle_string, clg_attr_value = line[1:]
-                clg_attr_value = clg_attr_value.replace("/yr", "").strip()
-                htg_attr_value, clg_attr_name = middle_string.split("/yr ")
-                clg_attr_name = (
-                    clg_attr_name.replace(" - ", "_").replace(" ", "_").strip().lower()
-                )
-            elif htg_attr_name == "specific_annual_heat_demand":
-                # line = ["Specific annual heat demand", "382,240.3 Btu/ft²yr Cooling demand - latent", ""168,414 kBtu/yr"]
-                middle_string, clg_attr_value = line[1:]
-                clg_attr_value = clg_attr_value.replace("/yr", "").strip()
-                htg_attr_value, clg_attr_name = middle_string.split("yr ")
-                clg_attr_name = (
-                    clg_attr_name.replace(" - ", "_").replace(" ", "_").strip().lower()
-                )
-                htg_attr_name = None
-                htg_attr_value = None
-            elif htg_attr_name == "annual_cooling_demand":
-                # line = ["Annual cooling demand", "207,205 kBtu/yr"]
-                clg_attr_name, clg_attr_value = line
-                clg_attr_name = (
-                    clg_attr_name.replace(" - ", "_").replace(" ", "_").strip().lower()
-                )
-                clg_attr_value = clg_attr_value.replace("/yr", "").strip()
-                htg_attr_name = None
-                htg_attr_value = None
-            elif htg_attr_name == "utilization_factor":
-                htg_attr_value, clg_attr_name = line[1].strip().split(" % ")
-                htg_attr_value = float(htg_attr_value) / 100
-                clg_attr_value = line[-1].strip()
-            elif htg_attr_name not in self.heating_demand.__dict__:
-                # -- Ignore anything that isn't one of the object's attributes.
-                continue
-            else:
-                # -- Handle all the 'normal' lines
-                htg_attr_value, clg_attr_name = line[1].strip().split("/yr ")
-                clg_attr_name = clg_attr_name.lower().strip().replace(" ", "_")
-                clg_attr_value = line[-1].strip()
-                clg_attr_value = clg_attr_value.replace("/yr", "").strip()
-
-            self.heating_demand.__setattr__(htg_attr_name, htg_attr_value)
-            self.cooling_demand.__setattr__(clg_attr_name, clg_attr_value)
+        self.line_rules.dispatch(
+            self._lines,
+            {
+                "specific_heat_demand": self._set_cooling_demand,
+                "cooling_demand": self._set_cooling_demand,
+                "utilization_factor": self._set_utilization_factor,
+                "demand": self._set_demand,
+            },
+        )
+
+    def _set_cooling_demand(self, _match: re.Match) -> None:
+        clg_attr_value = _match["clg_value"].replace("/yr", "").strip()
+        setattr(self.cooling_demand, _attr_name(_match["clg_name"]), clg_attr_value)
+
+    def _set_utilization_factor(self, _match: re.Match) -> None:
+        # -- Note: the cooling utilization factor is not read in, it is left at 0.
+        self.heating_demand.utilization_factor = float(_match["htg_value"]) / 100
+
+    def _set_demand(self, _match: re.Match) -> None:
+        htg_attr_name = _attr_name(_match["htg_name"])
+        if htg_attr_name not in self.heating_demand.__dict__:
+            # -- Ignore anything that isn't one of the object's attributes.
+            return
+
+        setattr(self.heating_demand, htg_attr_name, _match["htg_value"])
+        self._set_cooling_demand(_match)
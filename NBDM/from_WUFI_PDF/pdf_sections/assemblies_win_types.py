@@ -2,10 +2,13 @@
 
 """WUFI-PDF Section: Assembly / Window Types"""
 
+import re
 from typing import List
 
 from ph_units.unit_type import Unit
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+
 
 class WufiPDF_AssemblyType:
     """A WUFI-PDF Assembly Type."""
@@ -38,6 +41,16 @@ class WufiPDF_AssemblyAndWindowTypes:
     __pdf_heading_string__ = "Assemblies/window types"
     get_tables = False
 
+    line_rules = LineRules(
+        {
+            "assembly": r"Assembly \(Id\.[^:]*:(?P<name>[^:]*)",
+            "assembly_u_value": r"Heat transfer coefficient \(U-value\):\s*(?P<value>[^ :]*)",
+            "window": r"Window type \(Id[^:]*:(?P<name>[^:]*)",
+            "window_u_value": r"Glass U-value.* (?P<value>[^ ]*)$",
+            "window_g_value": r"SHGC/Solar energy transmittance \(perpendicular\).* (?P<value>[^ ]*)$",
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
@@ -85,29 +98,34 @@ class WufiPDF_AssemblyAndWindowTypes:
         ]
         """
 
-        # -- Create default types.
-        assembly_type = WufiPDF_AssemblyType()
-        window_type = WufiPDF_WindowType()
-
-        for line in self._lines:
-            # -- Populate the Assembly Types
-            if "Assembly (Id." in line:
-                assembly_type = WufiPDF_AssemblyType()
-                self._assembly_types.append(assembly_type)
-                assembly_type.name = line.split(":")[1].strip()
-            elif "Heat transfer coefficient (U-value):" in line:
-                assembly_type.u_value = Unit(
-                    float(line.split(":")[1].strip().split(" ")[0]), "BTU/HR-FT2-F"
-                )
-
-            # -- Populate the Window Types
-            if "Window type (Id" in line:
-                window_type = WufiPDF_WindowType()
-                self._window_types.append(window_type)
-                window_type.name = line.split(":")[1].strip()
-            elif "Glass U-value" in line:
-                window_type.u_value = Unit(
-                    float(line.split(" ")[-1].strip()), "BTU/HR-FT2-F"
-                )
-            elif "SHGC/Solar energy transmittance (perpendicular)" in line:
-                window_type.g_value = Unit(float(line.split(" ")[-1].strip()), "-")
+        self._assembly_type = WufiPDF_AssemblyType()
+        self._window_type = WufiPDF_WindowType()
+        self.line_rules.dispatch(
+            self._lines,
+            {
+                "assembly": self._add_assembly_type,
+                "assembly_u_value": self._set_assembly_u_value,
+                "window": self._add_window_type,
+                "window_u_value": self._set_window_u_value,
+                "window_g_value": self._set_window_g_value,
+            },
+        )
+
+    def _add_assembly_type(self, _match: re.Match) -> None:
+        self._assembly_type = WufiPDF_AssemblyType()
+        self._assembly_types.append(self._assembly_type)
+        self._assembly_type.name = _match["name"].strip()
+
+    def _set_assembly_u_value(self, _match: re.Match) -> None:
+        self._assembly_type.u_value = Unit(float(_match["value"]), "BTU/HR-FT2-F")
+
+    def _add_window_type(self, _match: re.Match) -> None:
+        self._window_type = WufiPDF_WindowType()
+        self._window_types.append(self._window_type)
+        self._window_type.name = _match["name"].strip()
+
+    def _set_window_u_value(self, _match: re.Match) -> None:
+        self._window_type.u_value = Unit(float(_match["value"]), "BTU/HR-FT2-F")
+
+    def _set_window_g_value(self, _match: re.Match) -> None:
+        self._window_type.g_value = Unit(float(_match["value"]), "-")
@@ -2,21 +2,32 @@
 
 """WUFI-PDF Section: Building Information"""
 
+import re
 from typing import Any, List
 
-from ph_units.converter import (
-    UnitTypeNameNotFound,
-    _standardize_unit_name,
-    unit_type_alias_dict,
-)
-from ph_units.parser import parse_input
 from ph_units.unit_type import Unit
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+from NBDM.from_WUFI_PDF.pdf_sections._units import text_to_unit
+
 
 class WufiPDF_BuildingInformation:
     __pdf_heading_string__ = "BUILDING INFORMATION"
     get_tables = False
 
+    # -- Most lines are just 'name: value', but some have other text run into them
+    line_rules = LineRules(
+        {
+            # -- ie: "Climate: User defined Enclosed volume: 50,853.1 ft³"
+            "enclosed_volume": r"^\s*(?i:climate)\s*:(?:.*:)?(?P<value>[^:]*)$",
+            # -- ie: "Overheat temperature: 77 °F Envelope area/iCFA: 1.6"
+            "overheat_temperature": r"^\s*(?i:overheat temperature)\s*:(?P<value>[^:]*)",
+            # -- ie: "Number of occupants: 15 (Design)"
+            "number_of_occupants": r"^\s*(?i:number of occupants)\s*:(?:.*:)?(?P<value>[^:]*)$",
+            "attribute": r"^(?P<name>[^:]*):(?P<value>[^:]*)",
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
@@ -29,8 +40,7 @@ class WufiPDF_BuildingInformation:
 
     def add_line(self, _line: str) -> None:
         """Add a line of text to the section."""
-        line = _line.split(":")
-        self._lines.append(line)
+        self._lines.append(_line)
 
     def add_table(self, _table: List) -> None:
         self._tables.append(_table)
@@ -40,35 +50,30 @@ class WufiPDF_BuildingInformation:
             return super().__setattr__(__name, __value)
 
         # -- Try and pull out any unit part of the string
-        val, unit = parse_input(__value)
-        if not unit:
-            return super().__setattr__(__name, __value)
-
-        try:
-            unit = _standardize_unit_name(unit, unit_type_alias_dict)
-            return super().__setattr__(__name, Unit(val, unit))
-        except UnitTypeNameNotFound:
-            return super().__setattr__(__name, __value)
+        return super().__setattr__(__name, text_to_unit(__value))
 
     def process_section_text(self) -> None:
         """Sort through the input text and pull out the relevant values."""
 
-        for line in self._lines:
-            line_category_name = line[0].strip().replace(" ", "_").lower()
-
-            if len(line) == 1:
-                continue
-
-            if line_category_name == "climate":
-                # -- odd line = ['Climate', ' User defined Enclosed volume', ' 50,853.1 ft³']
-                setattr(self, "enclosed_volume", line[-1].strip())
-            elif line_category_name == "overheat_temperature":
-                # -- odd line = ['Overheat temperature', ' 77 °F Envelope area/iCFA', ' 1.6']
-                val = line[1].strip().split("Envelope area")[0]
-                setattr(self, "overheat_temperature", val)
-            elif line_category_name == "number_of_occupants":
-                # -- weird note = ['Number of occupants', ' 15 (Design)'],
-                val = line[-1].strip().split(" ")[0]
-                setattr(self, "number_of_occupants", val)
-            else:
-                setattr(self, line_category_name, line[1].strip())
+        self.line_rules.dispatch(
+            self._lines,
+            {
+                "enclosed_volume": self._set_enclosed_volume,
+                "overheat_temperature": self._set_overheat_temperature,
+                "number_of_occupants": self._set_number_of_occupants,
+                "attribute": self._set_attribute,
+            },
+        )
+
+    def _set_enclosed_volume(self, _match: re.Match) -> None:
+        self.enclosed_volume = _match["value"].strip()
+
+    def _set_overheat_temperature(self, _match: re.Match) -> None:
+        self.overheat_temperature = _match["value"].strip().split("Envelope area")[0]
+
+    def _set_number_of_occupants(self, _match: re.Match) -> None:
+        self.number_of_occupants = _match["value"].strip().split(" ")[0]
+
+    def _set_attribute(self, _match: re.Match) -> None:
+        attr_name = _match["name"].strip().replace(" ", "_").lower()
+        setattr(self, attr_name, _match["value"].strip())
@@ -2,16 +2,27 @@
 
 """WUFI-PDF Section: Climate-Summary"""
 
+import re
 from typing import List
 
 from ph_units.unit_type import Unit
 from rich import print
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+
 
 class WufiPDF_ClimateSummary:
     __pdf_heading_string__ = "CLIMATE"  # Note: upper case, not lower
     get_tables = False
 
+    # -- ie: "Longitude: -73.8 ° Average ground surface temperature: 56.2 °F"
+    line_rules = LineRules(
+        {
+            "latitude": r"Latitude:\s*(?P<value>[^ ]+)",
+            "longitude": r"Longitude:\s*(?P<value>[^ ]+)",
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
@@ -37,23 +48,20 @@ class WufiPDF_ClimateSummary:
         ]
         """
 
-        for line in self._lines:
-            line_parts = line.split(":")
-
-            # -- Pull out the data
-            if "Latitude" in line:
-                attribute_name = "latitude"
-                value = line_parts[1].strip().split(" ", 1)[0]
-            elif "Longitude" in line:
-                attribute_name = "longitude"
-                value = line_parts[1].strip().split(" ", 1)[0]
-            else:
-                attribute_name, value = None, None
-
-            # -- Set the attribute
-            if attribute_name and value:
-                try:
-                    setattr(self, attribute_name, float(value))
-                except ValueError:
-                    msg = f"Could not convert '{attribute_name}' value of: {value} to a number?"
-                    raise ValueError(msg)
+        self.line_rules.dispatch(
+            self._lines,
+            {"latitude": self._set_latitude, "longitude": self._set_longitude},
+        )
+
+    def _coordinate(self, _name: str, _match: re.Match) -> float:
+        try:
+            return float(_match["value"])
+        except ValueError:
+            msg = f"Could not convert '{_name}' value of: {_match['value']} to a number?"
+            raise ValueError(msg)
+
+    def _set_latitude(self, _match: re.Match) -> None:
+        self.latitude = self._coordinate("latitude", _match)
+
+    def _set_longitude(self, _match: re.Match) -> None:
+        self.longitude = self._coordinate("longitude", _match)
@@ -8,6 +8,7 @@ from typing import List, Tuple, Type, TypeVar
 
 from ph_units.unit_type import Unit
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
 from NBDM.model.enums import (
     cooling_device_type,
     dhw_tank_device_type,
@@ -30,6 +31,43 @@ class WufiPDF_HvacDeviceType(Enum):
 
 
 class WufiPDF_HvacDevice:
+    # -- The lines to look for in the text of each type of device
+    heat_pump_rules = LineRules(
+        {
+            "cop": (
+                r"(?:Annual heating coefficient of performance \(COP\) |Rated COP 1)"
+                r"(?:.*\[-\])?(?P<value>.*)"
+            ),
+            "coverage": r"Coverage",
+        }
+    )
+    water_storage_rules = LineRules(
+        {
+            "storage_capacity": r"Storage capacity \[gal\](?:.*\[gal\])?(?P<value>.*)",
+            "tank_heat_loss": (
+                r"Specific total thermal storage losses \[Btu/hr F\]"
+                r"(?:.*\[Btu/hr F\])?(?P<value>.*)"
+            ),
+        }
+    )
+    mech_vent_rules = LineRules(
+        {
+            "sensible_recovery": r"Sensible recovery efficiency \[-\](?:.*\[-\])?(?P<value>.*)",
+            "moisture_recovery": r"Humidity recovery efficiency \[-\](?:.*\[-\])?(?P<value>.*)",
+            "quantity": r"Quantity(?:.* )?(?P<value>[^ ]*)$",
+        }
+    )
+    renewable_rules = LineRules(
+        {
+            "annual_energy_production": (
+                r"Photovoltaic / renewable energy \[kWh/yr\](?:.*\[kWh/yr\])?(?P<value>.*)"
+            ),
+        }
+    )
+    electric_heating_rules = LineRules(
+        {"coverage": r"Coverage (?:.*Coverage )?(?P<value>.*)"}
+    )
+
     def __init__(
         self, _device_type: WufiPDF_HvacDeviceType, _device_name: str = ""
     ) -> None:
@@ -90,28 +128,24 @@ class WufiPDF_HvacDevice:
         ]
         """
 
-        for line in self._lines:
-            if "Coverage" in line:
-                # -- line = "Coverage: DHW 0.1, Heating 1.0"
-
-                parts = line.strip().split("Coverage ")
-                # -- parts = ["Coverage", "DHW 0.1, Heating 1.0"]
-
-                if len(parts) < 2:
-                    continue
-
-                coverage_types = parts[-1].strip().split(",")
-                # -- coverage_types = ["DHW 0.1", "Heating 1.0"]
-
-                for coverage_types in coverage_types:
-                    if "DHW" in coverage_types:
-                        # -- coverage_type = "DWH 0.5"
-                        coverage = coverage_types.strip().split(" ")[-1]
-                        self.coverage_hot_water = Unit(coverage, "%")
-                    elif "Heating" in coverage_types:
-                        # -- coverage_type = "Heating 1.0"
-                        coverage = coverage_types.strip().split(" ")[-1]
-                        self.coverage_heating = Unit(coverage, "%")
+        self.electric_heating_rules.dispatch(
+            self._lines, {"coverage": self._set_electric_heating_coverage}
+        )
+
+    def _set_electric_heating_coverage(self, _match: re.Match) -> None:
+        # -- line = "Coverage DHW 0.1, Heating 1.0"
+        coverage_types = _match["value"].strip().split(",")
+        # -- coverage_types = ["DHW 0.1", "Heating 1.0"]
+
+        for coverage_type in coverage_types:
+            if "DHW" in coverage_type:
+                # -- coverage_type = "DWH 0.5"
+                coverage = coverage_type.strip().split(" ")[-1]
+                self.coverage_hot_water = Unit(coverage, "%")
+            elif "Heating" in coverage_type:
+                # -- coverage_type = "Heating 1.0"
+                coverage = coverage_type.strip().split(" ")[-1]
+                self.coverage_heating = Unit(coverage, "%")
 
     def process_heat_pump_text(self) -> None:
         """
@@ -127,18 +161,17 @@ class WufiPDF_HvacDevice:
         WUFI®Passive
         Coverage Cooling 0.5
         """
-        for line in self._lines:
-            if "Annual heating coefficient of performance (COP) [-]" in line:
-                txt = line.split("[-]")[-1].strip()
-                value = self.text_to_value(txt, float, 1.0)
-                self.cop = Unit(value, "BTU/HR-W")
-            elif "Rated COP 1" in line:
-                txt = line.split("[-]")[-1].strip()
-                value = self.text_to_value(txt, float, 1.0)
-                self.cop = Unit(value, "BTU/HR-W")
-            elif "Coverage" in line:
-                coverages = self.process_coverage_line(line)
-                self.coverage_heating, self.coverage_cooling = coverages
+        self.heat_pump_rules.dispatch(
+            self._lines, {"cop": self._set_cop, "coverage": self._set_heat_pump_coverage}
+        )
+
+    def _set_cop(self, _match: re.Match) -> None:
+        value = self.text_to_value(_match["value"].strip(), float, 1.0)
+        self.cop = Unit(value, "BTU/HR-W")
+
+    def _set_heat_pump_coverage(self, _match: re.Match) -> None:
+        coverages = self.process_coverage_line(_match.string)
+        self.coverage_heating, self.coverage_cooling = coverages
 
     def process_boiler_text(self) -> None:
         pass
@@ -155,15 +188,21 @@ class WufiPDF_HvacDevice:
         Coverage DHW
         ]
         """
-        for line in self._lines:
-            if "Storage capacity [gal]" in line:
-                txt = line.split("[gal]")[-1].strip()
-                value = self.text_to_value(txt, float, 0.0)
-                self.storage_capacity = Unit(value, "GAL")
-            elif "Specific total thermal storage losses [Btu/hr F]" in line:
-                txt = line.split("[Btu/hr F]")[-1].strip()
-                value = self.text_to_value(txt, float, 0.0)
-                self.tank_heat_loss = Unit(value, "BTU/HR-F")
+        self.water_storage_rules.dispatch(
+            self._lines,
+            {
+                "storage_capacity": self._set_storage_capacity,
+                "tank_heat_loss": self._set_tank_heat_loss,
+            },
+        )
+
+    def _set_storage_capacity(self, _match: re.Match) -> None:
+        value = self.text_to_value(_match["value"].strip(), float, 0.0)
+        self.storage_capacity = Unit(value, "GAL")
+
+    def _set_tank_heat_loss(self, _match: re.Match) -> None:
+        value = self.text_to_value(_match["value"].strip(), float, 0.0)
+        self.tank_heat_loss = Unit(value, "BTU/HR-F")
 
     def process_mech_vent_text(self) -> None:
         """self._lines = [
@@ -186,20 +225,29 @@ class WufiPDF_HvacDevice:
         ]
         """
 
-        for line in self._lines:
-            if "Sensible recovery efficiency [-]" in line:
-                value = self.text_to_value(line.split("[-]")[-1], float, 0.0)
-                if value < 1.0:
-                    value = value * 100
-                self.sensible_recovery = Unit(value, "%")
-            elif "Humidity recovery efficiency [-]" in line:
-                value = self.text_to_value(line.split("[-]")[-1], float, 0.0)
-                if value < 1.0:
-                    value = value * 100
-                self.moisture_recovery = Unit(value, "%")
-            elif "Quantity" in line:
-                value = self.text_to_value(line.split(" ")[-1], int, 1)
-                self.quantity = value
+        self.mech_vent_rules.dispatch(
+            self._lines,
+            {
+                "sensible_recovery": self._set_sensible_recovery,
+                "moisture_recovery": self._set_moisture_recovery,
+                "quantity": self._set_quantity,
+            },
+        )
+
+    def _recovery_efficiency(self, _match: re.Match) -> Unit:
+        value = self.text_to_value(_match["value"], float, 0.0)
+        if value < 1.0:
+            value = value * 100
+        return Unit(value, "%")
+
+    def _set_sensible_recovery(self, _match: re.Match) -> None:
+        self.sensible_recovery = self._recovery_efficiency(_match)
+
+    def _set_moisture_recovery(self, _match: re.Match) -> None:
+        self.moisture_recovery = self._recovery_efficiency(_match)
+
+    def _set_quantity(self, _match: re.Match) -> None:
+        self.quantity = self.text_to_value(_match["value"], int, 1)
 
     def process_renewable_text(self) -> None:
         """self._lines = [
@@ -208,11 +256,14 @@ class WufiPDF_HvacDevice:
         Utilization factor [-]1
         ]
         """
-        for line in self._lines:
-            if "Photovoltaic / renewable energy [kWh/yr]" in line:
-                txt = line.split("[kWh/yr]")[-1].strip().replace(",", "")
-                value = self.text_to_value(txt, float, 0.0)
-                self.annual_energy_production = Unit(value, "KWH")
+        self.renewable_rules.dispatch(
+            self._lines, {"annual_energy_production": self._set_annual_energy_production}
+        )
+
+    def _set_annual_energy_production(self, _match: re.Match) -> None:
+        txt = _match["value"].strip().replace(",", "")
+        value = self.text_to_value(txt, float, 0.0)
+        self.annual_energy_production = Unit(value, "KWH")
 
     def process_section_text(self) -> None:
         if self.device_type is WufiPDF_HvacDeviceType.HEAT_PUMP:
@@ -329,6 +380,14 @@ class WufiPDF_HVAC:
     __pdf_heading_string__ = "HVAC"
     get_tables = False
 
+    # -- The 'System' headings which start each group of devices, or distribution
+    system_rules = LineRules(
+        {
+            "devices": r"^(?=.*System \d).*Device",
+            "distribution": r"^(?=.*System \d).*Distribution",
+        }
+    )
+
     def __init__(self) -> None:
         self._lines: List[str] = []
         self._tables = []
@@ -366,12 +425,12 @@ class WufiPDF_HVAC:
 
         # -- Separate out each System's text into separate sections
         for line in self._lines:
-            match = re.search(r"System \d", line)  # -- might be a 'System' heading
-            if match and "Device" in line:
+            rule_name, _ = self.system_rules.match(line)
+            if rule_name == "devices":
                 # -- Start a new 'System' (group of devices)
                 section = WufiPDF_HvacDevices()
                 self._device_groups.append(section)
-            elif match and "Distribution" in line:
+            elif rule_name == "distribution":
                 section = WufiPDF_HvacDistribution()
                 self._distribution_groups.append(section)
             else:
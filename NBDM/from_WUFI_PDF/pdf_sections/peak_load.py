@@ -2,17 +2,19 @@
 
 """WUFI-PDF Section: Peak Heating and Cooling Load"""
 
-
+import re
 from typing import Any, List, Optional
 
-from ph_units.converter import (
-    UnitTypeNameNotFound,
-    _standardize_unit_name,
-    unit_type_alias_dict,
-)
-from ph_units.parser import parse_input
 from ph_units.unit_type import Unit
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+from NBDM.from_WUFI_PDF.pdf_sections._units import text_to_unit
+
+
+def _attr_name(_text: str) -> str:
+    """Return the PDF text as an attribute name. ie: 'Cooling load - sensible' -> 'cooling_load_sensible'"""
+    return _text.strip().replace(" - ", "_").lower().replace(" ", "_")
+
 
 class PeakLoad:
     def __init__(self, _name: str) -> None:
@@ -41,15 +43,7 @@ class PeakLoad:
             return super().__setattr__(__name, __value)
 
         # -- Try and pull out any unit part of the string
-        val, unit = parse_input(__value)
-        if not unit:
-            return super().__setattr__(__name, __value)
-
-        try:
-            unit = _standardize_unit_name(unit, unit_type_alias_dict)
-            return super().__setattr__(__name, Unit(val, unit))
-        except UnitTypeNameNotFound:
-            return super().__setattr__(__name, __value)
+        return super().__setattr__(__name, text_to_unit(__value))
 
     @property
     def total_cooling_load(self) -> Unit:
@@ -79,6 +73,21 @@ class WufiPDF_PeakHeatingAndCoolingLoad:
     __pdf_heading_string__ = "HEATING LOAD COOLING LOAD"
     get_tables = False
 
+    # -- The two heating-load columns, and the cooling-load column, are all run together
+    line_rules = LineRules(
+        {
+            # -- ie: "Cooling load - latent: 0 Btu/hr"
+            "cooling_load_latent": r"^\s*Cooling load - latent:(?P<value>[^:]*)$",
+            # -- ie: "Relevant heating load: 747,679 Btu/hr Relevant cooling load: 57,023.3 Btu/hr"
+            "cooling_load": r"^\s*Relevant heating load:[^:]* Btu/hr [^:]*:(?P<value>[^:]*)$",
+            # -- ie: "Total heat loss: 763,630.7 Btu/hr 454,825.6 Btu/hr Total heat gains cooling: 28,765.3 Btu/hr"
+            "loads": (
+                r"^(?P<htg_name>[^:]*):(?P<htg_value_1>.*?) Btu/hr (?P<htg_value_2>.*?) Btu/hr "
+                r"(?P<clg_name>[^:]*):(?P<clg_value>[^:]*)$"
+            ),
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
@@ -106,64 +115,27 @@ class WufiPDF_PeakHeatingAndCoolingLoad:
         Specific heating load: 144.7 Btu/hr ft² Specific maximum cooling load: 11 Btu/hr ft²
         """
 
-        for line in self._lines:
-            line = line.split(":")
-            if len(line) < 2:
-                continue
+        self.line_rules.dispatch(
+            self._lines,
+            {
+                "cooling_load_latent": self._set_cooling_load_latent,
+                "cooling_load": self._set_cooling_load,
+                "loads": self._set_loads,
+            },
+        )
+
+    def _set_cooling_load_latent(self, _match: re.Match) -> None:
+        self.cooling_load.cooling_load_latent = _match["value"]
+
+    def _set_cooling_load(self, _match: re.Match) -> None:
+        self.cooling_load.cooling_load = _match["value"]
+
+    def _set_loads(self, _match: re.Match) -> None:
+        htg_attr_name = _attr_name(_match["htg_name"])
+        if htg_attr_name not in self.heating_load_1.__dict__:
+            # -- Ignore anything that isn't one of the object's attributes.
+            return
 
-            htg_attr_name = line[0].replace(" - ", "_").lower().strip().replace(" ", "_")
-
-            # -- Handle the weird lines...
-            if htg_attr_name == "heating_load":
-                # line = ["Heating load",  "747,679 Btu/hr 448,862.4 Btu/hr Cooling load - sensible", "57,023.3 Btu/hr"]
-                _, middle, clg_attr_value = line
-                htg_attr_value_1, htg_attr_value_2, clg_attr_name = middle.split(
-                    " Btu/hr "
-                )
-                clg_attr_name = (
-                    clg_attr_name.replace(" - ", "_").lower().strip().replace(" ", "_")
-                )
-                htg_attr_value_1 = str(htg_attr_value_1) + " BTU/HR"
-                htg_attr_value_2 = str(htg_attr_value_2) + " BTU/HR"
-            elif htg_attr_name == "cooling_load_latent":
-                # line = ["Cooling load - latent", "0 Btu/hr"]
-                clg_attr_name, clg_attr_value = line
-                clg_attr_name = (
-                    clg_attr_name.replace(" - ", "_").lower().strip().replace(" ", "_")
-                )
-                htg_attr_name = None
-                htg_attr_value_1 = None
-                htg_attr_value_2 = None
-            elif htg_attr_name == "relevant_heating_load":
-                # line = ["Relevant heating load", "747,679 Btu/hr Relevant cooling load", "57,023.3 Btu/hr"]
-                _, middle, clg_attr_value = line
-                _, clg_attr_name = middle.split(" Btu/hr ")
-                clg_attr_name = "cooling_load"
-                htg_attr_name = None
-                htg_attr_value_1 = None
-                htg_attr_value_2 = None
-            elif htg_attr_name == "Specific_heating_load":
-                # line = ["Specific heating load", "144.7 Btu/hr ft² Specific maximum cooling load", "11 Btu/hr ft²"]
-                # - Ignore
-                continue
-            elif htg_attr_name not in self.heating_load_1.__dict__:
-                # -- Ignore anything that isn't one of the object's attributes.
-                continue
-            else:
-                # -- Handle the 'normal' lines
-                try:
-                    _, middle, clg_attr_value = line
-                except Exception as e:
-                    print("ERROR:", line)
-                    raise Exception(e)
-
-                htg_attr_value_1, htg_attr_value_2, clg_attr_name = middle.split(
-                    " Btu/hr "
-                )
-                clg_attr_name = clg_attr_name.lower().strip().replace(" ", "_")
-                htg_attr_value_1 = str(htg_attr_value_1) + " BTU/HR"
-                htg_attr_value_2 = str(htg_attr_value_2) + " BTU/HR"
-
-            self.heating_load_1.__setattr__(htg_attr_name, htg_attr_value_1)
-            self.heating_load_2.__setattr__(htg_attr_name, htg_attr_value_2)
-            self.cooling_load.__setattr__(clg_attr_name, clg_attr_value)
+        setattr(self.heating_load_1, htg_attr_name, f"{_match['htg_value_1']} BTU/HR")
+        setattr(self.heating_load_2, htg_attr_name, f"{_match['htg_value_2']} BTU/HR")
+        setattr(self.cooling_load, _attr_name(_match["clg_name"]), _match["clg_value"])
@@ -4,14 +4,10 @@
 
 from typing import Any, Dict, List
 
-from ph_units.converter import (
-    UnitTypeNameNotFound,
-    _standardize_unit_name,
-    unit_type_alias_dict,
-)
-from ph_units.parser import parse_input
 from ph_units.unit_type import Unit
 
+from NBDM.from_WUFI_PDF.pdf_sections._units import text_to_unit
+
 # -----------------------------------------------------------------------------
 # -- Subsections --
 
@@ -27,15 +23,7 @@ class _subsection_base:
             return super().__setattr__(__name, __value)
 
         # -- Try and pull out any unit part of the string
-        val, unit = parse_input(__value)
-        if not unit:
-            return super().__setattr__(__name, __value)
-
-        try:
-            unit = _standardize_unit_name(unit, unit_type_alias_dict)
-            return super().__setattr__(__name, Unit(val, unit))
-        except UnitTypeNameNotFound:
-            return super().__setattr__(__name, __value)
+        return super().__setattr__(__name, text_to_unit(__value))
 
     def add_line(self, line: str) -> None:
         self._lines.append(line)
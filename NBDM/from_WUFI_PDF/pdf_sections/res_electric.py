@@ -8,6 +8,8 @@ from typing import List
 from ph_units.unit_type import Unit
 from PHX.model.enums.elec_equip import ElectricEquipmentType
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+
 
 class WufiPDF_ElectricAppliance:
     """Class to hold data for a single electric appliance."""
@@ -47,6 +49,18 @@ class WufiPDF_ResidentialElectric:
         "User defined MELs": ElectricEquipmentType.CUSTOM_MEL,
     }
 
+    # -- ie: "Laundry - dryer 4 yes 3.9 1467.5 0 9012.4"
+    # -- Rows without a number in the 'Electric demand' column are skipped.
+    line_rules = LineRules(
+        {
+            "appliance": (
+                r"^\s*(?P<name>"
+                + "|".join(re.escape(name) for name in device_map)
+                + r")\s*(?P<quantity>\d+)\s+\S+\s+\S+\s+(?P<annual_demand>[0-9.,]+)(?:\s|$)"
+            )
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
@@ -81,26 +95,13 @@ class WufiPDF_ResidentialElectric:
         ...
         """
 
-        for line in self._lines:
-            parts = re.split(
-                r"(\d+)\s+(.+)", line, 1
-            )  # -- Split on first space character after the first number
-
-            if len(parts) != 3:
-                continue
-
-            # -- Parse the line
-            appliance_type_name = parts[0].strip()
-            if nbdm_appliance_type := self.device_map.get(appliance_type_name, None):
-                # -- line = ["Laundry - dryer ", "4 ",  "yes 3.9 1467.5 0 9012.4"]
-
-                quantity = int(parts[1].strip())
-                _, _, annual_demand, _, _ = parts[2].strip().split(" ")
-                annual_demand = Unit(annual_demand, "KWH")
-
-                # -- Create the new appliance and add to the collection
-                new_appliance = WufiPDF_ElectricAppliance(
-                    nbdm_appliance_type, quantity, annual_demand
-                )
+        self.line_rules.dispatch(self._lines, {"appliance": self._add_appliance})
 
-                self._appliances.append(new_appliance)
+    def _add_appliance(self, _match: re.Match) -> None:
+        # -- Create the new appliance and add to the collection
+        new_appliance = WufiPDF_ElectricAppliance(
+            self.device_map[_match["name"]],
+            int(_match["quantity"]),
+            Unit(_match["annual_demand"], "KWH"),
+        )
+        self._appliances.append(new_appliance)
@@ -2,12 +2,20 @@
 
 """WUFI-PDF Section: Property / Site"""
 
+import re
 from typing import List
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+
 
 class WufiPDF_PropertySite:
     __pdf_heading_string__ = "Property/Site"
     get_tables = False
+    # -- All the data is on the first page. The pages after it hold the
+    # -- un-headed assembly, window and appliance reports.
+    max_pages = 1
+
+    line_rules = LineRules({"data_set": r"^[^:]*Climate Location[^:]*:(?P<value>[^:]*)"})
 
     def __init__(self) -> None:
         self._lines = []
@@ -36,9 +44,7 @@ class WufiPDF_PropertySite:
 
         self.zone_passive_house = "N/A"  # Phius doesn't use this
 
-        for line in self._lines:
-            line_parts = line.split(":")
-            if "Climate Location" in line_parts[0]:
-                attribute_name = "data_set"
-                value = line_parts[1].strip()
-                setattr(self, attribute_name, value)
+        self.line_rules.dispatch(self._lines, {"data_set": self._set_data_set})
+
+    def _set_data_set(self, _match: re.Match) -> None:
+        self.data_set = _match["value"].strip()
@@ -2,47 +2,70 @@
 
 """WUFI-PDF Section: Site Energy [Monthly]"""
 
+from __future__ import annotations
 
 import math
-from typing import List, Union
+from array import array
+from typing import Iterable, List, Union
 
 from ph_units.unit_type import Unit
 
+MONTH_CODES = (
+    "JAN",
+    "FEB",
+    "MAR",
+    "APR",
+    "MAY",
+    "JUN",
+    "JUL",
+    "AUG",
+    "SEP",
+    "OCT",
+    "NOV",
+    "DEC",
+)
+
 
 class SiteEnergyMonthlyTableRow:
-    """A single row of data from the Site-Energy-Monthly table"""
-
-    month_codes = [
-        "JAN",
-        "FEB",
-        "MAR",
-        "APR",
-        "MAY",
-        "JUN",
-        "JUL",
-        "AUG",
-        "SEP",
-        "OCT",
-        "NOV",
-        "DEC",
-    ]
-
-    def __init__(self):
-        for month_code in self.month_codes:
-            setattr(self, month_code, 0.0)
+    """A single row of data from the Site-Energy-Monthly table.
+
+    The row does not hold any data itself, it is a view of one row of its
+    parent table's array. The months can be read by name (ie: 'row.JAN').
+    """
+
+    month_codes = list(MONTH_CODES)
+    month_index = {name: i for i, name in enumerate(MONTH_CODES)}
+
+    def __init__(self, _table: SiteEnergyMonthlyTable, _row_number: int) -> None:
+        self._table = _table
+        self._start = _row_number * len(MONTH_CODES)
+
+    def __getattr__(self, _name: str) -> float:
+        if _name not in self.month_index:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{_name}'"
+            )
+        return self._table.values[self._start + self.month_index[_name]]
 
     @property
     def data(self) -> List[float]:
         """Return a list of the data in month-order."""
-        return [getattr(self, n) for n in self.month_codes]
+        return self._table.values[self._start : self._start + len(MONTH_CODES)].tolist()
+
+    @property
+    def is_valid(self) -> bool:
+        """Return False if any of the row's data could not be read as a number."""
+        return not math.isnan(self._total)
+
+    @property
+    def _total(self) -> float:
+        return sum(self._table.values[self._start : self._start + len(MONTH_CODES)])
 
     @property
     def total(self) -> float:
         """Return the total of all the row's data."""
-        if all(isinstance(d, (int, float)) for d in self.data):
-            return sum(self.data)
-        else:
-            return 0.0
+        total = self._total
+        return 0.0 if math.isnan(total) else total
 
     def get_month_name(self, i: int) -> str:
         """Return the month-name (code) by its number (0-based)."""
@@ -67,58 +90,97 @@ class SiteEnergyMonthlyTableRow:
             return _data
 
     def process_pdf_table_row_data(self, _pdf_row_data: List[str]) -> None:
-        """Clean and organize all PDF input data."""
+        """Clean and organize all PDF input data.
+
+        Any item which is not a number is stored as 'nan', which marks the
+        whole row as invalid (and so its total as 0.0).
+        """
         row_data = _pdf_row_data[1:]
         for i, data_item in enumerate(row_data):
             month_name = self.get_month_name(i)
-            setattr(self, month_name, self.clean_input_data(data_item))
+            value = self.clean_input_data(data_item)
+            if isinstance(value, str):
+                value = math.nan
+            self._table.values[self._start + self.month_index[month_name]] = value
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(data={self.data})"
 
 
 class SiteEnergyMonthlyTable:
-    """A Table of Data"""
+    """A Table of Data.
+
+    All of the table's values are stored in a single fixed-shape (rows x 12 months)
+    array, in row-order, so the totals and monthly profiles do not need to look
+    up any attributes.
+    """
+
+    consumption_row_names = (
+        "space_heating",
+        "space_cooling",
+        "hot_water",
+        "auxiliary_energy_fans",
+        "large_appliances",
+        "lighting",
+        "miscellaneous_loads",
+    )
+    production_row_names = ("renewable_electricity_production",)
+    row_names = consumption_row_names + production_row_names
 
     def __init__(self) -> None:
-        self.space_heating = SiteEnergyMonthlyTableRow()
-        self.space_cooling = SiteEnergyMonthlyTableRow()
-        self.hot_water = SiteEnergyMonthlyTableRow()
-        self.auxiliary_energy_fans = SiteEnergyMonthlyTableRow()
-        self.large_appliances = SiteEnergyMonthlyTableRow()
-        self.lighting = SiteEnergyMonthlyTableRow()
-        self.miscellaneous_loads = SiteEnergyMonthlyTableRow()
-        self.renewable_electricity_production = SiteEnergyMonthlyTableRow()
+        self.values = array("d", bytes(8 * len(self.row_names) * len(MONTH_CODES)))
+        self.row_index = {name: i for i, name in enumerate(self.row_names)}
+        for i, row_name in enumerate(self.row_names):
+            setattr(self, row_name, SiteEnergyMonthlyTableRow(self, i))
 
     def get_row_data_type_name(self, _row_data: List[str]) -> str:
         """Return the name of the row-type based on the first item in the row-data input."""
         return str(_row_data[0]).strip().replace(" ", "_").replace("/", "_").lower()
 
+    def get_row(self, _row_name: str) -> SiteEnergyMonthlyTableRow:
+        """Return the row with the name given. ie: 'space_heating'"""
+        return getattr(self, _row_name)
+
     def process_pdf_table_data(self, _pdf_data: List[List[str]]) -> None:
         """Clean and organize all of the PDF table data found"""
 
         for row_data in _pdf_data:
             # -- Find the right row to add the data to
             row_type = self.get_row_data_type_name(row_data)
-            if not (row := getattr(self, row_type, None)):
+            if row_type not in self.row_index:
                 continue
-            row.process_pdf_table_row_data(row_data)
+            self.get_row(row_type).process_pdf_table_row_data(row_data)
+
+    def monthly_totals(self, _row_names: Iterable[str]) -> List[float]:
+        """Return the total of each month (column) for the rows given.
+
+        Any invalid rows (with data which is not a number) are left out.
+        """
+        totals = [0.0] * len(MONTH_CODES)
+        for row in (self.get_row(name) for name in _row_names):
+            if row.is_valid:
+                totals = [a + b for a, b in zip(totals, row.data)]
+        return totals
 
     @property
     def consumption_rows(self) -> List[SiteEnergyMonthlyTableRow]:
         """Return a list of the rows with energy consumption data"""
-        return [
-            v
-            for k, v in self.__dict__.items()
-            if (k != "renewable_electricity_production" and not k.startswith("_"))
-        ]
+        return [self.get_row(name) for name in self.consumption_row_names]
 
     @property
     def production_rows(self) -> List[SiteEnergyMonthlyTableRow]:
         """Return a list of the rows with energy production data"""
-        return [
-            v for k, v in self.__dict__.items() if k == "renewable_electricity_production"
-        ]
+        return [self.get_row(name) for name in self.production_row_names]
+
+    @property
+    def monthly_consumption_kwh(self) -> List[float]:
+        """Return the total energy consumption (KWH) of each month."""
+        return self.monthly_totals(self.consumption_row_names)
+
+    @property
+    def monthly_production_kwh(self) -> List[float]:
+        """Return the total energy production (KWH) of each month."""
+        return self.monthly_totals(self.production_row_names)
 
     @property
     def total_consumption_kwh(self) -> Unit:
@@ -141,6 +203,11 @@ class SiteEnergyMonthlyTable:
         return self.total_production_kwh.as_a("KBTU")
 
 
+def _to_kbtu(_values_kwh: Iterable[float]) -> List[Unit]:
+    """Return a list of KBTU Units from the KWH values."""
+    return [Unit(v, "KWH").as_a("KBTU") for v in _values_kwh]
+
+
 class WufiPDF_SiteEnergyMonthly:
     __pdf_heading_string__ = "SITE ENERGY MONTHLY REPORT"
     get_tables = True
@@ -177,6 +244,21 @@ class WufiPDF_SiteEnergyMonthly:
         """Return the total energy consumption (KBTU)"""
         return self.table_electricity_kwh.total_consumption_kbtu
 
+    @property
+    def monthly_consumption_gas(self) -> List[Unit]:
+        """Return the energy consumption (KBTU) of each month."""
+        return _to_kbtu(self.table_gas_kwh.monthly_consumption_kwh)
+
+    @property
+    def monthly_consumption_electricity(self) -> List[Unit]:
+        """Return the energy consumption (KBTU) of each month."""
+        return _to_kbtu(self.table_electricity_kwh.monthly_consumption_kwh)
+
+    @property
+    def monthly_production_solar_photovoltaic(self) -> List[Unit]:
+        """Return the energy production (KBTU) of each month."""
+        return _to_kbtu(self.table_electricity_kwh.monthly_production_kwh)
+
     @property
     def consumption_district_heat(self) -> Unit:
         """Return 0.0"""
@@ -2,16 +2,48 @@
 
 """WUFI-PDF Section: Specific Heating/Cooling Monthly Energy Demand"""
 
+import re
 from typing import List
 
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
 
 class WufiPDF_SpecificMonthlyDemand:
     __pdf_heading_string__ = "SPECIFIC HEAT/COOLING DEMAND MONTHLY"
     get_tables = False
 
+    # -- ie: "January 1.4 0"
+    line_rules = LineRules(
+        {
+            "month": (
+                r"^(?P<month>"
+                + "|".join(MONTH_NAMES)
+                + r") (?P<heating>[-0-9.,]+) (?P<cooling>[-0-9.,]+)$"
+            )
+        }
+    )
+
     def __init__(self) -> None:
         self._lines = []
         self._tables = []
+        # -- Specific demand [kBtu/ft²] of each month, JAN-DEC
+        self.heating_kbtu_ft2: List[float] = [0.0] * len(MONTH_NAMES)
+        self.cooling_kbtu_ft2: List[float] = [0.0] * len(MONTH_NAMES)
 
     def add_line(self, _line: str) -> None:
         self._lines.append(_line)
@@ -20,4 +52,18 @@ class WufiPDF_SpecificMonthlyDemand:
         self._tables.append(_table)
 
     def process_section_text(self) -> None:
-        pass
+        """
+        Heating Cooling
+        Month
+        [kBtu/ft²] [kBtu/ft²]
+        January 1.4 0
+        February 0.7 0
+        ...
+        December 1.2 0
+        """
+        self.line_rules.dispatch(self._lines, {"month": self._set_month})
+
+    def _set_month(self, _match: re.Match) -> None:
+        i = MONTH_NAMES.index(_match["month"])
+        self.heating_kbtu_ft2[i] = float(_match["heating"].replace(",", ""))
+        self.cooling_kbtu_ft2[i] = float(_match["cooling"].replace(",", ""))
@@ -3,7 +3,7 @@
 
 """Functions to create NBDM_BuildingSegmentPerformance objects from WUFI-PDF data."""
 
-from typing import Optional
+from typing import List, Optional
 
 from ph_units.unit_type import Unit
 
@@ -19,6 +19,9 @@ from NBDM.from_WUFI_PDF.pdf_sections.peak_load import (
 from NBDM.from_WUFI_PDF.pdf_sections.site_energy_monthly import (
     WufiPDF_SiteEnergyMonthly,
 )
+from NBDM.from_WUFI_PDF.pdf_sections.specific_monthly_demand import (
+    WufiPDF_SpecificMonthlyDemand,
+)
 from NBDM.from_WUFI_PDF.renewable_systems import (
     create_NBDM_Renewable_Systems_from_WufiPDF,
 )
@@ -26,6 +29,7 @@ from NBDM.model.performance import (
     NBDM_AnnualCoolingDemandEnergy,
     NBDM_AnnualHeatingDemandEnergy,
     NBDM_BuildingSegmentPerformance,
+    NBDM_MonthlySeries,
     NBDM_PeakCoolingLoad,
     NBDM_PeakHeatingLoad,
     NBDM_SiteEnergy,
@@ -47,6 +51,24 @@ def build_NBDM_siteEnergyFromWufiPDF(
     )
 
 
+def build_NBDM_monthlyDemandFromWufiPDF(
+    _annual_demand: Unit, _specific_monthly_demand: List[float]
+) -> NBDM_MonthlySeries:
+    """Return the annual demand split up by month.
+
+    WUFI only reports the monthly demand per floor area, rounded to 0.1 kBtu/ft², so
+    these are used as the monthly 'profile' for the annual demand. This way the
+    months always add up to the annual demand.
+    """
+    profile_total = sum(_specific_monthly_demand)
+    if not profile_total:
+        return NBDM_MonthlySeries(unit=_annual_demand.unit)
+    return NBDM_MonthlySeries(
+        [_annual_demand.value * v / profile_total for v in _specific_monthly_demand],
+        _annual_demand.unit,
+    )
+
+
 def get_photovoltaic_production_from_hvac_devices(
     _pdf_data: PDFSectionsCollection,
 ) -> Unit:
@@ -128,6 +150,15 @@ def build_NBDM_performanceFromWufiPDF(
         pv_yield_kbtu = get_photovoltaic_production_from_hvac_devices(_pdf_data)
         new_nbdm_obj.site_energy.production_solar_photovoltaic = pv_yield_kbtu
 
+        new_nbdm_obj.monthly.site_energy_consumption_gas = NBDM_MonthlySeries.from_units(
+            site_energy_section.monthly_consumption_gas
+        )
+        new_nbdm_obj.monthly.site_energy_consumption_electricity = (
+            NBDM_MonthlySeries.from_units(
+                site_energy_section.monthly_consumption_electricity
+            )
+        )
+
     # -------------------------------------------------------------------------
     load_section: Optional[WufiPDF_PeakHeatingAndCoolingLoad]
     if load_section := _pdf_data.get_section(WufiPDF_PeakHeatingAndCoolingLoad):
@@ -148,4 +179,16 @@ def build_NBDM_performanceFromWufiPDF(
             demand_section.cooling_demand
         )
 
+        # -- The monthly demand is only reported per floor area, so split the annual by it
+        monthly_demand_section: Optional[WufiPDF_SpecificMonthlyDemand]
+        if monthly_demand_section := _pdf_data.get_section(WufiPDF_SpecificMonthlyDemand):
+            new_nbdm_obj.monthly.heating_demand = build_NBDM_monthlyDemandFromWufiPDF(
+                new_nbdm_obj.annual_heating_energy_demand.heating_demand,
+                monthly_demand_section.heating_kbtu_ft2,
+            )
+            new_nbdm_obj.monthly.cooling_demand = build_NBDM_monthlyDemandFromWufiPDF(
+                new_nbdm_obj.annual_cooling_energy_demand.total_cooling_demand,
+                monthly_demand_section.cooling_kbtu_ft2,
+            )
+
     return new_nbdm_obj
@@ -10,6 +10,9 @@ from NBDM.from_WUFI_PDF.pdf_sections.project_data import WufiPDF_ProjectData
 from NBDM.from_WUFI_PDF.pdf_sections.site import WufiPDF_PropertySite
 from NBDM.model.site import NBDM_Climate, NBDM_Location, NBDM_ProjectAddress, NBDM_Site
 
+# -- The only PDF-Sections needed to create the NBDM_Site
+SITE_PDF_SECTIONS = (WufiPDF_ClimateSummary, WufiPDF_ProjectData, WufiPDF_PropertySite)
+
 
 def create_NBDM_Climate_from_WufiPDF(_pdf_data: PDFSectionsCollection) -> NBDM_Climate:
     """Create NBDM_Climate object from WUFI-PDF data."""
@@ -11,6 +11,9 @@ from NBDM.from_WUFI_PDF.pdf_sections.project_data import (
 )
 from NBDM.model.team import NBDM_Team, NBDM_TeamContactInfo, NBDM_TeamMember
 
+# -- The only PDF-Sections needed to create the NBDM_Team
+TEAM_PDF_SECTIONS = (WufiPDF_ProjectData,)
+
 
 def team_member_contact_info_from_WufiPDF_data(
     _pdf_data: WufiPDF_BuildingAddress,
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Function to create an NBDM model from a compact binary file."""
+
+import pathlib
+
+from NBDM.from_binary.unpacker import unpack
+from NBDM.model.project import NBDM_Project
+
+
+def NBDM_Project_from_binary_file(_binary_file: pathlib.Path) -> NBDM_Project:
+    """Build an NBDM_Project from a binary file written by 'NBDM_Project_to_binary_file'.
+
+    Arguments:
+    ----------
+        * _binary_file: (pathlib.Path) The binary file to read.
+
+    Returns:
+    --------
+        * (NBDM_Project) The new NBDM_Project.
+    """
+    with _binary_file.open("rb") as f:
+        data = f.read()
+    return NBDM_Project.from_dict(unpack(data))
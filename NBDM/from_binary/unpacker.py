@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Unpack the compact binary format (see: 'NBDM.to_binary.packer') back into plain data."""
+
+import struct
+from typing import Any, Dict, List, Tuple
+
+from NBDM.to_binary.packer import (
+    FLOAT64,
+    FORMAT_VERSION,
+    HEADER,
+    MAGIC,
+    TAG_DICT,
+    TAG_FALSE,
+    TAG_FLOAT,
+    TAG_FLOAT_LIST,
+    TAG_INT,
+    TAG_LIST,
+    TAG_NONE,
+    TAG_RECORD,
+    TAG_STR,
+    TAG_STR_REF,
+    TAG_TRUE,
+)
+
+
+class BinaryFormatError(Exception):
+    def __init__(self, _msg: str, _pos: int):
+        self.message = f"\n\tError reading the binary NBDM data at byte {_pos}: {_msg}"
+        super().__init__(self.message)
+
+
+def _unpack_value(_data: bytes, _pos: int) -> Tuple[Any, int]:
+    """Return the value packed at the position in the data, and the position after it.
+
+    This is the hot-path of loading a binary file, so everything is kept in local
+    variables and the most common tags are checked first, rather than dispatching
+    each value through a table of reader methods.
+    """
+    data = _data
+    data_length = len(data)
+    pos = _pos
+    strings: List[str] = []
+    schemas: List[Tuple[str, ...]] = []
+    unpack_float = FLOAT64.unpack_from
+
+    def read_varint() -> int:
+        nonlocal pos
+        # -- Almost all of the counts and indexes fit in a single byte
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_str() -> str:
+        nonlocal pos
+        length = read_varint()
+        start = pos
+        end = start + length
+        if end > data_length:
+            raise BinaryFormatError("Unexpected end of the data.", start)
+        try:
+            value = data[start:end].decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise BinaryFormatError(f"Invalid UTF-8 text: {e}", start)
+        pos = end
+        strings.append(value)
+        return value
+
+    def read_table_item(_table: List[Any], _name: str) -> Any:
+        index = read_varint()
+        try:
+            return _table[index]
+        except IndexError:
+            raise BinaryFormatError(f"Unknown {_name} index: {index}", pos)
+
+    def read_values(_keys: Tuple[str, ...]) -> Dict[str, Any]:
+        nonlocal pos
+        # -- Most of the values in a record are floats, repeated strings or other
+        # -- records (ie: a Unit), so those are read in right here.
+        values = {}
+        for key in _keys:
+            tag = data[pos]
+            pos += 1
+            if tag == TAG_FLOAT:
+                values[key] = unpack_float(data, pos)[0]
+                pos += 8
+            elif tag == TAG_STR_REF:
+                values[key] = read_table_item(strings, "string")
+            elif tag == TAG_RECORD:
+                values[key] = read_values(read_table_item(schemas, "schema"))
+            else:
+                pos -= 1
+                values[key] = read()
+        return values
+
+    def read() -> Any:
+        nonlocal pos
+        tag = data[pos]
+        pos += 1
+
+        if tag == TAG_STR_REF:
+            return read_table_item(strings, "string")
+        elif tag == TAG_RECORD:
+            return read_values(read_table_item(schemas, "schema"))
+        elif tag == TAG_FLOAT:
+            value = unpack_float(data, pos)[0]
+            pos += 8
+            return value
+        elif tag == TAG_STR:
+            return read_str()
+        elif tag == TAG_DICT:
+            keys = tuple(read() for _ in range(read_varint()))
+            for key in keys:
+                if type(key) is not str:
+                    raise BinaryFormatError(f"Dict keys must be str, not: {key!r}", pos)
+            schemas.append(keys)
+            return read_values(keys)
+        elif tag == TAG_FLOAT_LIST:
+            count = read_varint()
+            values = list(struct.unpack_from(f"<{count}d", data, pos))
+            pos += 8 * count
+            return values
+        elif tag == TAG_LIST:
+            return [read() for _ in range(read_varint())]
+        elif tag == TAG_INT:
+            value = read_varint()
+            return -((value + 1) >> 1) if value & 1 else value >> 1
+        elif tag == TAG_NONE:
+            return None
+        elif tag == TAG_FALSE:
+            return False
+        elif tag == TAG_TRUE:
+            return True
+        raise BinaryFormatError(f"Unknown value-tag: {tag}", pos - 1)
+
+    try:
+        value = read()
+    except (IndexError, struct.error):
+        raise BinaryFormatError("Unexpected end of the data.", pos)
+    return value, pos
+
+
+def unpack(_data: bytes) -> Any:
+    """Return the plain data (see: 'serialization.to_dict') unpacked from the binary format.
+
+    Arguments:
+    ----------
+        * _data: (bytes) The packed data, including the header.
+
+    Returns:
+    --------
+        * (Any) The unpacked data.
+    """
+    if len(_data) < HEADER.size:
+        raise BinaryFormatError("The data is too short to be NBDM binary data.", 0)
+
+    magic, version = HEADER.unpack_from(_data)
+    if magic != MAGIC:
+        raise BinaryFormatError("The data is not NBDM binary data.", 0)
+    if version > FORMAT_VERSION:
+        raise BinaryFormatError(
+            f"The data is format version {version}, but only versions up to "
+            f"{FORMAT_VERSION} can be read. Please update CarbonCheck.",
+            len(MAGIC),
+        )
+
+    value, pos = _unpack_value(_data, HEADER.size)
+    if pos != len(_data):
+        raise BinaryFormatError("Extra data after the end of the value.", pos)
+    return value
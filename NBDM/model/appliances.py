@@ -6,16 +6,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, get_type_hints
+from typing import Any, Dict, Generator
 from uuid import UUID, uuid4
 
 from ph_units.unit_type import Unit
 
-from NBDM.model import operations
+from NBDM.model import operations, serialization
 from NBDM.model.collections import Collection
 from NBDM.model.enums import appliance_type
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_Appliance:
     id_num: UUID = field(default_factory=uuid4)
@@ -39,7 +41,8 @@ class NBDM_Appliance:
         """Custom from_dict method to handle the Unit type."""
         d = {}
 
-        for field_name, field_type in get_type_hints(cls).items():
+        field_types = serialization.get_deserialization_plan(cls).field_types
+        for field_name, field_type in field_types.items():
             if field_name not in _d.keys() and field_name != "id_num":
                 msg = f"Error: Missing Key  {field_name} in {cls.__name__} from_dict method."
                 raise KeyError(msg)
@@ -54,6 +57,7 @@ class NBDM_Appliance:
         return cls(**d)
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentAppliances:
     _appliances: Collection[NBDM_Appliance] = field(default_factory=Collection)
@@ -5,16 +5,21 @@
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass, field
-from functools import reduce
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from NBDM.model import enums, serialization
 from NBDM.model.geometry import NBDM_BuildingSegmentGeometry
 from NBDM.model.occupancy import NBDM_BuildingSegmentOccupancy
 from NBDM.model.performance import NBDM_BuildingSegmentPerformance
+from NBDM.model.slots import add_slots
 
+# -- Shared by all the Buildings, so that no two Building states have the same version.
+_VERSIONS = itertools.count(1)
 
+
+@add_slots
 @dataclass
 class NBDM_BuildingSegment:
     segment_name: str = "-"
@@ -61,13 +66,70 @@ class NBDM_BuildingSegment:
 
 @dataclass
 class NBDM_Building:
+    """A Building made up of one or more Building Segments.
+
+    The whole-building 'geometry', 'occupancy' and 'performance' are cached after
+    they are first calculated, and the cache is cleared whenever a Building Segment is
+    added or removed. If a Building Segment is edited in place, call
+    'invalidate_aggregates()' so the totals are re-calculated. The cached objects are
+    shared between callers and should be treated as read-only.
+
+    Every change also gives the Building (and the changed Building Segments) a new
+    'version' number, which is used to keep track of any values calculated from it.
+    """
+
     building_name: str = "-"
     building_type: enums.building_type = field(default=enums.building_type.MULTIFAMILY)
     _building_segments: Dict[str, NBDM_BuildingSegment] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # -- Not dataclass fields, so they are never serialized or compared.
+        self._aggregates: Dict[str, Any] = {}
+        self._version: int = next(_VERSIONS)
+        self._segment_versions: Dict[str, int] = {
+            name: self._version for name in self._building_segments
+        }
+
+    @property
+    def version(self) -> int:
+        """A number which changes whenever the Building Segments change."""
+        return self._version
+
+    def segment_version(self, _name: str) -> int:
+        """Return the version of the Building when the named Segment last changed."""
+        return self._segment_versions[_name]
+
+    def _mark_changed(self, _segment_names: Iterable[str]) -> None:
+        """Give the Building (and the named Segments) a new version, and clear the cache."""
+        self._version = next(_VERSIONS)
+        for name in _segment_names:
+            self._segment_versions[name] = self._version
+        self._aggregates.clear()
+
+    def invalidate_aggregates(self, _segment_name: Optional[str] = None) -> None:
+        """Clear the cached whole-building values, so they are re-calculated on next use.
+
+        Call this after editing a Building Segment in place. If the name of the edited
+        Segment is given, only that Segment is marked as changed, otherwise all are.
+        """
+        if _segment_name is None:
+            self._mark_changed(list(self._building_segments))
+        else:
+            self._mark_changed([_segment_name])
+
+    def _get_aggregate(self, _name: str, _cls: Any) -> Any:
+        """Return the cached whole-building total, calculating it if needed."""
+        try:
+            return self._aggregates[_name]
+        except KeyError:
+            total = _cls.sum(getattr(seg, _name) for seg in self.building_segments)
+            self._aggregates[_name] = total
+            return total
+
     def add_building_segment(self, _segment: NBDM_BuildingSegment) -> None:
         """Add a new Building Segment to the Building."""
         self._building_segments[_segment.segment_name] = _segment
+        self._mark_changed([_segment.segment_name])
 
     def get_building_segment(self, _name: str) -> NBDM_BuildingSegment:
         """Retrieve a specific Building Segment by name."""
@@ -76,10 +138,39 @@ class NBDM_Building:
     def clear_building_segments(self) -> None:
         """Clear all Building Segments from the Building."""
         self._building_segments.clear()
+        self._segment_versions.clear()
+        self._mark_changed([])
+
+    def update_building_segments(self, _segments: Iterable[NBDM_BuildingSegment]) -> None:
+        """Replace the Building Segments, keeping any existing Segment which is unchanged.
+
+        Only the Segments which are new, or not equal to the existing Segment with the
+        same name, are replaced (and marked as changed). Any existing Segment not in the
+        new Segments is removed.
+        """
+        segments = {seg.segment_name: seg for seg in _segments}
+        removed = [name for name in self._building_segments if name not in segments]
+        for name in removed:
+            del self._building_segments[name]
+            del self._segment_versions[name]
+
+        changed = [
+            name
+            for name, seg in segments.items()
+            if self._building_segments.get(name) != seg
+        ]
+        for name in changed:
+            self._building_segments[name] = segments[name]
+
+        if removed or changed:
+            self._mark_changed(changed)
 
     def remove_segment_by_name(self, _name: str) -> Optional[NBDM_BuildingSegment]:
         """Remove a specific Building Segment from the NBDM_Building by name."""
-        return self._building_segments.pop(_name, None)
+        segment = self._building_segments.pop(_name, None)
+        self._segment_versions.pop(_name, None)
+        self._mark_changed([])
+        return segment
 
     @property
     def building_segment_names(self) -> List[str]:
@@ -94,23 +185,17 @@ class NBDM_Building:
     @property
     def geometry(self) -> NBDM_BuildingSegmentGeometry:
         """Return the geometry of the entire building as a single segment."""
-        return reduce(
-            lambda x, y: x + y, (seg.geometry for seg in self.building_segments)
-        )
+        return self._get_aggregate("geometry", NBDM_BuildingSegmentGeometry)
 
     @property
     def occupancy(self) -> NBDM_BuildingSegmentOccupancy:
         """Return the occupancy of the entire building as a single segment."""
-        return reduce(
-            lambda x, y: x + y, (seg.occupancy for seg in self.building_segments)
-        )
+        return self._get_aggregate("occupancy", NBDM_BuildingSegmentOccupancy)
 
     @property
     def performance(self) -> NBDM_BuildingSegmentPerformance:
         """Return the energy performance of the entire building as a single segment."""
-        return reduce(
-            lambda x, y: x + y, (seg.performance for seg in self.building_segments)
-        )
+        return self._get_aggregate("performance", NBDM_BuildingSegmentPerformance)
 
     @classmethod
     def from_dict(cls, _d: Dict) -> NBDM_Building:
@@ -124,30 +209,76 @@ class NBDM_Building:
         ):
             obj.add_building_segment(seg)
 
-        assert vars(obj).keys() == _d.keys(), "Error: Key mismatch: {} <--> {}".format(
-            vars(obj).keys(), _d.keys()
+        field_names = obj.__dataclass_fields__.keys()
+        assert field_names == _d.keys(), "Error: Key mismatch: {} <--> {}".format(
+            field_names, _d.keys()
         )
 
         return obj
 
     def __sub__(self, other: NBDM_Building) -> NBDM_Building:
+        """Subtract the Building Segments with matching names."""
+        return BuildingChangeTracker().subtract(self, other)
+
+    def __add__(self, other: NBDM_Building) -> NBDM_Building:
         new_building = self.__class__(
             self.building_name,
             self.building_type,
         )
 
         for self_seg, other_seg in zip(self.building_segments, other.building_segments):
-            new_building.add_building_segment(self_seg - other_seg)
+            new_building.add_building_segment(self_seg + other_seg)
 
         return new_building
 
-    def __add__(self, other: NBDM_Building) -> NBDM_Building:
-        new_building = self.__class__(
-            self.building_name,
-            self.building_type,
+
+class BuildingChangeTracker:
+    """Subtract one Building from another, re-using the results of the last subtraction.
+
+    Building Segments are matched by name, and any Segment without a match in the other
+    Building is left out. Only the pairs where either Segment has changed since the
+    last subtraction are subtracted again, the rest are re-used as-is.
+    """
+
+    def __init__(self) -> None:
+        self._key: Optional[Tuple] = None
+        self._building: Optional[NBDM_Building] = None
+        self._segments: Dict[Tuple[str, int, int], NBDM_BuildingSegment] = {}
+
+    def subtract(
+        self, _building_a: NBDM_Building, _building_b: NBDM_Building
+    ) -> NBDM_Building:
+        """Return a new Building with the difference (a - b) of each Building Segment."""
+        key = (
+            _building_a.version,
+            _building_b.version,
+            _building_a.building_name,
+            _building_a.building_type,
         )
+        if self._building is not None and key == self._key:
+            return self._building
 
-        for self_seg, other_seg in zip(self.building_segments, other.building_segments):
-            new_building.add_building_segment(self_seg + other_seg)
+        building = _building_a.__class__(
+            _building_a.building_name, _building_a.building_type
+        )
+        segments: Dict[Tuple[str, int, int], NBDM_BuildingSegment] = {}
+        for name in _building_a.building_segment_names:
+            if name not in _building_b._building_segments:
+                continue
 
-        return new_building
+            # -- Versions are never re-used, so this identifies both Segments exactly
+            segment_key = (
+                name,
+                _building_a.segment_version(name),
+                _building_b.segment_version(name),
+            )
+            segment = self._segments.get(segment_key)
+            if segment is None:
+                segment_a = _building_a.get_building_segment(name)
+                segment_b = _building_b.get_building_segment(name)
+                segment = segment_a - segment_b
+            segments[segment_key] = segment
+            building.add_building_segment(segment)
+
+        self._key, self._building, self._segments = key, building, segments
+        return building
@@ -5,13 +5,18 @@
 
 from __future__ import annotations
 
+import copy
+import threading
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     ItemsView,
     Iterator,
     KeysView,
+    List,
+    Optional,
     Protocol,
     TypeVar,
     ValuesView,
@@ -30,6 +35,160 @@ class CollectionItem(Protocol):
 T = TypeVar("T", bound=CollectionItem)
 
 
+class LazyDict(dict):
+    """A dict where some of the values are only built the first time they are used.
+
+    Each unloaded value has a 'loader' function, which is called (only once) to build
+    the value the first time it is accessed. The keys are always available without
+    loading anything. Any method which returns the values loads them first, so a
+    LazyDict can be used anywhere a dict is.
+
+    Loading is thread-safe: if two threads use the same unloaded value at once, it is
+    only built once, and both get the same object. A deepcopy shares the loaders of
+    any unloaded values, so the loaders must return a new object each time.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._loaders: Dict[Any, Callable[[], Any]] = {}
+        self._lock = threading.RLock()
+
+    def set_loader(self, _key: Any, _loader: Callable[[], Any]) -> None:
+        """Add the key, with a function to call to build its value when first used."""
+        with self._lock:
+            dict.__setitem__(self, _key, None)
+            self._loaders[_key] = _loader
+
+    def is_loaded(self, _key: Any) -> bool:
+        return _key not in self._loaders
+
+    @property
+    def unloaded_keys(self) -> List[Any]:
+        return list(self._loaders)
+
+    def _load(self, _key: Any) -> Any:
+        with self._lock:
+            loader = self._loaders.get(_key)
+            if loader is None:
+                # -- Another thread loaded it while this one was waiting for the lock
+                return dict.__getitem__(self, _key)
+            value = loader()
+            dict.__setitem__(self, _key, value)
+            del self._loaders[_key]
+            return value
+
+    def load_all(
+        self, _on_error: Optional[Callable[[Any, Exception], None]] = None
+    ) -> None:
+        """Build any values which have not been loaded yet.
+
+        Arguments:
+        ----------
+            * _on_error: (Optional[Callable[[Any, Exception], None]]) Default=None. If
+                given, any value whose loader raises an Exception is removed, and
+                '_on_error' is called with its key and the Exception. Otherwise the
+                Exception is raised.
+        """
+        for key in list(self._loaders):
+            try:
+                self._load(key)
+            except Exception as e:
+                if not _on_error:
+                    raise
+                del self[key]
+                _on_error(key, e)
+
+    def __getitem__(self, key: Any) -> Any:
+        if key in self._loaders:
+            return self._load(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._loaders.pop(key, None)
+            dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            self._loaders.pop(key, None)
+            dict.__delitem__(self, key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        with self._lock:
+            if key in self._loaders:
+                self._load(key)
+            return dict.pop(self, key, *default)
+
+    def popitem(self) -> Any:
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaders.clear()
+            dict.clear(self)
+
+    def values(self) -> ValuesView[Any]:
+        self.load_all()
+        return dict.values(self)
+
+    def items(self) -> ItemsView[Any, Any]:
+        self.load_all()
+        return dict.items(self)
+
+    def __iter__(self) -> Iterator[Any]:
+        # -- Note: Needed even though it is the same as the dict's, otherwise 'dict(obj)'
+        # -- and '{**obj}' copy the (unloaded) values directly, without calling 'items'.
+        return dict.__iter__(self)
+
+    def copy(self) -> LazyDict:
+        self.load_all()
+        return self.__class__(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self.load_all()
+        if isinstance(other, LazyDict):
+            other.load_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __reduce__(self) -> Any:
+        self.load_all()
+        return (self.__class__, (dict(self.items()),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> LazyDict:
+        new = self.__class__()
+        memo[id(self)] = new
+        with self._lock:
+            for key, value in dict.items(self):
+                if key in self._loaders:
+                    new.set_loader(key, self._loaders[key])
+                else:
+                    dict.__setitem__(new, key, copy.deepcopy(value, memo))
+        return new
+
+    def __repr__(self) -> str:
+        self.load_all()
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+
 class Collection(Generic[T]):
     def __init__(self) -> None:
         self._data: Dict[str, T] = {}
@@ -45,6 +204,19 @@ class Collection(Generic[T]):
         """Add an item to the collection."""
         self._data[_item.key] = _item
 
+    def add_lazy_item(self, _key: str, _loader: Callable[[], T]) -> None:
+        """Add an item which is only built (by calling '_loader') the first time it is used."""
+        if not isinstance(self._data, LazyDict):
+            self._data = LazyDict(self._data)
+        self._data.set_loader(_key, _loader)
+
+    def load_all(
+        self, _on_error: Optional[Callable[[str, Exception], None]] = None
+    ) -> None:
+        """Build any lazy items which have not been built yet (see: 'LazyDict.load_all')."""
+        if isinstance(self._data, LazyDict):
+            self._data.load_all(_on_error)
+
     def items(self) -> ItemsView[str, T]:
         return self._data.items()
 
@@ -12,8 +12,10 @@ from ph_units.unit_type import Unit
 
 from NBDM.model.collections import Collection
 from NBDM.model.enums import cooling_device_type
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_CoolingDevice:
     device_type: cooling_device_type = field(default=cooling_device_type.NONE)
@@ -40,6 +42,7 @@ class NBDM_CoolingDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentCoolingSystems:
     _devices: Collection[NBDM_CoolingDevice] = field(default_factory=Collection)
@@ -13,8 +13,10 @@ from ph_units.unit_type import Unit
 from NBDM.model import operations
 from NBDM.model.collections import Collection
 from NBDM.model.enums import dhw_tank_device_type, heating_device_type
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_DHWHeatingDevice:
     device_type: heating_device_type = field(default=heating_device_type.NONE)
@@ -37,6 +39,7 @@ class NBDM_DHWHeatingDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_DHWTankDevice:
     display_name: str = ""
@@ -57,6 +60,7 @@ class NBDM_DHWTankDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentDHWSystems:
     _heating_devices: Collection[NBDM_DHWHeatingDevice] = field(
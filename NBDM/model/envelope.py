@@ -12,8 +12,10 @@ from ph_units.unit_type import Unit
 
 from NBDM.model import operations
 from NBDM.model.collections import Collection
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_GlazingType:
     display_name: str
@@ -36,6 +38,7 @@ class NBDM_GlazingType:
         return cls(**d)
 
 
+@add_slots
 @dataclass
 class NBDM_AssemblyType:
     name: str
@@ -60,6 +63,7 @@ class NBDM_AssemblyType:
         return cls(**d)
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentEnvelope:
     _assembly_types: Collection[NBDM_AssemblyType] = field(default_factory=Collection)
@@ -6,13 +6,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Iterable
 
 from ph_units.unit_type import Unit
 
 from NBDM.model import operations, serialization
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentGeometry:
     area_envelope: Unit = field(default_factory=Unit)
@@ -23,6 +25,12 @@ class NBDM_BuildingSegmentGeometry:
     def from_dict(cls, _d: Dict) -> NBDM_BuildingSegmentGeometry:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
+    @classmethod
+    def sum(
+        cls, _objects: Iterable[NBDM_BuildingSegmentGeometry]
+    ) -> NBDM_BuildingSegmentGeometry:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(
         self, other: NBDM_BuildingSegmentGeometry
     ) -> NBDM_BuildingSegmentGeometry:
@@ -12,8 +12,10 @@ from ph_units.unit_type import Unit
 
 from NBDM.model.collections import Collection
 from NBDM.model.enums import heating_device_type
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_HeatingDevice:
     device_type: heating_device_type = field(default=heating_device_type.NONE)
@@ -47,6 +49,7 @@ class NBDM_HeatingDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentHeatingSystems:
     _devices: Collection[NBDM_HeatingDevice] = field(default_factory=Collection)
@@ -6,11 +6,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterable
 
 from NBDM.model import operations, serialization
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentOccupancy:
     total_dwelling_units: int = 0
@@ -20,6 +22,12 @@ class NBDM_BuildingSegmentOccupancy:
     def from_dict(cls, _d: Dict) -> NBDM_BuildingSegmentOccupancy:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
+    @classmethod
+    def sum(
+        cls, _objects: Iterable[NBDM_BuildingSegmentOccupancy]
+    ) -> NBDM_BuildingSegmentOccupancy:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(
         self, other: NBDM_BuildingSegmentOccupancy
     ) -> NBDM_BuildingSegmentOccupancy:
@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
 # -*- Python Version: 3.7 -*-
 
-"""Operator functions (Add, Subtract) used by NBDM Objects."""
+"""Operator functions (Add, Subtract, Sum) used by NBDM Objects."""
 
 from __future__ import annotations
 
+import operator
 from dataclasses import fields
-from typing import TypeVar
+from functools import lru_cache, partial, reduce
+from typing import Any, Callable, Iterable, List, Tuple, Type, TypeVar
+
+from ph_units.unit_type import Unit
+
+from NBDM.model.serialization import get_deserialization_plan
 
 T = TypeVar("T")
 
@@ -21,45 +27,139 @@ def _check_types(_object_a: T, _object_b: T):
         raise Exception(msg)
 
 
-def _check_field_names(_object_a: T, _object_b: T):
-    """Raise Exception if the field-names of two NBDM Objects do not match."""
-    if [f.name for f in fields(_object_a)] != [f.name for f in fields(_object_b)]:
-        msg = f"\n\tError: Field names for object {_object_a} and object {_object_b} do not match?"
-        raise Exception(msg)
+def _keep_first(_a: Any, _b: Any) -> Any:
+    """Return the first value, unchanged. Used when subtracting string fields."""
+    return _a
+
+
+class _OperationPlan:
+    """The field-names and operators used to Add / Subtract one type of NBDM Object.
+
+    The plan is built only once for each class (see: 'get_operation_plan').
+    """
+
+    def __init__(self, _cls: Type) -> None:
+        self.cls = _cls
+        self.field_names: Tuple[str, ...] = tuple(f.name for f in fields(_cls))
+        # -- Note: can't just use the fields(_cls) types 'cus of from __future__
+        # -- import annotations: they are all strings ('str'), not the types.
+        field_types = get_deserialization_plan(_cls).field_types
+        self.subtract_operators: Tuple[Callable[[Any, Any], Any], ...] = tuple(
+            _keep_first if field_types.get(name) == str else operator.sub
+            for name in self.field_names
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.cls.__name__}, {self.field_names})"
+
+
+@lru_cache(maxsize=None)
+def get_operation_plan(_cls: Type) -> _OperationPlan:
+    """Return the (cached) operation plan for the NBDM class."""
+    return _OperationPlan(_cls)
+
+
+def _apply_or_none(_operator: Callable[[Any, Any], Any], _a: Any, _b: Any) -> Any:
+    """Return the result of the operation, or None if the values cannot be operated on."""
+    try:
+        return _operator(_a, _b)
+    except Exception:
+        return None
 
 
 def add_NBDM_Objects(_object_a: T, _object_b: T) -> T:
-    """Add two NBDM Objects together."""
+    """Add two NBDM Objects together.
+
+    Any field which cannot be added together is set to None.
+    """
 
     _check_types(_object_a, _object_b)
-    _check_field_names(_object_a, _object_b)
+    plan = get_operation_plan(type(_object_a))
 
-    new_attr_values = {}
-    for field in fields(_object_a):
-        try:
-            val = getattr(_object_a, field.name) + getattr(_object_b, field.name)
-            new_attr_values[field.name] = val
-        except:
-            new_attr_values[field.name] = None
+    try:
+        values = [
+            getattr(_object_a, name) + getattr(_object_b, name)
+            for name in plan.field_names
+        ]
+    except Exception:
+        # -- Go field by field, so only the fields which failed are set to None
+        values = [
+            _apply_or_none(
+                operator.add, getattr(_object_a, name), getattr(_object_b, name)
+            )
+            for name in plan.field_names
+        ]
 
-    return _object_a.__class__(**new_attr_values)
+    return plan.cls(*values)
 
 
 def subtract_NBDM_Objects(_object_a: T, _object_b: T) -> T:
-    """Subtract one NBDM Object from Another"""
+    """Subtract one NBDM Object from Another
+
+    String fields keep the first object's value. Any other field which cannot be
+    subtracted is set to None.
+    """
 
     _check_types(_object_a, _object_b)
-    _check_field_names(_object_a, _object_b)
-
-    new_attr_values = {}
-    for field in fields(_object_a):
-        if field.type == str:
-            new_attr_values[field.name] = getattr(_object_a, field.name)
-        else:
-            try:
-                val = getattr(_object_a, field.name) - getattr(_object_b, field.name)
-                new_attr_values[field.name] = val
-            except:
-                new_attr_values[field.name] = None
-
-    return _object_a.__class__(**new_attr_values)
+    plan = get_operation_plan(type(_object_a))
+
+    try:
+        values = [
+            op(getattr(_object_a, name), getattr(_object_b, name))
+            for name, op in zip(plan.field_names, plan.subtract_operators)
+        ]
+    except Exception:
+        # -- Go field by field, so only the fields which failed are set to None
+        values = [
+            _apply_or_none(op, getattr(_object_a, name), getattr(_object_b, name))
+            for name, op in zip(plan.field_names, plan.subtract_operators)
+        ]
+
+    return plan.cls(*values)
+
+
+def _sum_values(_values: List[Any]) -> Any:
+    """Return the sum of the field-values.
+
+    Units of the same unit-type are summed directly, and NBDM Objects with their own
+    'sum' (ie: NBDM_SiteEnergy.sum) are summed in one pass. Anything else is added
+    one at a time, exactly as '+' would (with any failed step giving None).
+    """
+    first = _values[0]
+    if type(first) is Unit and all(
+        type(v) is Unit and v.unit == first.unit for v in _values
+    ):
+        return Unit(sum(v.value for v in _values), first.unit)
+
+    sum_method = getattr(type(first), "sum", None)
+    if sum_method:
+        try:
+            return sum_method(_values)
+        except Exception:
+            pass
+
+    return reduce(partial(_apply_or_none, operator.add), _values)
+
+
+def sum_NBDM_Objects(_objects: Iterable[T]) -> T:
+    """Add any number of NBDM Objects together, in a single pass.
+
+    The result is the same as adding them together one at a time, but without
+    building all of the in-between objects.
+    """
+
+    objects = list(_objects)
+    if not objects:
+        raise ValueError("Error: Cannot sum an empty collection of NBDM Objects.")
+
+    first = objects[0]
+    for obj in objects[1:]:
+        _check_types(first, obj)
+    if len(objects) == 1:
+        return first
+
+    plan = get_operation_plan(type(first))
+    values = [
+        _sum_values([getattr(obj, name) for obj in objects]) for name in plan.field_names
+    ]
+    return plan.cls(*values)
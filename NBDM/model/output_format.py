@@ -107,6 +107,7 @@ class Format_NBDM_BuildingSegmentPerformance:
     annual_cooling_energy_demand = "Annual Cooling Demand"
     peak_heating_load = "Peak Heating Load"
     peak_sensible_cooling_load = "Peak Cooling Load"
+    monthly = "Monthly Energy"
 
 
 class Format_NBDM_SiteEnergy:
@@ -119,6 +120,30 @@ class Format_NBDM_SiteEnergy:
     production_other = "Production Other"
 
 
+class Format_NBDM_MonthlyPerformance:
+    site_energy_consumption_gas = "Site Energy Consumption: Gas"
+    site_energy_consumption_electricity = "Site Energy Consumption: Electricity"
+    heating_demand = "Heating Demand"
+    cooling_demand = "Cooling Demand"
+
+
+class Format_NBDM_MonthlySeries:
+    JAN = "January"
+    FEB = "February"
+    MAR = "March"
+    APR = "April"
+    MAY = "May"
+    JUN = "June"
+    JUL = "July"
+    AUG = "August"
+    SEP = "September"
+    OCT = "October"
+    NOV = "November"
+    DEC = "December"
+    total = "Total"
+    peak = "Peak"
+
+
 class Format_NBDM_SourceEnergy:
     consumption_gas = "Consumption: Gas"
     consumption_electricity = "Consumption: Electricity"
@@ -5,14 +5,157 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Any, Dict, Iterable
 
 from ph_units.unit_type import Unit
 
 from NBDM.model import operations, serialization
+from NBDM.model.slots import add_slots
+
+MONTHS = (
+    "JAN",
+    "FEB",
+    "MAR",
+    "APR",
+    "MAY",
+    "JUN",
+    "JUL",
+    "AUG",
+    "SEP",
+    "OCT",
+    "NOV",
+    "DEC",
+)
+
+
+@add_slots
+@dataclass
+class NBDM_MonthlySeries:
+    """Twelve monthly values (JAN-DEC), all of the same unit-type.
+
+    Each month can be read as a Unit by name (ie: 'series.JAN').
+    """
+
+    values: array = field(default_factory=lambda: array("d", bytes(8 * len(MONTHS))))
+    unit: str = "KBTU"
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.values, array):
+            self.values = array("d", self.values)
+        if len(self.values) != len(MONTHS):
+            raise ValueError(
+                f"Error: A monthly series needs {len(MONTHS)} values, "
+                f"got {len(self.values)}: {self.values.tolist()}"
+            )
+
+    def __getattr__(self, _name: str) -> Unit:
+        if _name not in MONTHS:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{_name}'"
+            )
+        return Unit(self.values[MONTHS.index(_name)], self.unit)
+
+    @property
+    def total(self) -> Unit:
+        """Return the total of all twelve months."""
+        return Unit(sum(self.values), self.unit)
+
+    @property
+    def peak(self) -> Unit:
+        """Return the largest monthly value."""
+        return Unit(max(self.values), self.unit)
+
+    @property
+    def peak_month(self) -> str:
+        """Return the name of the month with the largest value. ie: 'JAN'"""
+        return MONTHS[self.values.index(max(self.values))]
+
+    def as_a(self, _unit: str) -> NBDM_MonthlySeries:
+        """Return a new series with all the values converted to the unit given."""
+        if _unit == self.unit:
+            return NBDM_MonthlySeries(array("d", self.values), self.unit)
+        try:
+            factor = Unit(1.0, self.unit).as_a(_unit).value
+        except ValueError as e:
+            raise TypeError(
+                f"Error: Cannot convert the monthly series from '{self.unit}' to '{_unit}'."
+            ) from e
+        return NBDM_MonthlySeries(array("d", (v * factor for v in self.values)), _unit)
+
+    @classmethod
+    def from_units(cls, _units: Iterable[Unit]) -> NBDM_MonthlySeries:
+        """Return a new series from twelve Units, converted to the first Unit's unit-type."""
+        units = list(_units)
+        unit_type = units[0].unit if units else cls().unit
+        return cls(array("d", (u.as_a(unit_type).value for u in units)), unit_type)
+
+    @classmethod
+    def from_dict(cls, _d: Dict[str, Any]) -> NBDM_MonthlySeries:
+        return cls(array("d", _d["values"]), _d["unit"])
+
+    @classmethod
+    def from_treeView(cls, _d: Dict[str, Any]) -> NBDM_MonthlySeries:
+        """Return a new series from the treeView's month rows (value and unit-type)."""
+        for month in MONTHS:
+            if month not in _d:
+                raise serialization.FromDictException(cls.__name__, month, _d.keys())
+        return cls.from_units(Unit(_d[m].row_value, _d[m].row_unit) for m in MONTHS)
+
+    @classmethod
+    def sum(cls, _series: Iterable[NBDM_MonthlySeries]) -> NBDM_MonthlySeries:
+        """Return the total of all the series, in the first series' unit-type."""
+        series = list(_series)
+        if not series:
+            raise ValueError("Error: Cannot sum an empty collection of monthly series.")
+        unit = series[0].unit
+        totals = [0.0] * len(MONTHS)
+        for s in series:
+            totals = [a + b for a, b in zip(totals, s.as_a(unit).values)]
+        return cls(array("d", totals), unit)
+
+    def __sub__(self, other: NBDM_MonthlySeries) -> NBDM_MonthlySeries:
+        other_values = other.as_a(self.unit).values
+        return NBDM_MonthlySeries(
+            array("d", (a - b for a, b in zip(self.values, other_values))), self.unit
+        )
+
+    def __add__(self, other: NBDM_MonthlySeries) -> NBDM_MonthlySeries:
+        other_values = other.as_a(self.unit).values
+        return NBDM_MonthlySeries(
+            array("d", (a + b for a, b in zip(self.values, other_values))), self.unit
+        )
+
+
+@add_slots
+@dataclass
+class NBDM_MonthlyPerformance:
+    site_energy_consumption_gas: NBDM_MonthlySeries = field(
+        default_factory=NBDM_MonthlySeries
+    )
+    site_energy_consumption_electricity: NBDM_MonthlySeries = field(
+        default_factory=NBDM_MonthlySeries
+    )
+    heating_demand: NBDM_MonthlySeries = field(default_factory=NBDM_MonthlySeries)
+    cooling_demand: NBDM_MonthlySeries = field(default_factory=NBDM_MonthlySeries)
+
+    @classmethod
+    def from_dict(cls, _d: Dict) -> NBDM_MonthlyPerformance:
+        return serialization.build_NBDM_obj_from_dict(cls, _d)
+
+    @classmethod
+    def sum(cls, _objects: Iterable[NBDM_MonthlyPerformance]) -> NBDM_MonthlyPerformance:
+        return operations.sum_NBDM_Objects(_objects)
+
+    def __sub__(self, other: NBDM_MonthlyPerformance) -> NBDM_MonthlyPerformance:
+        return operations.subtract_NBDM_Objects(self, other)
+
+    def __add__(self, other: NBDM_MonthlyPerformance) -> NBDM_MonthlyPerformance:
+        return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_SiteEnergy:
     consumption_gas: Unit = field(default_factory=Unit)
@@ -27,6 +170,10 @@ class NBDM_SiteEnergy:
     def from_dict(cls, _d: Dict[str, Unit]) -> NBDM_SiteEnergy:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
+    @classmethod
+    def sum(cls, _objects: Iterable[NBDM_SiteEnergy]) -> NBDM_SiteEnergy:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(self, other: NBDM_SiteEnergy) -> NBDM_SiteEnergy:
         return operations.subtract_NBDM_Objects(self, other)
 
@@ -34,6 +181,7 @@ class NBDM_SiteEnergy:
         return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_SourceEnergy:
     consumption_gas: Unit = field(default_factory=Unit)
@@ -48,6 +196,10 @@ class NBDM_SourceEnergy:
     def from_dict(cls, _d: Dict[str, Unit]) -> NBDM_SourceEnergy:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
+    @classmethod
+    def sum(cls, _objects: Iterable[NBDM_SourceEnergy]) -> NBDM_SourceEnergy:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(self, other: NBDM_SourceEnergy) -> NBDM_SourceEnergy:
         return operations.subtract_NBDM_Objects(self, other)
 
@@ -55,6 +207,7 @@ class NBDM_SourceEnergy:
         return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_AnnualHeatingDemandEnergy:
     heating_demand: Unit = field(default_factory=Unit)
@@ -83,6 +236,12 @@ class NBDM_AnnualHeatingDemandEnergy:
             nbdm_obj.__setattr__(field_name, _d[field_name])
         return nbdm_obj
 
+    @classmethod
+    def sum(
+        cls, _objects: Iterable[NBDM_AnnualHeatingDemandEnergy]
+    ) -> NBDM_AnnualHeatingDemandEnergy:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(
         self, other: NBDM_AnnualHeatingDemandEnergy
     ) -> NBDM_AnnualHeatingDemandEnergy:
@@ -94,6 +253,7 @@ class NBDM_AnnualHeatingDemandEnergy:
         return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_AnnualCoolingDemandEnergy:
     sensible_cooling_demand: Unit = field(default_factory=Unit)
@@ -130,6 +290,12 @@ class NBDM_AnnualCoolingDemandEnergy:
             nbdm_obj.__setattr__(field_name, _d[field_name])
         return nbdm_obj
 
+    @classmethod
+    def sum(
+        cls, _objects: Iterable[NBDM_AnnualCoolingDemandEnergy]
+    ) -> NBDM_AnnualCoolingDemandEnergy:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(
         self, other: NBDM_AnnualCoolingDemandEnergy
     ) -> NBDM_AnnualCoolingDemandEnergy:
@@ -141,6 +307,7 @@ class NBDM_AnnualCoolingDemandEnergy:
         return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_PeakHeatingLoad:
     peak_heating_load: Unit = field(default_factory=Unit)
@@ -168,6 +335,10 @@ class NBDM_PeakHeatingLoad:
             nbdm_obj.__setattr__(field_name, _d[field_name])
         return nbdm_obj
 
+    @classmethod
+    def sum(cls, _objects: Iterable[NBDM_PeakHeatingLoad]) -> NBDM_PeakHeatingLoad:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(self, other: NBDM_PeakHeatingLoad) -> NBDM_PeakHeatingLoad:
         return operations.subtract_NBDM_Objects(self, other)
 
@@ -175,6 +346,7 @@ class NBDM_PeakHeatingLoad:
         return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_PeakCoolingLoad:
     peak_sensible_cooling_load: Unit = field(default_factory=Unit)
@@ -203,6 +375,10 @@ class NBDM_PeakCoolingLoad:
             nbdm_obj.__setattr__(field_name, _d[field_name])
         return nbdm_obj
 
+    @classmethod
+    def sum(cls, _objects: Iterable[NBDM_PeakCoolingLoad]) -> NBDM_PeakCoolingLoad:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(self, other: NBDM_PeakCoolingLoad) -> NBDM_PeakCoolingLoad:
         return operations.subtract_NBDM_Objects(self, other)
 
@@ -210,6 +386,7 @@ class NBDM_PeakCoolingLoad:
         return operations.add_NBDM_Objects(self, other)
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentPerformance:
     site_energy: NBDM_SiteEnergy = field(default_factory=NBDM_SiteEnergy)
@@ -223,11 +400,18 @@ class NBDM_BuildingSegmentPerformance:
 
     peak_heating_load: NBDM_PeakHeatingLoad = field(default_factory=NBDM_PeakHeatingLoad)
     peak_cooling_load: NBDM_PeakCoolingLoad = field(default_factory=NBDM_PeakCoolingLoad)
+    monthly: NBDM_MonthlyPerformance = field(default_factory=NBDM_MonthlyPerformance)
 
     @classmethod
     def from_dict(cls, _d: Dict) -> NBDM_BuildingSegmentPerformance:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
+    @classmethod
+    def sum(
+        cls, _objects: Iterable[NBDM_BuildingSegmentPerformance]
+    ) -> NBDM_BuildingSegmentPerformance:
+        return operations.sum_NBDM_Objects(_objects)
+
     def __sub__(
         self, other: NBDM_BuildingSegmentPerformance
     ) -> NBDM_BuildingSegmentPerformance:
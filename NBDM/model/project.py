@@ -6,21 +6,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from NBDM.model import serialization
 from NBDM.model.appliances import NBDM_BuildingSegmentAppliances
-from NBDM.model.building import NBDM_Building, NBDM_BuildingSegment
+from NBDM.model.building import (
+    BuildingChangeTracker,
+    NBDM_Building,
+    NBDM_BuildingSegment,
+)
 from NBDM.model.cooling_systems import NBDM_BuildingSegmentCoolingSystems
 from NBDM.model.dhw_systems import NBDM_BuildingSegmentDHWSystems
 from NBDM.model.envelope import NBDM_BuildingSegmentEnvelope
 from NBDM.model.heating_systems import NBDM_BuildingSegmentHeatingSystems
 from NBDM.model.renewable_systems import NBDM_BuildingSegmentRenewableSystems
 from NBDM.model.site import NBDM_Site
+from NBDM.model.slots import add_slots
 from NBDM.model.team import NBDM_Team
 from NBDM.model.ventilation_systems import NBDM_BuildingSegmentVentilationSystems
 
 
+@add_slots
 @dataclass
 class NBDM_Variant:
     """A single 'Variant' with building data"""
@@ -39,10 +45,23 @@ class NBDM_Variant:
         """Clear all the Building-Segments"""
         self.building.clear_building_segments()
 
+    def update_building_segments(self, _segments: Iterable[NBDM_BuildingSegment]) -> None:
+        """Replace the Building-Segments, keeping any existing Segment which is unchanged."""
+        self.building.update_building_segments(_segments)
+
     def remove_segment_by_name(self, _name: str) -> Optional[NBDM_BuildingSegment]:
         """Remove a Building-Segment from the self.building by name."""
         return self.building.remove_segment_by_name(_name)
 
+    def invalidate_aggregates(self, _segment_name: Optional[str] = None) -> None:
+        """Clear the Building's cached totals after editing a Building-Segment in place."""
+        self.building.invalidate_aggregates(_segment_name)
+
+    @property
+    def version(self) -> int:
+        """A number which changes whenever the Variant's Building-Segments change."""
+        return self.building.version
+
     @property
     def building_segments(self) -> List[NBDM_BuildingSegment]:
         """Return a list with all the Building-Segments in alphabetical order."""
@@ -81,13 +100,27 @@ class NBDM_Variants:
 
     @property
     def change_from_baseline_variant(self) -> NBDM_Variant:
-        """Return a new Variant with values representing the change from Baseline."""
-        variant = getattr(self, "_change_from_baseline", None)
-        if variant:
-            return variant
-        else:
-            self._change_from_baseline = self.baseline - self.proposed
-            return self._change_from_baseline
+        """Return a new Variant with values representing the change from Baseline.
+
+        The result is cached, and is only re-calculated after the Baseline or Proposed
+        Variant has changed. Even then, only the Building-Segments which have changed
+        are re-calculated (see: BuildingChangeTracker).
+        """
+        tracker: Optional[BuildingChangeTracker]
+        tracker = getattr(self, "_change_tracker", None)
+        if tracker is None:
+            tracker = self._change_tracker = BuildingChangeTracker()
+        building = tracker.subtract(self.baseline.building, self.proposed.building)
+
+        variant: Optional[NBDM_Variant] = getattr(self, "_change_from_baseline", None)
+        if (
+            variant is None
+            or variant.building is not building
+            or variant.variant_name != self.baseline.variant_name
+        ):
+            variant = NBDM_Variant(self.baseline.variant_name, building)
+            self._change_from_baseline = variant
+        return variant
 
     @property
     def building_segment_names_baseline(self) -> List[str]:
@@ -167,6 +200,7 @@ class NBDM_Variants:
             yield _
 
 
+@add_slots
 @dataclass
 class NBDM_Project:
     """A single Project with site, client and building data."""
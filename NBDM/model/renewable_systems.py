@@ -11,8 +11,10 @@ from typing import Dict, Generator
 from ph_units.unit_type import Unit
 
 from NBDM.model.collections import Collection
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_SolarDHWDevice:
     footprint: Unit = field(default_factory=Unit)
@@ -37,6 +39,7 @@ class NBDM_SolarDHWDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_SolarPVDevice:
     display_name: str = ""
@@ -59,6 +62,7 @@ class NBDM_SolarPVDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentRenewableSystems:
     _solar_dhw_devices: Collection[NBDM_SolarDHWDevice] = field(
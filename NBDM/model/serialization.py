@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import _MISSING_TYPE, fields, is_dataclass
 from enum import Enum
-from typing import Any, Dict, Type, Union, get_type_hints
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Tuple, Type, Union, get_type_hints
 from uuid import UUID
 
 from ph_units.unit_type import Unit
@@ -46,21 +48,78 @@ def _field_is_required(_cls: Type, _field_name: str) -> bool:
         return False
 
 
+class _FieldPlan(NamedTuple):
+    """How to build a single field of an NBDM Object from its serialized data."""
+
+    name: str
+    type: Any
+    required: bool
+    from_dict: Callable[[Any], Any]
+
+
+def _get_from_dict_converter(_field_type: Any) -> Callable[[Any], Any]:
+    """Return the function used to build the field's value from its dict data."""
+    if _field_type == Unit:
+        return Unit.from_dict
+    elif hasattr(_field_type, "from_dict"):
+        return _field_type.from_dict
+    else:
+        return _field_type
+
+
+class _DeserializationPlan:
+    """The resolved field-types and converters used to build one type of NBDM Object.
+
+    Resolving the type-hints is slow (the annotations are all strings, because of
+    'from __future__ import annotations'), so the plan is built only once for each
+    class (see: 'get_deserialization_plan').
+    """
+
+    def __init__(self, _cls: Type) -> None:
+        self.cls = _cls
+        # -- Note: can't just use dataclasses.fields(_cls) 'cus of
+        # -- from __future__ import annotations breaks fields().
+        self.fields: Tuple[_FieldPlan, ...] = tuple(
+            _FieldPlan(
+                field_name,
+                field_type,
+                _field_is_required(_cls, field_name),
+                _get_from_dict_converter(field_type),
+            )
+            for field_name, field_type in get_type_hints(_cls).items()
+        )
+        self.field_types: Dict[str, Any] = {f.name: f.type for f in self.fields}
+
+    def __repr__(self) -> str:
+        field_names = tuple(f.name for f in self.fields)
+        return f"{self.__class__.__name__}({self.cls.__name__}, {field_names})"
+
+
+@lru_cache(maxsize=None)
+def get_deserialization_plan(_cls: Type) -> _DeserializationPlan:
+    """Return the (cached) deserialization plan for the NBDM class."""
+    return _DeserializationPlan(_cls)
+
+
 def build_NBDM_obj_from_treeView(_cls: Any, _d: Dict) -> Any:
     """Return a Dict of NBDM objects based on an input Dict of treeView data.
 
-    This method is called when building an NBDM object from a treeView.
+    This method is called when building an NBDM object from a treeView. Classes
+    which are not shown field-by-field in the treeView (ie: NBDM_MonthlySeries)
+    provide their own 'from_treeView' method instead.
     """
+    from_treeView = getattr(_cls, "from_treeView", None)
+    if from_treeView:
+        return from_treeView(_d)
+
     d = {}
 
-    # -- Note: can't just use dataclasses.fields(_cls) 'cus of
-    # -- from __future__ import annotations breaks fields().
-    for field_name, field_type in get_type_hints(_cls).items():
+    for field_name, field_type, required, _ in get_deserialization_plan(_cls).fields:
         # ---------------------------------------------------------------------
         # -- Check field is present, and if not, check if it is required
-        if field_name not in _d.keys() and _field_is_required(_cls, field_name):
+        if field_name not in _d and required:
             raise FromDictException(_cls.__name__, field_name, _d.keys())
-        elif field_name not in _d.keys():
+        elif field_name not in _d:
             continue
 
         # ---------------------------------------------------------------------
@@ -95,23 +154,18 @@ def build_NBDM_obj_from_dict(_cls: Any, _d: Dict) -> Any:
 
 
     This method is called during an NBDM object's 'from_dict' method and used
-    to build up the object's attributes from a Dict.
+    to build up the object's attributes from a Dict. Fields with a default value
+    may be left out of the Dict (ie: files written before the field was added).
     """
     d = {}
 
-    # -- Note: can't just use dataclasses.fields(_cls) 'cus of
-    # -- from __future__ import annotations breaks fields().
-    for field_name, field_type in get_type_hints(_cls).items():
-        if field_name not in _d.keys():
+    for field_name, _, required, from_dict in get_deserialization_plan(_cls).fields:
+        if field_name not in _d and required:
             raise FromDictException(_cls.__name__, field_name, _d.keys())
+        elif field_name not in _d:
+            continue
 
-        field_data = _d[field_name]
-        if field_type == Unit:
-            d[field_name] = Unit.from_dict(field_data)
-        elif hasattr(field_type, "from_dict"):
-            d[field_name] = field_type.from_dict(field_data)
-        else:
-            d[field_name] = field_type(field_data)
+        d[field_name] = from_dict(_d[field_name])
 
     return _cls(**d)
 
@@ -143,12 +197,17 @@ def to_dict(obj) -> Dict:
         elif hasattr(field_value, "__dataclass_fields__"):
             d[field_name] = to_dict(field_value)
 
+        # ------------------------------------------------------------
+        # -- An array of numbers, just convert it to a list.
+        elif isinstance(field_value, array):
+            d[field_name] = field_value.tolist()
+
         # ------------------------------------------------------------
         # -- A list of objects, call to_dict() on each one.
         elif isinstance(field_value, (list, tuple)):
             d[field_name] = []
             for _ in field_value:
-                d[field_name].append(to_dict(field_value))
+                d[field_name].append(to_dict(_))
 
         # ------------------------------------------------------------
         # -- A dict object, call to_dict() on each value in the dict
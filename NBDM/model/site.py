@@ -9,8 +9,10 @@ from dataclasses import dataclass, field
 from typing import Dict
 
 from NBDM.model import serialization
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_ProjectAddress:
     building_number: str = "-"
@@ -24,6 +26,7 @@ class NBDM_ProjectAddress:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
 
+@add_slots
 @dataclass
 class NBDM_Climate:
     zone_passive_house: str = "-"
@@ -36,6 +39,7 @@ class NBDM_Climate:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
 
+@add_slots
 @dataclass
 class NBDM_Location:
     address: NBDM_ProjectAddress = field(default_factory=NBDM_ProjectAddress)
@@ -47,6 +51,7 @@ class NBDM_Location:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
 
+@add_slots
 @dataclass
 class NBDM_Site:
     climate: NBDM_Climate = field(default_factory=NBDM_Climate)
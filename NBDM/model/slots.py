@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Add '__slots__' to NBDM dataclasses, to reduce the memory used by each object."""
+
+from dataclasses import fields
+from typing import Type, TypeVar
+
+T = TypeVar("T")
+
+
+def add_slots(_cls: Type[T]) -> Type[T]:
+    """Return a new version of the dataclass which uses '__slots__' instead of a '__dict__'.
+
+    This is the same as 'dataclass(slots=True)' (Python 3.10+), for use in Python 3.7.
+    It must be placed above the '@dataclass' decorator. Objects of the new class can
+    only have the attributes listed in the dataclass fields.
+
+    Usage:
+    ------
+        >>> @add_slots
+        >>> @dataclass
+        >>> class NBDM_Example:
+        >>>     value: float = 0.0
+    """
+
+    field_names = tuple(f.name for f in fields(_cls))
+    cls_dict = dict(_cls.__dict__)
+    cls_dict["__slots__"] = field_names
+
+    # -- The field default-values are already stored in the generated __init__, and
+    # -- would conflict with the slots if left on the class.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    return type(_cls)(_cls.__name__, _cls.__bases__, cls_dict)
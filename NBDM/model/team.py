@@ -9,8 +9,10 @@ from dataclasses import dataclass, field
 from typing import Dict
 
 from NBDM.model import serialization
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_TeamContactInfo:
     """Contact Information for an individual team member."""
@@ -29,6 +31,7 @@ class NBDM_TeamContactInfo:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
 
+@add_slots
 @dataclass
 class NBDM_TeamMember:
     """An individual team member."""
@@ -41,6 +44,7 @@ class NBDM_TeamMember:
         return serialization.build_NBDM_obj_from_dict(cls, _d)
 
 
+@add_slots
 @dataclass
 class NBDM_Team:
     """A collection of Team member information."""
@@ -12,8 +12,10 @@ from ph_units.unit_type import Unit
 
 from NBDM.model import operations
 from NBDM.model.collections import Collection
+from NBDM.model.slots import add_slots
 
 
+@add_slots
 @dataclass
 class NBDM_VentilationDevice:
     display_name: str = "-"
@@ -38,6 +40,7 @@ class NBDM_VentilationDevice:
         )
 
 
+@add_slots
 @dataclass
 class NBDM_BuildingSegmentVentilationSystems:
     _devices: Collection[NBDM_VentilationDevice] = field(default_factory=Collection)
@@ -0,0 +1,520 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""A local (SQLite) store of many NBDM Projects, for searching across a whole portfolio.
+
+Each Project's site / climate data, and the headline values (floor area, energy use,
+EUI, demands and loads) of its 'proposed' and 'baseline' variants, are stored in
+indexed columns, so that questions like "all the projects in climate zone 5 with a
+site-EUI above 30" can be answered without reading in any of the Projects. The full
+Project is also stored (in the compact binary format) so it can be read back out.
+
+All of the headline values are stored in IP units (see: 'PERFORMANCE_COLUMNS').
+
+Usage:
+------
+    >>> with PortfolioStore(pathlib.Path("portfolio.db")) as store:
+    >>>     added = store.add_json_files(pathlib.Path("projects").glob("*.json"))
+    >>>     rows = store.query(climate_zone="5", site_eui_kbtu_ft2__gt=30.0)
+    >>>     stats = store.statistics("site_eui_kbtu_ft2", _group_by="climate_zone")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pathlib
+import sqlite3
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from ph_units.unit_type import Unit
+
+from NBDM.from_binary.unpacker import unpack
+from NBDM.from_JSON.read import NBDM_Project_from_json_file
+from NBDM.model.project import NBDM_Project, NBDM_Variant
+from NBDM.model.serialization import to_dict
+from NBDM.to_binary.packer import pack
+
+# -- Increment whenever the database tables change.
+STORE_FORMAT_VERSION = 1
+
+PROJECT_COLUMNS: Tuple[str, ...] = (
+    "project_name",
+    "client",
+    "report_date",
+    "source_file",
+    "source_file_hash",
+    "climate_zone",
+    "climate_country",
+    "climate_region",
+    "climate_data_set",
+    "city",
+    "state",
+    "post_code",
+    "latitude",
+    "longitude",
+)
+
+# -- Column name: the unit the values are stored in (None for plain numbers)
+PERFORMANCE_COLUMNS: Dict[str, Optional[str]] = {
+    "floor_area_ft2": "FT2",
+    "envelope_area_ft2": "FT2",
+    "volume_ft3": "FT3",
+    "dwelling_units": None,
+    "occupants": None,
+    "site_energy_kbtu": "KBTU",
+    "site_energy_production_kbtu": "KBTU",
+    "source_energy_kbtu": "KBTU",
+    "site_eui_kbtu_ft2": "KBTU/FT2",
+    "source_eui_kbtu_ft2": "KBTU/FT2",
+    "heating_demand_kbtu": "KBTU",
+    "cooling_demand_kbtu": "KBTU",
+    "peak_heating_load_btuh": "BTUH",
+    "peak_cooling_load_btuh": "BTUH",
+}
+
+VARIANTS = ("proposed", "baseline")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    {project_columns},
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS performance (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    variant TEXT NOT NULL,
+    {performance_columns},
+    PRIMARY KEY (project_id, variant)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_source_file ON projects(source_file);
+CREATE INDEX IF NOT EXISTS idx_projects_climate_zone ON projects(climate_zone);
+CREATE INDEX IF NOT EXISTS idx_projects_climate_region
+    ON projects(climate_country, climate_region);
+CREATE INDEX IF NOT EXISTS idx_performance_site_eui
+    ON performance(variant, site_eui_kbtu_ft2);
+CREATE INDEX IF NOT EXISTS idx_performance_source_eui
+    ON performance(variant, source_eui_kbtu_ft2);
+""".format(
+    project_columns=",\n    ".join(
+        f"{c} REAL" if c in ("latitude", "longitude") else f"{c} TEXT"
+        for c in PROJECT_COLUMNS
+    ),
+    performance_columns=",\n    ".join(f"{c} REAL" for c in PERFORMANCE_COLUMNS),
+)
+
+_OPERATORS = {
+    "": "=",
+    "ne": "!=",
+    "gt": ">",
+    "ge": ">=",
+    "lt": "<",
+    "le": "<=",
+    "in": "IN",
+}
+
+
+class PortfolioStatistics(NamedTuple):
+    """Summary statistics for one column, over a group of projects."""
+
+    group: Any
+    count: int
+    minimum: Optional[float]
+    maximum: Optional[float]
+    mean: Optional[float]
+
+
+class AddedFiles(NamedTuple):
+    """The outcome of adding many .JSON files to the store."""
+
+    project_ids: Dict[pathlib.Path, int]
+    errors: Dict[pathlib.Path, str]
+
+
+def get_file_hash(_filepath: pathlib.Path, _chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex-digest of the file's contents."""
+    file_hash = hashlib.sha256()
+    with open(_filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(_chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _value_as(_unit: Unit, _unit_type: str) -> Optional[float]:
+    """Return the Unit's value in the unit-type given, or None if it can't be converted."""
+    try:
+        return _unit.as_a(_unit_type).value
+    except (ValueError, TypeError):
+        return None
+
+
+def _total(_units: Iterable[Unit], _unit_type: str) -> Optional[float]:
+    """Return the total of the Units in the unit-type given.
+
+    Zero values without a unit (ie: values which were never entered) are left out. If
+    there are no values left, or any value can't be converted, None is returned.
+    """
+    values = []
+    for unit in _units:
+        value = _value_as(unit, _unit_type)
+        if value is None and unit.value:
+            return None
+        elif value is not None:
+            values.append(value)
+    return sum(values) if values else None
+
+
+def _per_area(_value: Optional[float], _area: Optional[float]) -> Optional[float]:
+    if _value is None or not _area:
+        return None
+    return _value / _area
+
+
+def get_project_values(_project: NBDM_Project) -> Dict[str, Any]:
+    """Return the Project's site / climate values, as stored in the 'projects' table."""
+    site = _project.site
+    address = site.location.address
+    return {
+        "project_name": _project.project_name,
+        "client": _project.client,
+        "report_date": _project.report_date,
+        "climate_zone": site.climate.zone_passive_house,
+        "climate_country": site.climate.country,
+        "climate_region": site.climate.region,
+        "climate_data_set": site.climate.data_set,
+        "city": address.city,
+        "state": address.state,
+        "post_code": address.post_code,
+        "latitude": site.location.latitude,
+        "longitude": site.location.longitude,
+    }
+
+
+def get_variant_values(_variant: NBDM_Variant) -> Dict[str, Any]:
+    """Return the Variant's headline values, as stored in the 'performance' table."""
+    building = _variant.building
+    geometry = building.geometry
+    performance = building.performance
+    site_energy = performance.site_energy
+    cooling = performance.annual_cooling_energy_demand
+    peak_cooling = performance.peak_cooling_load
+
+    floor_area = _value_as(geometry.area_floor_area_net_interior_weighted, "FT2")
+    site_total = _total(
+        (
+            site_energy.consumption_gas,
+            site_energy.consumption_electricity,
+            site_energy.consumption_district_heat,
+            site_energy.consumption_other,
+        ),
+        "KBTU",
+    )
+    source = performance.source_energy
+    source_total = _total(
+        (
+            source.consumption_gas,
+            source.consumption_electricity,
+            source.consumption_district_heat,
+            source.consumption_other,
+        ),
+        "KBTU",
+    )
+
+    return {
+        "floor_area_ft2": floor_area,
+        "envelope_area_ft2": _value_as(geometry.area_envelope, "FT2"),
+        "volume_ft3": _value_as(geometry.volume_net_interior, "FT3"),
+        "dwelling_units": building.occupancy.total_dwelling_units,
+        "occupants": building.occupancy.total_occupants,
+        "site_energy_kbtu": site_total,
+        "site_energy_production_kbtu": _total(
+            (
+                site_energy.production_solar_photovoltaic,
+                site_energy.production_solar_thermal,
+                site_energy.production_other,
+            ),
+            "KBTU",
+        ),
+        "source_energy_kbtu": source_total,
+        "site_eui_kbtu_ft2": _per_area(site_total, floor_area),
+        "source_eui_kbtu_ft2": _per_area(source_total, floor_area),
+        "heating_demand_kbtu": _value_as(
+            performance.annual_heating_energy_demand.heating_demand, "KBTU"
+        ),
+        "cooling_demand_kbtu": _total(
+            (cooling.sensible_cooling_demand, cooling.latent_cooling_demand), "KBTU"
+        ),
+        "peak_heating_load_btuh": _value_as(
+            performance.peak_heating_load.peak_heating_load, "BTUH"
+        ),
+        "peak_cooling_load_btuh": _total(
+            (
+                peak_cooling.peak_sensible_cooling_load,
+                peak_cooling.peak_latent_cooling_load,
+            ),
+            "BTUH",
+        ),
+    }
+
+
+def _check_column(_column: str) -> None:
+    """Raise a ValueError if the name is not one of the store's columns."""
+    if _column not in PROJECT_COLUMNS and _column not in PERFORMANCE_COLUMNS:
+        raise ValueError(f"Error: Unknown portfolio column: '{_column}'")
+
+
+def _build_where(_filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """Return the SQL 'WHERE' clause (and its parameters) for the keyword filters.
+
+    Each filter is a column name, with an optional '__<operator>' suffix (one of:
+    ne, gt, ge, lt, le, in). ie: 'climate_zone="5"' or 'site_eui_kbtu_ft2__gt=30.0'
+    """
+    clauses = []
+    params: List[Any] = []
+    for key, value in _filters.items():
+        column, _, op_name = key.partition("__")
+        _check_column(column)
+        if op_name not in _OPERATORS:
+            raise ValueError(
+                f"Error: Unknown filter operator: '{op_name}'. "
+                f"Use one of: {[_ for _ in _OPERATORS if _]}"
+            )
+
+        if op_name == "in":
+            values = list(value)
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        elif value is None and op_name in ("", "ne"):
+            clauses.append(f"{column} IS {'NOT ' if op_name else ''}NULL")
+        else:
+            clauses.append(f"{column} {_OPERATORS[op_name]} ?")
+            params.append(value)
+
+    return " AND ".join(clauses) or "1", params
+
+
+class PortfolioStore:
+    """A local SQLite database of NBDM Projects, with indexed site and performance values.
+
+    Arguments:
+    ----------
+        * _db_path: (Union[pathlib.Path, str]) The database file to open (created if
+            it does not exist yet). Use ":memory:" for a temporary in-memory store.
+    """
+
+    def __init__(self, _db_path: Union[pathlib.Path, str]) -> None:
+        self.db_path = _db_path
+        self.connection = sqlite3.connect(str(_db_path))
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, STORE_FORMAT_VERSION):
+            self.connection.close()
+            raise ValueError(
+                f"Error: '{_db_path}' is a version-{version} portfolio store, but only "
+                f"version-{STORE_FORMAT_VERSION} stores can be opened."
+            )
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {STORE_FORMAT_VERSION}")
+
+    # -------------------------------------------------------------------------
+    # -- Adding / Removing Projects
+
+    def _insert_project(
+        self,
+        _project: NBDM_Project,
+        _source_file: Optional[str],
+        _source_file_hash: Optional[str],
+    ) -> int:
+        values = get_project_values(_project)
+        values["source_file"] = _source_file
+        values["source_file_hash"] = _source_file_hash
+        values["data"] = pack(to_dict(_project))
+
+        cursor = self.connection.execute(
+            f"INSERT INTO projects ({', '.join(values)}) "
+            f"VALUES ({', '.join('?' * len(values))})",
+            tuple(values.values()),
+        )
+        project_id: int = cursor.lastrowid  # type: ignore
+
+        for variant_name in VARIANTS:
+            variant = getattr(_project.variants, variant_name)
+            if not variant.has_building_segments:
+                continue
+            variant_values = get_variant_values(variant)
+            self.connection.execute(
+                f"INSERT INTO performance (project_id, variant, {', '.join(variant_values)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(variant_values))})",
+                (project_id, variant_name, *variant_values.values()),
+            )
+        return project_id
+
+    def add_project(self, _project: NBDM_Project) -> int:
+        """Add the NBDM_Project to the store, and return its new ID."""
+        with self.connection:
+            return self._insert_project(_project, None, None)
+
+    def _add_json_file(self, _json_file: pathlib.Path) -> int:
+        source_file = str(_json_file.resolve())
+        file_hash = get_file_hash(_json_file)
+        row = self.connection.execute(
+            "SELECT id, source_file_hash FROM projects WHERE source_file = ?",
+            (source_file,),
+        ).fetchone()
+        if row and row["source_file_hash"] == file_hash:
+            return row["id"]
+        if row:
+            self.connection.execute("DELETE FROM projects WHERE id = ?", (row["id"],))
+
+        project = NBDM_Project_from_json_file(_json_file)
+        return self._insert_project(project, source_file, file_hash)
+
+    def add_json_file(self, _json_file: pathlib.Path) -> int:
+        """Add the Project in the .JSON file to the store, and return its ID.
+
+        If the file was added before, it is only read in again if it has changed.
+        """
+        with self.connection:
+            return self._add_json_file(_json_file)
+
+    def add_json_files(self, _json_files: Iterable[pathlib.Path]) -> AddedFiles:
+        """Add the Projects in all the .JSON files to the store (in a single transaction).
+
+        A file which cannot be added (ie: it is unreadable or malformed) is skipped,
+        and its error is returned. All the other files are still added.
+
+        Returns:
+        --------
+            * (AddedFiles) The ID of each file's Project, and the error for any file
+                which could not be added.
+        """
+        result = AddedFiles({}, {})
+        with self.connection:
+            # -- Each file gets its own savepoint, so an error only undoes that file.
+            self.connection.execute("SAVEPOINT add_json_files")
+            for json_file in _json_files:
+                self.connection.execute("SAVEPOINT add_json_file")
+                try:
+                    result.project_ids[json_file] = self._add_json_file(json_file)
+                except Exception as e:
+                    self.connection.execute("ROLLBACK TO add_json_file")
+                    result.errors[json_file] = f"{type(e).__name__}: {e}"
+                self.connection.execute("RELEASE add_json_file")
+            self.connection.execute("RELEASE add_json_files")
+        return result
+
+    def remove_project(self, _project_id: int) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM projects WHERE id = ?", (_project_id,))
+
+    # -------------------------------------------------------------------------
+    # -- Reading Projects
+
+    def get_project(self, _project_id: int) -> NBDM_Project:
+        """Return the full NBDM_Project with the ID given."""
+        row = self.connection.execute(
+            "SELECT data FROM projects WHERE id = ?", (_project_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Error: No project with the ID: {_project_id} in the store.")
+        return NBDM_Project.from_dict(unpack(row["data"]))
+
+    @property
+    def project_ids(self) -> List[int]:
+        return [row[0] for row in self.connection.execute("SELECT id FROM projects")]
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    # -------------------------------------------------------------------------
+    # -- Queries
+
+    def query(
+        self, _variant: str = "proposed", _order_by: Optional[str] = None, **_filters: Any
+    ) -> List[Dict[str, Any]]:
+        """Return the site and headline values of every Project which matches the filters.
+
+        Only the indexed values are read, the Projects themselves are never built.
+
+        Arguments:
+        ----------
+            * _variant: (str) Default='proposed'. The variant ('proposed' or 'baseline')
+                to return (and filter) the performance values of.
+            * _order_by: (Optional[str]) A column name to sort the results by.
+            * _filters: Column-name=value, with an optional '__<operator>' suffix
+                (one of: ne, gt, ge, lt, le, in). ie: 'site_eui_kbtu_ft2__gt=30.0'
+
+        Returns:
+        --------
+            * (List[Dict[str, Any]]) One dict for each Project, with the Project 'id',
+                the 'variant', and all the PROJECT_COLUMNS and PERFORMANCE_COLUMNS.
+        """
+        where, params = _build_where(_filters)
+        sql = (
+            f"SELECT projects.id, performance.variant, {', '.join(PROJECT_COLUMNS)}, "
+            f"{', '.join(PERFORMANCE_COLUMNS)} "
+            "FROM projects JOIN performance ON performance.project_id = projects.id "
+            f"WHERE performance.variant = ? AND {where}"
+        )
+        if _order_by:
+            _check_column(_order_by)
+            sql += f" ORDER BY {_order_by}"
+
+        rows = self.connection.execute(sql, [_variant, *params])
+        return [dict(row) for row in rows]
+
+    def statistics(
+        self,
+        _column: str,
+        _variant: str = "proposed",
+        _group_by: Optional[str] = None,
+        **_filters: Any,
+    ) -> List[PortfolioStatistics]:
+        """Return the count, min, max and mean of a performance value across the Projects.
+
+        Arguments:
+        ----------
+            * _column: (str) The name of the performance value (see: PERFORMANCE_COLUMNS).
+            * _variant: (str) Default='proposed'. The variant ('proposed' or 'baseline').
+            * _group_by: (Optional[str]) A column name (ie: 'climate_zone') to group the
+                Projects by. Default=None, for one set of statistics for all the Projects.
+            * _filters: The same as for 'query'.
+
+        Returns:
+        --------
+            * (List[PortfolioStatistics]) The statistics for each group. The count is
+                of the Projects which have a value for the column.
+        """
+        if _column not in PERFORMANCE_COLUMNS:
+            raise ValueError(f"Error: Unknown portfolio performance column: '{_column}'")
+
+        where, params = _build_where(_filters)
+        group = "NULL"
+        if _group_by:
+            _check_column(_group_by)
+            group = _group_by
+
+        sql = (
+            f"SELECT {group}, COUNT({_column}), MIN({_column}), MAX({_column}), "
+            f"AVG({_column}) "
+            "FROM projects JOIN performance ON performance.project_id = projects.id "
+            f"WHERE performance.variant = ? AND {where}"
+        )
+        if _group_by:
+            sql += f" GROUP BY {group} ORDER BY {group}"
+
+        rows = self.connection.execute(sql, [_variant, *params])
+        return [PortfolioStatistics(*row) for row in rows]
+
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> PortfolioStore:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
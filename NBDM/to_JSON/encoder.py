@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Write NBDM Objects out as JSON text, directly to a stream.
+
+The output is exactly the same as 'json.dumps(serialization.to_dict(obj), indent=4)',
+but the intermediate dict (and the full JSON string) are never built. Each NBDM
+class is 'compiled' into a ClassEncoder only once, the first time it is written.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, List, TextIO, Tuple, Type
+from uuid import UUID
+
+from ph_units.unit_type import Unit
+
+from NBDM.model.collections import Collection
+
+INDENT = " " * 4
+
+Write = Callable[[str], Any]
+ValueWriter = Callable[[Any, Write, int], None]
+
+
+@lru_cache(maxsize=None)
+def _newline(_level: int) -> str:
+    """Return the newline and indentation for the nesting level."""
+    return "\n" + INDENT * _level
+
+
+def _write_float(_value: float, _write: Write, _level: int) -> None:
+    if _value != _value:
+        _write("NaN")
+    elif _value == float("inf"):
+        _write("Infinity")
+    elif _value == -float("inf"):
+        _write("-Infinity")
+    else:
+        _write(float.__repr__(_value))
+
+
+def _write_json_value(_value: Any, _write: Write, _level: int) -> None:
+    """Write a plain (non-NBDM) value, exactly as the 'json' module would."""
+    if isinstance(_value, str):
+        _write(encode_basestring_ascii(_value))
+    elif _value is None:
+        _write("null")
+    elif _value is True:
+        _write("true")
+    elif _value is False:
+        _write("false")
+    elif isinstance(_value, int):
+        _write(int.__repr__(_value))
+    elif isinstance(_value, float):
+        _write_float(_value, _write, _level)
+    elif isinstance(_value, (list, tuple)):
+        _write_items(_value, _write, _level, _write_json_value)
+    elif isinstance(_value, dict):
+        _write_mapping(_value.items(), _write, _level, _write_json_value)
+    else:
+        raise TypeError(
+            f"Object of type {type(_value).__name__} is not JSON serializable"
+        )
+
+
+def _json_key(_key: Any) -> str:
+    """Return the dict-key as JSON text, converted to a string the same way 'json' does."""
+    if isinstance(_key, str):
+        pass
+    elif isinstance(_key, float):
+        _key = "NaN" if _key != _key else float.__repr__(_key)
+    elif _key is True:
+        _key = "true"
+    elif _key is False:
+        _key = "false"
+    elif _key is None:
+        _key = "null"
+    elif isinstance(_key, int):
+        _key = int.__repr__(_key)
+    else:
+        raise TypeError(
+            f"keys must be str, int, float, bool or None, not {type(_key).__name__}"
+        )
+    return encode_basestring_ascii(_key) + ": "
+
+
+def _write_items(_items: Any, _write: Write, _level: int, _writer: ValueWriter) -> None:
+    """Write a JSON list, with each item written by the '_writer' function."""
+    if not _items:
+        _write("[]")
+        return
+    separator = _newline(_level + 1)
+    _write("[")
+    for item in _items:
+        _write(separator)
+        _writer(item, _write, _level + 1)
+        separator = "," + _newline(_level + 1)
+    _write(_newline(_level))
+    _write("]")
+
+
+def _write_mapping(_items: Any, _write: Write, _level: int, _writer: ValueWriter) -> None:
+    """Write a JSON object from (key, value) pairs, with each value written by '_writer'."""
+    separator = _newline(_level + 1)
+    _write("{")
+    empty = True
+    for key, value in _items:
+        _write(separator)
+        _write(_json_key(key))
+        _writer(value, _write, _level + 1)
+        separator = "," + _newline(_level + 1)
+        empty = False
+    _write("}" if empty else _newline(_level) + "}")
+
+
+def _write_NBDM_obj(_obj: Any, _write: Write, _level: int) -> None:
+    get_class_encoder(type(_obj)).write(_obj, _write, _level)
+
+
+def _write_collection(_value: Collection, _write: Write, _level: int) -> None:
+    _write_mapping(((item.key, item) for item in _value), _write, _level, _write_NBDM_obj)
+
+
+def _write_array(_value: array, _write: Write, _level: int) -> None:
+    _write_items(_value.tolist(), _write, _level, _write_json_value)
+
+
+def _write_list(_value: Any, _write: Write, _level: int) -> None:
+    _write_items(_value, _write, _level, _write_NBDM_obj)
+
+
+def _write_dict(_value: Dict, _write: Write, _level: int) -> None:
+    _write_mapping(_value.items(), _write, _level, _write_NBDM_obj)
+
+
+def _write_enum(_value: Enum, _write: Write, _level: int) -> None:
+    _write_json_value(_value.value, _write, _level)
+
+
+def _write_unit(_value: Unit, _write: Write, _level: int) -> None:
+    _write_json_value(_value.to_dict(), _write, _level)
+
+
+def _write_uuid(_value: UUID, _write: Write, _level: int) -> None:
+    _write(encode_basestring_ascii(str(_value)))
+
+
+@lru_cache(maxsize=None)
+def get_value_writer(_type: Type) -> ValueWriter:
+    """Return the (cached) function used to write a field-value of the type given.
+
+    The checks (and their order) are the same as in 'serialization.to_dict'.
+    """
+    if issubclass(_type, Collection):
+        return _write_collection
+    elif hasattr(_type, "__dataclass_fields__"):
+        return _write_NBDM_obj
+    elif issubclass(_type, array):
+        return _write_array
+    elif issubclass(_type, (list, tuple)):
+        return _write_list
+    elif issubclass(_type, dict):
+        return _write_dict
+    elif issubclass(_type, Enum):
+        return _write_enum
+    elif issubclass(_type, Unit):
+        return _write_unit
+    elif issubclass(_type, UUID):
+        return _write_uuid
+    else:
+        return _write_json_value
+
+
+class ClassEncoder:
+    """The field-names (already encoded as JSON keys) used to write one NBDM class.
+
+    The encoder is built only once for each class (see: 'get_class_encoder').
+    """
+
+    def __init__(self, _cls: Type) -> None:
+        self.cls = _cls
+        self.fields: Tuple[Tuple[str, str], ...] = tuple(
+            (f.name, _json_key(f.name)) for f in fields(_cls)
+        )
+
+    def write(self, _obj: Any, _write: Write, _level: int) -> None:
+        """Write the object's fields out as a JSON object."""
+        if not self.fields:
+            _write("{}")
+            return
+        separator = _newline(_level + 1)
+        _write("{")
+        for field_name, json_key in self.fields:
+            value = getattr(_obj, field_name)
+            _write(separator)
+            _write(json_key)
+            get_value_writer(type(value))(value, _write, _level + 1)
+            separator = "," + _newline(_level + 1)
+        _write(_newline(_level))
+        _write("}")
+
+    def __repr__(self) -> str:
+        field_names = tuple(name for name, _ in self.fields)
+        return f"{self.__class__.__name__}({self.cls.__name__}, {field_names})"
+
+
+@lru_cache(maxsize=None)
+def get_class_encoder(_cls: Type) -> ClassEncoder:
+    """Return the (cached) JSON encoder for the NBDM class."""
+    return ClassEncoder(_cls)
+
+
+class _BufferedWriter:
+    """Collect small pieces of text, and write them to the stream in larger blocks."""
+
+    def __init__(self, _stream: TextIO, _buffer_size: int = 2_000) -> None:
+        self.stream = _stream
+        self.buffer_size = _buffer_size
+        self.pieces: List[str] = []
+
+    def write(self, _text: str) -> None:
+        self.pieces.append(_text)
+        if len(self.pieces) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.stream.write("".join(self.pieces))
+        self.pieces.clear()
+
+
+def write_NBDM_obj_as_json(_obj: Any, _stream: TextIO) -> None:
+    """Write the NBDM Object to the text stream as JSON (indent=4).
+
+    Arguments:
+    ----------
+        * _obj: (Any) The NBDM Object (dataclass) to write.
+        * _stream: (TextIO) Any object with a 'write(str)' method, ie: an open file.
+    """
+    writer = _BufferedWriter(_stream)
+    _write_NBDM_obj(_obj, writer.write, 0)
+    writer.flush()
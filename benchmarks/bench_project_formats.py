@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# -*- Python Version: 3.11 -*-
+
+"""Compare the file size, save time and load time of the .JSON and binary project formats.
+
+The project is read in from the .JSON file given, then saved and re-loaded in each
+format. The fastest of the --repeat runs is reported for each.
+
+Usage:
+    python -m benchmarks.bench_project_formats [options]
+
+    --file FILE      The project .JSON file to use. Default=tests/_source_json/la_mora.json
+    --repeat N       Save and load each format N times, and keep the fastest. Default=20
+"""
+
+import argparse
+import pathlib
+import tempfile
+from typing import Callable, Dict, Tuple
+
+from benchmarks._measure import Measurement, measure
+from NBDM.from_binary.read import NBDM_Project_from_binary_file
+from NBDM.from_JSON.read import NBDM_Project_from_json_file
+from NBDM.model.project import NBDM_Project
+from NBDM.model.serialization import to_dict
+from NBDM.to_binary.write import NBDM_Project_to_binary_file
+from NBDM.to_JSON.write import NBDM_Project_to_json_file
+
+SOURCE_JSON_FILE = (
+    pathlib.Path(__file__).parents[1] / "tests" / "_source_json" / "la_mora.json"
+)
+
+FORMATS: Dict[
+    str,
+    Tuple[
+        str,
+        Callable[[NBDM_Project, pathlib.Path], None],
+        Callable[[pathlib.Path], NBDM_Project],
+    ],
+] = {
+    "json": (".json", NBDM_Project_to_json_file, NBDM_Project_from_json_file),
+    "binary": (".ccb", NBDM_Project_to_binary_file, NBDM_Project_from_binary_file),
+}
+
+
+def best_of(_func: Callable[[], object], _repeat: int) -> Measurement:
+    """Return the fastest Measurement of the function, over all of the repeats."""
+    best = None
+    for _ in range(_repeat):
+        with measure() as m:
+            _func()
+        best = m if best is None else best.best_of(m)
+    assert best is not None
+    return best
+
+
+def main(_source_file: pathlib.Path, _repeat: int) -> None:
+    project = NBDM_Project_from_json_file(_source_file)
+    expected = to_dict(project)
+
+    print(f"Project file: {_source_file}")
+    print(f"{'format':<8} {'size KB':>10} {'save ms':>10} {'load ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, (suffix, write, read) in FORMATS.items():
+            filepath = pathlib.Path(tmp_dir) / f"project{suffix}"
+            save = best_of(lambda: write(project, filepath), _repeat)
+            load = best_of(lambda: read(filepath), _repeat)
+            if to_dict(read(filepath)) != expected:
+                raise Exception(f"Error: The {name} project did not round-trip.")
+
+            print(
+                f"{name:<8} {filepath.stat().st_size / 1024:>10.1f} "
+                f"{save.wall_s * 1000:>10.2f} {load.wall_s * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", type=pathlib.Path, default=SOURCE_JSON_FILE)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.file, args.repeat)
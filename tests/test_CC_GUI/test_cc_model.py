@@ -0,0 +1,71 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pathlib
+
+import pytest
+from PyQt6 import QtWidgets as qtw
+
+from CC_GUI.cc_model import CCModel
+from CC_GUI.views.tree_view_tools import (
+    build_treeView_model,
+    create_tree_data,
+    get_treeView_model_as_dict,
+)
+from NBDM.model import output_format
+from NBDM.model.building import NBDM_BuildingSegment
+from NBDM.model.occupancy import NBDM_BuildingSegmentOccupancy
+
+
+@pytest.fixture
+def cc_model():
+    app = qtw.QApplication.instance() or qtw.QApplication([])
+    model = CCModel(output_format, pathlib.Path.cwd())
+    yield model
+    for thread in model.worker_threads:
+        thread.quit()
+        thread.wait()
+    model.deleteLater()
+    app.processEvents()
+
+
+def _segment(_name: str, _occupants: int) -> NBDM_BuildingSegment:
+    return NBDM_BuildingSegment(
+        segment_name=_name,
+        occupancy=NBDM_BuildingSegmentOccupancy(total_occupants=_occupants),
+    )
+
+
+def _treeView_data(_segments):
+    """Return the segment data, as the GUI would read it back out of the treeView."""
+    data = {
+        f"BUILDING SEGMENT: {seg.segment_name}": create_tree_data(output_format, seg)
+        for seg in _segments
+    }
+    return get_treeView_model_as_dict(build_treeView_model(data))
+
+
+def test_set_segments_from_treeView_data_reuses_unchanged_segments(cc_model) -> None:
+    project = cc_model.NBDM_project
+    baseline = [_segment(name, 5) for name in ("A", "B")]
+    proposed = [_segment(name, 1) for name in ("A", "B")]
+    for seg in baseline:
+        project.add_new_baseline_segment(seg)
+    for seg in proposed:
+        project.add_new_proposed_segment(seg)
+    change = project.variants.change_from_baseline_variant.building
+
+    # -- Saving the unchanged treeView data changes nothing
+    cc_model.set_project_baseline_segments_from_treeView_data(_treeView_data(baseline))
+    cc_model.set_project_proposed_segments_from_treeView_data(_treeView_data(proposed))
+    assert project.variants.proposed.get_building_segment("A") is proposed[0]
+    assert project.variants.change_from_baseline_variant.building is change
+
+    # -- Only the edited segment's change is re-calculated
+    proposed[1] = _segment("B", 2)
+    cc_model.set_project_proposed_segments_from_treeView_data(_treeView_data(proposed))
+    new_change = project.variants.change_from_baseline_variant.building
+    assert new_change is not change
+    assert new_change.get_building_segment("A") is change.get_building_segment("A")
+    assert new_change.get_building_segment("B").occupancy.total_occupants == 3
@@ -0,0 +1,39 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from CC_GUI.views.tree_view_tools import (
+    NBDM_Object_from_treeView,
+    build_treeView_model,
+    create_tree_data,
+    get_treeView_model_as_dict,
+)
+from NBDM.model import output_format, serialization
+from NBDM.model.building import NBDM_BuildingSegment
+from NBDM.model.performance import NBDM_MonthlySeries
+
+
+def _round_trip(_segment: NBDM_BuildingSegment) -> NBDM_BuildingSegment:
+    model = build_treeView_model(create_tree_data(output_format, _segment))
+    data = get_treeView_model_as_dict(model)
+    return NBDM_Object_from_treeView(output_format, data, NBDM_BuildingSegment)
+
+
+def test_default_segment_treeView_round_trip():
+    segment = NBDM_BuildingSegment()
+    new_segment = _round_trip(segment)
+    assert serialization.to_dict(new_segment) == serialization.to_dict(segment)
+
+
+def test_segment_monthly_series_treeView_round_trip():
+    segment = NBDM_BuildingSegment()
+    segment.performance.monthly.heating_demand = NBDM_MonthlySeries(
+        [float(i * 10) for i in range(12)], "KBTU"
+    )
+    segment.performance.monthly.cooling_demand = NBDM_MonthlySeries([1234.5] * 12, "KWH")
+
+    new_monthly = _round_trip(segment).performance.monthly
+    assert new_monthly.heating_demand.values.tolist() == [i * 10 for i in range(12)]
+    assert new_monthly.heating_demand.unit == "KBTU"
+    assert new_monthly.cooling_demand.values.tolist() == [1234.5] * 12
+    assert new_monthly.cooling_demand.unit == "KWH"
@@ -0,0 +1,69 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from NBDM.from_WUFI_PDF.batch import find_pdf_pairs, load_manifest, main
+
+
+def test_find_pdf_pairs(tmp_path: Path) -> None:
+    for name in ["a_baseline.pdf", "a_proposed.pdf", "b_baseline.pdf", "notes.pdf"]:
+        (tmp_path / name).write_bytes(b"")
+
+    jobs, failures = find_pdf_pairs(tmp_path, tmp_path / "out")
+
+    assert [job.name for job in jobs] == ["a"]
+    assert jobs[0].baseline == tmp_path / "a_baseline.pdf"
+    assert jobs[0].proposed == tmp_path / "a_proposed.pdf"
+    assert jobs[0].output == tmp_path / "out" / "a.json"
+    assert [f.name for f in failures] == ["b"]
+    assert not failures[0].ok
+
+
+def test_load_manifest(tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            [
+                {"name": "a", "baseline": "x/a_b.pdf", "proposed": "x/a_p.pdf"},
+                {
+                    "name": "b",
+                    "baseline": "b1.pdf",
+                    "proposed": "b2.pdf",
+                    "output": "b.json",
+                },
+            ]
+        )
+    )
+
+    jobs = load_manifest(manifest)
+    assert jobs[0].baseline == tmp_path / "x" / "a_b.pdf"
+    assert jobs[0].output == tmp_path / "a.json"
+    assert jobs[1].output == tmp_path / "b.json"
+
+    manifest.write_text(json.dumps([{"name": "a", "baseline": "a.pdf"}]))
+    with pytest.raises(ValueError):
+        load_manifest(manifest)
+
+
+def test_batch_builds_project(tmp_path: Path) -> None:
+    for variant in ("baseline", "proposed"):
+        shutil.copy(f"tests/_source_pdf/push_training_{variant}.pdf", tmp_path)
+    (tmp_path / "missing_baseline.pdf").write_bytes(b"")
+    summary = tmp_path / "summary.json"
+
+    exit_code = main(
+        [str(tmp_path), "--max-workers", "1", "--no-store", "--summary", str(summary)]
+    )
+
+    assert exit_code == 1
+    results = {r["name"]: r for r in json.loads(summary.read_text())["results"]}
+    assert results["missing"]["error"]
+    assert results["push_training"]["error"] is None
+
+    project = json.loads((tmp_path / "push_training.json").read_text())
+    assert project["project_name"] == "push_training"
+    for variant in ("baseline", "proposed"):
+        segments = project["variants"][variant]["building"]["_building_segments"]
+        assert [s["segment_name"] for s in segments.values()] == ["push_training"]
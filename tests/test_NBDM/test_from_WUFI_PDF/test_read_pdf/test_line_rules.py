@@ -0,0 +1,108 @@
+import pytest
+
+from NBDM.from_WUFI_PDF.pdf_sections._line_rules import LineRules
+from NBDM.from_WUFI_PDF.pdf_sections.annual_demand import (
+    WufiPDF_AnnualHeatingAndCoolingDemand,
+)
+from NBDM.from_WUFI_PDF.pdf_sections.peak_load import WufiPDF_PeakHeatingAndCoolingLoad
+from NBDM.from_WUFI_PDF.pdf_sections.res_electric import WufiPDF_ResidentialElectric
+
+
+def test_line_rules_match() -> None:
+    rules = LineRules(
+        {
+            "quantity": r"Quantity\s*(?P<value>\d+)",
+            "capacity": r"Capacity\s*(?P<value>\d+)",
+        }
+    )
+
+    name, match = rules.match("Capacity 40 Quantity 2")
+    assert name == "capacity"
+    assert match["value"] == "40"
+
+    name, match = rules.match("Quantity 2")
+    assert name == "quantity"
+    assert match["value"] == "2"
+
+    assert rules.match("Nothing here") == (None, None)
+
+
+def test_line_rules_first_rule_wins_at_same_place() -> None:
+    rules = LineRules({"lighting": r"User defined lighting", "custom": r"User defined"})
+    assert rules.match("User defined lighting 1")[0] == "lighting"
+    assert rules.match("User defined 1")[0] == "custom"
+
+
+def test_line_rules_dispatch() -> None:
+    rules = LineRules({"a": r"A=(?P<value>\d+)", "b": r"B=(?P<value>\d+)"})
+    found = []
+    rules.dispatch(
+        ["A=1", "B=2", "C=3", "A=4"], {"a": lambda m: found.append(int(m["value"]))}
+    )
+    assert found == [1, 4]
+
+
+def test_residential_electric_appliances() -> None:
+    section = WufiPDF_ResidentialElectric()
+    for line in [
+        "Type Quantity Indoor demand demand demand energy",
+        "Kitchen dishwasher 1 yes 1.3 5095.5 0 31292.6",
+        "Energy consumed by evaporation 1 yes 3.1 0 3018.6 18538.1",
+        "User defined lighting 1 yes 68,494 68494 0 420638.7",
+        "User defined 1 yes 1,910 1910 0 11729.8",
+        "Kitchen cooking 4 yes",
+        "Laundry - washer 4 yes 0.3 overlapping-text 0 944.9",
+    ]:
+        section.add_line(line)
+    section.process_section_text()
+
+    assert [a.quantity for a in section._appliances] == [1, 1, 1]
+    assert [a.annual_demand_kWh.value for a in section._appliances] == [
+        5095.5,
+        68494,
+        1910,
+    ]
+
+
+def test_annual_demand_columns() -> None:
+    section = WufiPDF_AnnualHeatingAndCoolingDemand()
+    for line in [
+        "Transmission losses : 169,662 kBtu/yr Solar heat gains: 111,236 kBtu/yr",
+        "Utilization factor: 88.1 % Utilization factor: 6 %",
+        "Annual heat demand: 1,974,718 kBtu/yr Cooling demand - sensible: 38,791 kBtu/yr",
+        "Specific annual heat demand: 382,240.3 Btu/ft²yr Cooling demand - latent: 168,414 kBtu/yr",
+        "Annual cooling demand: 207,205 kBtu/yr",
+        "Transmission losses",
+    ]:
+        section.add_line(line)
+    section.process_section_text()
+
+    assert section.heating_demand.transmission_losses.value == 169662
+    assert section.heating_demand.utilization_factor == pytest.approx(0.881)
+    assert section.heating_demand.annual_heat_demand.value == 1974718
+    assert section.cooling_demand.solar_heat_gains.value == 111236
+    assert section.cooling_demand.cooling_demand_sensible.value == 38791
+    assert section.cooling_demand.cooling_demand_latent.value == 168414
+    assert section.cooling_demand.annual_cooling_demand.value == 207205
+
+
+def test_peak_load_columns() -> None:
+    section = WufiPDF_PeakHeatingAndCoolingLoad()
+    for line in [
+        "Total heat loss: 763,630.7 Btu/hr 454,825.6 Btu/hr Total heat gains cooling: 28,765.3 Btu/hr",
+        "Heating load: 747,679 Btu/hr 448,862.4 Btu/hr Cooling load - sensible: 57,023.3 Btu/hr",
+        "Cooling load - latent: 0 Btu/hr",
+        "Relevant heating load: 747,679 Btu/hr Relevant cooling load: 57,023.3 Btu/hr",
+        "Specific heating load: 144.7 Btu/hr ft² Specific maximum cooling load: 11 Btu/hr ft²",
+    ]:
+        section.add_line(line)
+    section.process_section_text()
+
+    assert section.heating_load_1.total_heat_loss.value == 763630.7
+    assert section.heating_load_2.total_heat_loss.value == 454825.6
+    assert section.heating_load_1.heating_load.value == 747679
+    assert section.heating_load_2.heating_load.value == 448862.4
+    assert section.cooling_load.total_heat_gains_cooling.value == 28765.3
+    assert section.cooling_load.cooling_load_sensible.value == 57023.3
+    assert section.cooling_load.cooling_load_latent.value == 0
+    assert section.cooling_load.cooling_load.value == 57023.3
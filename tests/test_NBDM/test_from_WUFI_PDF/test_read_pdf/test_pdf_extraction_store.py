@@ -0,0 +1,154 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from NBDM.from_WUFI_PDF import pdf_reader
+from NBDM.from_WUFI_PDF.pdf_extraction_store import (
+    PDFExtractionFile,
+    PDFExtractionStore,
+    PDFPageData,
+)
+from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+
+
+def _sample_pages():
+    return [
+        PDFPageData(["Footer", "BUILDING INFORMATION", "Some text"]),
+        PDFPageData([""]),
+        PDFPageData(["Ünïcödé text", "more"], [[[["a", None], ["1", "2"]]]]),
+        PDFPageData(["no tables", "BUILDING INFORMATION"], [None, []]),
+    ]
+
+
+def test_store_round_trip(tmp_path: Path) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"some content")
+    store = PDFExtractionStore(tmp_path / "store")
+    assert store.open(source) is None
+
+    store.save(source, _sample_pages(), ["BUILDING INFORMATION"])
+
+    with store.open(source) as extraction_file:
+        assert list(extraction_file) == _sample_pages()
+        assert extraction_file.page_tables(0) is None
+        assert extraction_file.page_tables(3) == [None, []]
+        assert extraction_file.section_boundaries == [
+            (0, 1, "BUILDING INFORMATION"),
+            (3, 1, "BUILDING INFORMATION"),
+        ]
+        with pytest.raises(IndexError):
+            extraction_file.page_lines(4)
+
+
+def test_store_next_to_source(tmp_path: Path) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"some content")
+    store = PDFExtractionStore(_next_to_source=True)
+
+    assert store.save(source, _sample_pages(), []) == tmp_path / "a.pdf.ccpdf"
+    with store.open(source) as extraction_file:
+        assert len(extraction_file) == 4
+
+
+def test_store_invalidated_when_file_changes(tmp_path: Path) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"some content")
+    store = PDFExtractionStore(_next_to_source=True)
+    store.save(source, _sample_pages(), [])
+
+    source.write_bytes(b"some new content")
+    assert store.open(source) is None
+
+
+def test_store_rejects_invalid_file(tmp_path: Path) -> None:
+    bad_file = tmp_path / "bad.ccpdf"
+    bad_file.write_bytes(b"not a valid extraction file at all...")
+    with pytest.raises(ValueError):
+        PDFExtractionFile(bad_file)
+
+
+def test_store_rejects_invalid_meta(tmp_path: Path) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"some content")
+    store = PDFExtractionStore(_next_to_source=True)
+    store_path = store.save(source, _sample_pages(), [])
+
+    # -- Cut off the end of the meta JSON
+    store_path.write_bytes(store_path.read_bytes()[:-2])
+    with pytest.raises(ValueError):
+        PDFExtractionFile(store_path)
+    assert store.open(source) is None
+
+
+def test_store_concurrent_saves(tmp_path: Path) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"some content")
+    store = PDFExtractionStore(tmp_path / "store")
+
+    errors = []
+
+    def _save() -> None:
+        try:
+            for _ in range(20):
+                store.save(source, _sample_pages(), ["BUILDING INFORMATION"])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=_save) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert [p.suffix for p in (tmp_path / "store").iterdir()] == [".ccpdf"]
+    with store.open(source) as extraction_file:
+        assert list(extraction_file) == _sample_pages()
+
+
+def test_reader_replays_stored_pages(tmp_path: Path, monkeypatch) -> None:
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+    store = PDFExtractionStore(tmp_path)
+
+    reader_pdf = PDFReader(_extraction_store=store)
+    reader_pdf.load_pdf_file_data(filepath)
+
+    # -- The second read must not touch the PDF file at all
+    def _open(*args, **kwargs):
+        raise AssertionError("The PDF file should not be opened.")
+
+    monkeypatch.setattr(pdf_reader.pdfplumber, "open", _open)
+    reader_store = PDFReader(_extraction_store=store)
+    reader_store.load_pdf_file_data(filepath)
+
+    for key, section in reader_pdf.pdf_sections.items():
+        assert section._lines == reader_store.pdf_sections[key]._lines
+        assert section._tables == reader_store.pdf_sections[key]._tables
+
+
+def test_store_invalidated_when_headings_change(tmp_path: Path) -> None:
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"some content")
+    store = PDFExtractionStore(tmp_path / "store")
+    store.save(source, _sample_pages(), ["BUILDING INFORMATION"])
+
+    assert store.open(source, ["BUILDING INFORMATION", "OTHER SECTION"]) is None
+    with store.open(source, ["BUILDING INFORMATION"]) as extraction_file:
+        assert len(extraction_file) == 4
+
+
+def test_reader_reads_when_store_cannot_be_written(tmp_path: Path) -> None:
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+    not_a_dir = tmp_path / "not_a_dir"
+    not_a_dir.write_text("")
+    store = PDFExtractionStore(not_a_dir / "store")
+
+    reader_store = PDFReader(_extraction_store=store)
+    reader_store.load_pdf_file_data(filepath)
+    assert not reader_store.get_section_index(filepath).is_exact
+
+    reader_pdf = PDFReader()
+    reader_pdf.load_pdf_file_data(filepath)
+    for key, section in reader_pdf.pdf_sections.items():
+        assert section._lines == reader_store.pdf_sections[key]._lines
@@ -1,5 +1,23 @@
-from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+from pathlib import Path
+
+import pdfplumber
+
+from NBDM.from_WUFI_PDF import (
+    SITE_PDF_SECTIONS,
+    TEAM_PDF_SECTIONS,
+    create_NBDM_BuildingSegmentFromWufiPDF,
+    create_NBDM_Envelope_from_WufiPDF,
+    create_NBDM_Heating_Systems_from_WufiPDF,
+    create_NBDM_Site_from_WufiPDF,
+    create_NBDM_Team_from_WufiPDF,
+)
+from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore
+from NBDM.from_WUFI_PDF.pdf_reader import PDFReader, _chunk, extract_page_section_tables
+from NBDM.from_WUFI_PDF.pdf_section_index import PDFSectionIndex
 from NBDM.from_WUFI_PDF.pdf_sections.areas import WufiPDF_Areas
+from NBDM.from_WUFI_PDF.pdf_sections.hvac import WufiPDF_HVAC
+from NBDM.from_WUFI_PDF.pdf_sections.ph_requirements import WufiPDF_PHRequirements
+from NBDM.model.serialization import to_dict
 
 
 def test_multiple_readers_are_independent() -> None:
@@ -17,3 +35,194 @@ def test_multiple_readers_are_independent() -> None:
     assert reader_1.pdf_sections.get_section(
         WufiPDF_Areas
     ) != reader_2.pdf_sections.get_section(WufiPDF_Areas)
+
+
+def test_chunk_pages() -> None:
+    assert _chunk(list(range(5)), 2) == [[0, 1, 2], [3, 4]]
+    assert _chunk(list(range(2)), 4) == [[0], [1]]
+    assert _chunk([], 4) == []
+
+
+def test_parallel_read_matches_serial_read() -> None:
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+
+    reader_serial = PDFReader()
+    reader_serial.load_pdf_file_data(filepath)
+
+    reader_parallel = PDFReader(_max_workers=2, _parallel_min_pages=1)
+    assert reader_parallel.use_parallel_extraction(50)
+    reader_parallel.load_pdf_file_data(filepath)
+
+    for key, section in reader_serial.pdf_sections.items():
+        assert section._lines == reader_parallel.pdf_sections[key]._lines
+        assert section._tables == reader_parallel.pdf_sections[key]._tables
+
+
+def test_tables_split_at_section_headings() -> None:
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+
+    with pdfplumber.open(filepath) as pdf:
+        # -- Page 31: 'Property/Site' to 'SITE ENERGY MONTHLY REPORT'
+        page = pdf.pages[30]
+        page_tables = extract_page_section_tables(
+            page, ["SITE ENERGY MONTHLY REPORT"], [False, True]
+        )
+        assert page_tables[0] is None
+        assert page_tables[1] == page.extract_tables()
+
+        # -- Page 34: 'Project data' to 'Climate', all the tables are in 'Climate'
+        page = pdf.pages[33]
+        assert extract_page_section_tables(page, ["Climate"], [True, False]) == [[], None]
+        assert extract_page_section_tables(page, ["Climate"], [True, True]) == [
+            [],
+            page.extract_tables(),
+        ]
+
+        # -- Heading not found on the page: all the tables go to the last section
+        assert extract_page_section_tables(page, ["Not A Heading"], [True, True]) == [
+            [],
+            page.extract_tables(),
+        ]
+
+
+def test_read_only_requested_sections(sample_pdf_data_la_mora_baseline) -> None:
+    filepath = Path("tests/_source_pdf/la_mora_baseline.pdf")
+    section_classes = {*TEAM_PDF_SECTIONS, *SITE_PDF_SECTIONS}
+
+    pdf_data = PDFReader().extract_pdf_text_from_file(filepath, section_classes)
+
+    assert set(pdf_data.keys()) == {_.__pdf_heading_string__ for _ in section_classes}
+    assert pdf_data.get_section(WufiPDF_HVAC) is None
+    assert create_NBDM_Team_from_WufiPDF(pdf_data) == create_NBDM_Team_from_WufiPDF(
+        sample_pdf_data_la_mora_baseline
+    )
+    assert create_NBDM_Site_from_WufiPDF(pdf_data) == create_NBDM_Site_from_WufiPDF(
+        sample_pdf_data_la_mora_baseline
+    )
+
+
+def test_read_requested_sections_with_wrong_index(
+    tmp_path: Path, sample_pdf_data_la_mora_baseline
+) -> None:
+    filepath = Path("tests/_source_pdf/la_mora_baseline.pdf")
+    section_classes = {*TEAM_PDF_SECTIONS, *SITE_PDF_SECTIONS}
+    section_names = [_.__pdf_heading_string__ for _ in section_classes]
+
+    # -- An (approximate) index with the headings on a page pdfplumber can't find them on
+    store = PDFExtractionStore(tmp_path)
+    reader = PDFReader(_extraction_store=store)
+    with pdfplumber.open(filepath) as pdf:
+        pages_headings = [[] for _ in pdf.pages]
+    pages_headings[-1] = section_names
+    store.save_section_index(
+        filepath, PDFSectionIndex(pages_headings, "scan"), reader.pdf_sections.keys()
+    )
+
+    pdf_data = reader.extract_pdf_text_from_file(filepath, section_classes)
+
+    assert create_NBDM_Team_from_WufiPDF(pdf_data) == create_NBDM_Team_from_WufiPDF(
+        sample_pdf_data_la_mora_baseline
+    )
+    assert create_NBDM_Site_from_WufiPDF(pdf_data) == create_NBDM_Site_from_WufiPDF(
+        sample_pdf_data_la_mora_baseline
+    )
+
+
+def _build_all(_pdf_data):
+    return [
+        to_dict(builder(_pdf_data))
+        for builder in (
+            create_NBDM_Team_from_WufiPDF,
+            create_NBDM_Site_from_WufiPDF,
+            create_NBDM_BuildingSegmentFromWufiPDF,
+            create_NBDM_Envelope_from_WufiPDF,
+            create_NBDM_Heating_Systems_from_WufiPDF,
+        )
+    ]
+
+
+def test_iter_pdf_sections_matches_full_read(tmp_path: Path, monkeypatch) -> None:
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+    pdf_data = PDFReader().extract_pdf_text_from_file(filepath)
+    with pdfplumber.open(filepath) as pdf:
+        num_pages = len(pdf.pages)
+
+    pages_read = []
+    load_pdf_page = PDFReader._load_pdf_page
+
+    def _load_pdf_page(self, _page, *args, **kwargs):
+        pages_read.append(_page.page_number)
+        return load_pdf_page(self, _page, *args, **kwargs)
+
+    monkeypatch.setattr(PDFReader, "_load_pdf_page", _load_pdf_page)
+
+    # -- Sections are yielded (and then released) before the PDF is all read in
+    reader = PDFReader()
+    sections = reader.iter_pdf_sections(filepath)
+    first_section = next(sections)
+    assert len(pages_read) < num_pages
+    next(sections)
+    assert not first_section._lines
+    assert len(pages_read) < num_pages
+    list(sections)
+    assert len(pages_read) == num_pages
+    assert reader.pdf_sections.keys() == pdf_data.keys()
+    assert _build_all(reader.pdf_sections) == _build_all(pdf_data)
+
+    # -- Headings which turn up again later (ie: 'WINDOWS', 'HVAC') may only be in
+    # -- the outline once, so the streaming read does not rely on the outline.
+    store = PDFExtractionStore(tmp_path)
+    headings = reader.pdf_sections.keys()
+    scan_index = PDFSectionIndex.from_pdf_file(filepath, headings)
+    assert len(scan_index.start_pages(WufiPDF_HVAC.__pdf_heading_string__)) > 1
+    first_pages = {_: scan_index.start_pages(_)[0] for _ in scan_index}
+    outline_pages_headings = [[] for _ in range(scan_index.num_pages)]
+    for heading, page_index in first_pages.items():
+        outline_pages_headings[page_index].append(heading)
+    store.save_section_index(
+        filepath, PDFSectionIndex(outline_pages_headings, "outline"), headings
+    )
+    reader = PDFReader(_extraction_store=store)
+    list(reader.iter_pdf_sections(filepath))
+    assert _build_all(reader.pdf_sections) == _build_all(pdf_data)
+
+    # -- Once stored, the sections are all replayed from the store
+    pages_read.clear()
+    reader = PDFReader(_extraction_store=store)
+    list(reader.iter_pdf_sections(filepath))
+    assert not pages_read
+    assert _build_all(reader.pdf_sections) == _build_all(pdf_data)
+
+
+def _raw_data_holders(_obj):
+    """Yield the object, and all of the objects nested in it, which keep raw PDF data."""
+    yield _obj
+    for attr_value in vars(_obj).values():
+        items = attr_value if isinstance(attr_value, list) else [attr_value]
+        for item in items:
+            if hasattr(item, "_lines"):
+                yield from _raw_data_holders(item)
+
+
+def test_release_raw_data() -> None:
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+    reader = PDFReader()
+    reader.load_pdf_file_data(filepath)
+    reader.pdf_sections.process_all_sections()
+    pdf_data = reader.pdf_sections
+    pdf_data.__file_name__ = filepath.stem
+    hvac = pdf_data.get_section(WufiPDF_HVAC)
+    assert hvac._device_groups[0]._lines
+    assert hvac._device_groups[0]._devices[0]._lines
+    assert pdf_data.get_section(WufiPDF_PHRequirements).heating_demand._lines
+
+    # -- The reader releases the raw data once the sections are processed
+    released_data = PDFReader().extract_pdf_text_from_file(filepath)
+    assert released_data.keys() == pdf_data.keys()
+    for section in released_data.values():
+        for holder in _raw_data_holders(section):
+            assert not holder._lines
+            assert not getattr(holder, "_tables", None)
+
+    # -- Only the processed data is used to build the model
+    assert _build_all(released_data) == _build_all(pdf_data)
@@ -0,0 +1,145 @@
+import threading
+import time
+from pathlib import Path
+
+from NBDM.from_WUFI_PDF import pdf_extraction_store, pdf_reader, pdf_reader_cache
+from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore
+from NBDM.from_WUFI_PDF.pdf_reader import PDFReader
+from NBDM.from_WUFI_PDF.pdf_reader_cache import PDFReaderCache
+from NBDM.from_WUFI_PDF.pdf_reader_sections import PDFSectionsCollection
+from NBDM.from_WUFI_PDF.pdf_sections.site import WufiPDF_PropertySite
+
+
+def _make_file(_dir: Path, _name: str, _content: bytes) -> Path:
+    filepath = _dir / _name
+    filepath.write_bytes(_content)
+    return filepath
+
+
+def test_cache_returns_same_object(tmp_path: Path) -> None:
+    cache = PDFReaderCache()
+    filepath = _make_file(tmp_path, "a.pdf", b"some content")
+    pdf_data = PDFSectionsCollection()
+
+    assert cache.get(filepath) is None
+    cache.set(filepath, pdf_data)
+
+    assert cache.get(filepath) is pdf_data
+    assert filepath in cache
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cache_invalidated_when_file_changes(tmp_path: Path) -> None:
+    cache = PDFReaderCache()
+    filepath = _make_file(tmp_path, "a.pdf", b"some content")
+    cache.set(filepath, PDFSectionsCollection())
+
+    filepath.write_bytes(b"some new content")
+    assert cache.get(filepath) is None
+
+    cache.set(filepath, PDFSectionsCollection())
+    assert len(cache) == 1
+
+
+def test_cache_invalidated_when_reader_version_changes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    cache = PDFReaderCache()
+    filepath = _make_file(tmp_path, "a.pdf", b"some content")
+    cache.set(filepath, PDFSectionsCollection())
+
+    monkeypatch.setattr(PDFReader, "reader_version", PDFReader.reader_version + 1)
+    assert cache.get(filepath) is None
+
+
+def test_cache_lru_eviction(tmp_path: Path) -> None:
+    cache = PDFReaderCache(_max_size=2)
+    file_a = _make_file(tmp_path, "a.pdf", b"a")
+    file_b = _make_file(tmp_path, "b.pdf", b"b")
+    file_c = _make_file(tmp_path, "c.pdf", b"c")
+
+    cache.set(file_a, PDFSectionsCollection())
+    cache.set(file_b, PDFSectionsCollection())
+    cache.get(file_a)  # -- 'a' is now the most recently used
+    cache.set(file_c, PDFSectionsCollection())
+
+    assert len(cache) == 2
+    assert file_a in cache
+    assert file_b not in cache
+    assert file_c in cache
+
+
+def test_cache_gives_each_caller_a_copy(tmp_path: Path) -> None:
+    cache = PDFReaderCache()
+    filepath = _make_file(tmp_path, "a.pdf", b"some content")
+    pdf_data = PDFSectionsCollection()
+    site = WufiPDF_PropertySite()
+    site.data_set = "New York"
+    pdf_data.set_section(WufiPDF_PropertySite, site)
+    cache.set(filepath, pdf_data)
+
+    data_1 = cache.extract_pdf_text_from_file(filepath)
+    data_2 = cache.extract_pdf_text_from_file(filepath)
+    assert data_1 is not pdf_data
+    assert data_1 is not data_2
+    assert data_1.logger is pdf_data.logger
+
+    data_1.get_section(WufiPDF_PropertySite).data_set = "Boston"
+    assert data_2.get_section(WufiPDF_PropertySite).data_set == "New York"
+    assert cache.get(filepath).get_section(WufiPDF_PropertySite).data_set == "New York"
+
+
+def test_cache_reads_file_once_for_concurrent_callers(
+    tmp_path: Path, monkeypatch
+) -> None:
+    cache = PDFReaderCache()
+    filepath = _make_file(tmp_path, "a.pdf", b"some content")
+
+    num_reads = []
+
+    def _slow_read(*args, **kwargs) -> PDFSectionsCollection:
+        num_reads.append(1)
+        time.sleep(0.2)
+        return PDFSectionsCollection()
+
+    monkeypatch.setattr(PDFReader, "extract_pdf_text_from_file", _slow_read)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.extract_pdf_text_from_file(filepath))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(num_reads) == 1
+    assert len(results) == 4
+    assert len({id(pdf_data) for pdf_data in results}) == 4
+    assert filepath in cache
+
+
+def test_cache_hashes_file_once_per_read(tmp_path: Path, monkeypatch) -> None:
+    cache = PDFReaderCache(_extraction_store=PDFExtractionStore(tmp_path))
+    filepath = Path("tests/_source_pdf/push_training_baseline.pdf")
+
+    hashed = []
+    get_file_hash = pdf_extraction_store.get_file_hash
+
+    def _get_file_hash(*args, **kwargs) -> str:
+        hashed.append(1)
+        return get_file_hash(*args, **kwargs)
+
+    for module in (pdf_extraction_store, pdf_reader, pdf_reader_cache):
+        monkeypatch.setattr(module, "get_file_hash", _get_file_hash)
+
+    # -- Read from the PDF file, then from the extraction-store
+    cache.extract_pdf_text_from_file(filepath)
+    assert len(hashed) == 1
+    cache.clear()
+    cache.extract_pdf_text_from_file(filepath)
+    assert len(hashed) == 2
@@ -0,0 +1,103 @@
+from pathlib import Path
+from typing import List, Tuple
+
+from NBDM.from_WUFI_PDF.pdf_extraction_store import PDFExtractionStore
+from NBDM.from_WUFI_PDF.pdf_section_index import PDFSectionIndex
+
+HEADINGS = ["Project data", "CLIMATE", "HVAC"]
+
+
+def _make_pdf(_pages_text: List[str], _outline: List[Tuple[str, int]]) -> bytes:
+    """Return a minimal PDF with a single line of text on each page, and an outline."""
+    num_pages = len(_pages_text)
+    font = 4 + 2 * num_pages
+    items = list(range(font + 1, font + 1 + len(_outline)))
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(num_pages))
+
+    objs = {
+        1: "<< /Type /Catalog /Pages 2 0 R /Outlines 3 0 R >>",
+        2: f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>",
+        3: "<< /Type /Outlines /Count 0 >>",
+        font: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for i, text in enumerate(_pages_text):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objs[4 + 2 * i] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents "
+            f"{5 + 2 * i} 0 R /Resources << /Font << /F1 {font} 0 R >> >> >>"
+        )
+        objs[5 + 2 * i] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+    if items:
+        objs[3] = (
+            f"<< /Type /Outlines /First {items[0]} 0 R /Last {items[-1]} 0 R "
+            f"/Count {len(items)} >>"
+        )
+    for k, (title, page_index) in enumerate(_outline):
+        links = f" /Prev {items[k - 1]} 0 R" if k > 0 else ""
+        links += f" /Next {items[k + 1]} 0 R" if k < len(items) - 1 else ""
+        objs[items[k]] = (
+            f"<< /Title ({title}) /Parent 3 0 R "
+            f"/Dest [{4 + 2 * page_index} 0 R /Fit]{links} >>"
+        )
+
+    pdf, offsets = b"%PDF-1.4\n", []
+    for num in sorted(objs):
+        offsets.append(len(pdf))
+        pdf += f"{num} 0 obj\n{objs[num]}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    pdf += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\n".encode()
+    pdf += f"startxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+
+def test_section_page_ranges() -> None:
+    index = PDFSectionIndex([[], ["Project data"], [], ["CLIMATE", "HVAC"], [], ["HVAC"]])
+
+    assert index.num_pages == 6
+    assert index.page_ranges("Project data") == [range(1, 4)]
+    assert index.page_ranges("CLIMATE") == [range(3, 4)]
+    assert index.page_ranges("HVAC") == [range(3, 6), range(5, 6)]
+    assert index.start_pages("HVAC") == [3, 5]
+    assert index.section_pages("HVAC") == [3, 4, 5]
+    assert index.page_ranges("Not A Heading") == []
+    assert "CLIMATE" in index
+    assert "Not A Heading" not in index
+
+
+def test_index_from_scan(tmp_path: Path) -> None:
+    filepath = tmp_path / "a.pdf"
+    filepath.write_bytes(_make_pdf(["Project data", "some text", "CLIMATE"], []))
+
+    index = PDFSectionIndex.from_pdf_file(filepath, HEADINGS)
+    assert index.source == "scan"
+    assert not index.is_exact
+    assert index.pages_headings == [["Project data"], [], ["CLIMATE"]]
+
+
+def test_index_from_outline(tmp_path: Path) -> None:
+    filepath = tmp_path / "a.pdf"
+    outline = [("Project data", 0), ("Not A Heading", 1), ("HVAC", 1)]
+    filepath.write_bytes(_make_pdf(["Project data", "HVAC", "CLIMATE"], outline))
+
+    index = PDFSectionIndex.from_pdf_file(filepath, HEADINGS)
+    assert index.source == "outline"
+    assert index.pages_headings == [["Project data"], ["HVAC"], []]
+
+
+def test_index_stored_with_file(tmp_path: Path) -> None:
+    filepath = tmp_path / "a.pdf"
+    filepath.write_bytes(_make_pdf(["Project data", "some text", "CLIMATE"], []))
+    store = PDFExtractionStore(tmp_path / "store")
+    assert store.open_section_index(filepath, HEADINGS) is None
+
+    store.save_section_index(
+        filepath, PDFSectionIndex.from_pdf_file(filepath, HEADINGS), HEADINGS
+    )
+    index = store.open_section_index(filepath, HEADINGS)
+    assert index is not None
+    assert index.pages_headings == [["Project data"], [], ["CLIMATE"]]
+
+    # -- Looking for a different set of headings needs a new index
+    assert store.open_section_index(filepath, HEADINGS[:2]) is None
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+from ph_units.unit_type import Unit
+
+from NBDM.from_WUFI_PDF.pdf_sections.site_energy_monthly import (
+    SiteEnergyMonthlyTable,
+    WufiPDF_SiteEnergyMonthly,
+)
+
+
+def _row(_name: str, *_values: str) -> list:
+    return [_name, *_values]
+
+
+TABLE_DATA = [
+    _row("", "Jan", "Feb", "Mar", "Apr", "May", "Jun"),
+    _row("Space Heating", *["1,000.0"] * 12),
+    _row("Hot Water", *["10"] * 11, "NaN"),
+    _row("Lighting", *["5"] * 11, "-"),
+    _row("Renewable Electricity Production", *["2"] * 12),
+    _row("Sum", *["9999"] * 12),
+]
+
+
+def test_site_energy_monthly_table() -> None:
+    table = SiteEnergyMonthlyTable()
+    table.process_pdf_table_data(TABLE_DATA)
+
+    assert table.space_heating.JAN == 1_000.0
+    assert table.space_heating.data == [1_000.0] * 12
+    assert table.space_heating.total == 12_000.0
+    assert table.hot_water.DEC == 0.0
+    assert table.hot_water.total == 110.0
+
+    # -- Rows with any data which is not a number are not counted
+    assert not table.lighting.is_valid
+    assert table.lighting.total == 0.0
+
+    assert table.total_consumption_kwh == Unit(12_110.0, "KWH")
+    assert table.total_production_kwh == Unit(24.0, "KWH")
+    assert table.monthly_consumption_kwh == [1_010.0] * 11 + [1_000.0]
+    assert table.monthly_production_kwh == [2.0] * 12
+
+    with pytest.raises(AttributeError):
+        table.space_heating.not_a_month
+
+
+def test_site_energy_monthly_table_too_many_months() -> None:
+    table = SiteEnergyMonthlyTable()
+    with pytest.raises(IndexError):
+        table.process_pdf_table_data([_row("Space Heating", *["1"] * 13)])
+
+
+def test_site_energy_monthly_section() -> None:
+    section = WufiPDF_SiteEnergyMonthly()
+    section.add_table(TABLE_DATA)
+    section.add_table([_row("Space Heating", *["1"] * 12)])
+    section.process_section_text()
+
+    assert len(section.monthly_consumption_electricity) == 12
+    assert section.monthly_consumption_gas[0] == Unit(1.0, "KWH").as_a("KBTU")
+    assert sum(u.value for u in section.monthly_production_solar_photovoltaic) == (
+        pytest.approx(section.production_solar_photovoltaic.value)
+    )
+
+    section = pickle.loads(pickle.dumps(section))
+    assert section.table_gas_kwh.space_heating.total == 12.0
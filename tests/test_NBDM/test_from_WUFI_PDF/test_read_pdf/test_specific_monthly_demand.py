@@ -0,0 +1,36 @@
+from ph_units.unit_type import Unit
+
+from NBDM.from_WUFI_PDF.pdf_sections.specific_monthly_demand import (
+    WufiPDF_SpecificMonthlyDemand,
+)
+from NBDM.from_WUFI_PDF.performance import build_NBDM_monthlyDemandFromWufiPDF
+
+
+def test_specific_monthly_demand() -> None:
+    section = WufiPDF_SpecificMonthlyDemand()
+    for line in [
+        "Heating Cooling",
+        "[kBtu/ft²] [kBtu/ft²]",
+        "January 1.4 0",
+        "February 0.6 0",
+        "July 0 1.4",
+        "WUFI®Passive V.3.3.0.2: Page 6",
+        "yraunaJ yraurbeF hcraM lirpA yaM enuJ yluJ tsuguA rebmetpeS rebotcO",
+    ]:
+        section.add_line(line)
+    section.process_section_text()
+
+    assert section.heating_kbtu_ft2 == [1.4, 0.6] + [0.0] * 10
+    assert section.cooling_kbtu_ft2[6] == 1.4
+    assert sum(section.cooling_kbtu_ft2) == 1.4
+
+
+def test_monthly_demand_is_split_from_annual() -> None:
+    series = build_NBDM_monthlyDemandFromWufiPDF(
+        Unit(1_000.0, "KBTU"), [1.5, 0.5] + [0.0] * 10
+    )
+    assert series.values.tolist() == [750.0, 250.0] + [0.0] * 10
+    assert series.total == Unit(1_000.0, "KBTU")
+
+    series = build_NBDM_monthlyDemandFromWufiPDF(Unit(1_000.0, "KBTU"), [0.0] * 12)
+    assert series.total == Unit(0.0, "KBTU")
@@ -0,0 +1,37 @@
+from ph_units.unit_type import Unit
+
+from NBDM.from_WUFI_PDF.pdf_sections._units import (
+    clear_unit_cache,
+    text_to_unit,
+    unit_cache_info,
+)
+from NBDM.from_WUFI_PDF.pdf_sections.peak_load import PeakLoad
+
+
+def test_text_to_unit() -> None:
+    assert text_to_unit("58,327.2 Btu/hr") == Unit(58_327.2, "BTUH")
+    assert text_to_unit("45,567 ft2") == Unit(45_567, "FT2")
+    assert text_to_unit("0.5") == "0.5"
+    assert text_to_unit("12 not-a-unit") == "12 not-a-unit"
+
+
+def test_text_to_unit_returns_new_objects() -> None:
+    assert text_to_unit("1.0 Btu/hr") is not text_to_unit("1.0 Btu/hr")
+
+
+def test_unit_cache_counters() -> None:
+    load = PeakLoad("heating_load_1")
+    clear_unit_cache()
+    load.heating_load = "10 Btu/hr"
+    load.cooling_load = "10 Btu/hr"
+    load.solar_heat_gain = "20 Btu/hr"
+
+    assert load.heating_load == Unit(10.0, "BTUH")
+    info = unit_cache_info()
+    assert info["value_text"].hits == 1
+    assert info["value_text"].misses == 2
+    assert info["unit_name"].hits == 2
+    assert info["unit_name"].misses == 1
+
+    clear_unit_cache()
+    assert unit_cache_info()["value_text"].currsize == 0
@@ -0,0 +1,58 @@
+import json
+import pathlib
+
+import pytest
+
+from NBDM.from_JSON.json_stream import JSONStreamReader
+from NBDM.from_JSON.read import NBDM_Project_from_json_file
+from NBDM.model import serialization
+from NBDM.model.project import NBDM_Project
+
+JSON_FILE = pathlib.Path("tests/_source_json/la_mora.json")
+
+
+def _reader(_tmp_path: pathlib.Path, _text: str, _chunk_size: int) -> JSONStreamReader:
+    file_path = _tmp_path / "data.json"
+    file_path.write_text(_text, encoding="utf-8")
+    return JSONStreamReader(file_path.open("rb"), _chunk_size=_chunk_size)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1_000])
+def test_json_stream_reader(tmp_path: pathlib.Path, chunk_size: int) -> None:
+    text = ' {"a": 12345, "b" : {"c": [1, 2.5, null], "ü": "x\\"y"}, "d": {}, "e": 1e3} '
+    reader = _reader(tmp_path, text, chunk_size)
+
+    d = {}
+    for key in reader.iter_object():
+        if key == "b":
+            d[key] = {k: reader.read_value() for k in reader.iter_object()}
+        else:
+            d[key] = reader.read_value()
+    reader.check_end()
+    reader.file.close()
+
+    assert d == json.loads(text)
+
+
+@pytest.mark.parametrize(
+    "text", ['{"a": 1', '{"a" 1}', '{"a": 1 "b": 2}', '{"a": 1} 2', "[1, 2"]
+)
+def test_json_stream_reader_errors(tmp_path: pathlib.Path, text: str) -> None:
+    reader = _reader(tmp_path, text, 2)
+    with pytest.raises(json.JSONDecodeError):
+        for _ in reader.iter_object():
+            reader.read_value()
+        reader.check_end()
+    reader.file.close()
+
+
+def test_read_json_file_same_as_from_dict() -> None:
+    progress = []
+    new_project = NBDM_Project_from_json_file(JSON_FILE, progress.append)
+
+    with JSON_FILE.open() as f:
+        old_project = NBDM_Project.from_dict(json.load(f))
+
+    assert serialization.to_dict(new_project) == serialization.to_dict(old_project)
+    assert progress[-1] == 1.0
+    assert progress == sorted(progress)
@@ -2,6 +2,7 @@ import os
 import pathlib
 
 from NBDM.from_JSON.read import NBDM_Project_from_json_file
+from NBDM.model import serialization
 from NBDM.model.project import NBDM_Project
 from NBDM.to_JSON.write import NBDM_Project_to_json_file
 
@@ -24,3 +25,26 @@ def test_read_json_file_then_write_out() -> None:
     finally:
         if pathlib.Path.exists(WRITE_FILE):
             os.remove(WRITE_FILE)
+
+
+def test_read_json_file_lazy() -> None:
+    project = NBDM_Project_from_json_file(JSON_FILE, _lazy=True)
+    segments = project.variants.proposed.building._building_segments
+    assemblies = project.envelope._assembly_types._data
+
+    # -- Nothing is built until it is used
+    assert segments.unloaded_keys == list(segments.keys())
+    assert assemblies.unloaded_keys == list(assemblies.keys())
+    assert project.variants.proposed.building_segment_names == sorted(segments.keys())
+
+    segment_name = project.variants.proposed.building_segment_names[0]
+    segment = project.variants.proposed.get_building_segment(segment_name)
+    assert segment.segment_name == segment_name
+    assert segments.is_loaded(segment_name)
+    assert assemblies.unloaded_keys
+
+    # -- Once it is all built, it is the same as the Project read in all at once
+    eager_project = NBDM_Project_from_json_file(JSON_FILE)
+    assert serialization.to_dict(project) == serialization.to_dict(eager_project)
+    assert not segments.unloaded_keys
+    assert not assemblies.unloaded_keys
@@ -2,7 +2,12 @@ from copy import copy
 from dataclasses import asdict
 
 from NBDM.model import serialization
-from NBDM.model.building import NBDM_Building
+from NBDM.model.building import (
+    BuildingChangeTracker,
+    NBDM_Building,
+    NBDM_BuildingSegment,
+)
+from NBDM.model.occupancy import NBDM_BuildingSegmentOccupancy
 
 
 def test_building(sample_NBDM_Building):
@@ -28,3 +33,114 @@ def test_subtract_buildings(sample_NBDM_Building: NBDM_Building):
     assert b3.building_type == b1.building_type
     assert len(b3.building_segments) == len(b1.building_segments)
     assert len(b3.building_segment_names) == len(b1.building_segment_names)
+
+
+def _segment(_name: str, _occupants: int) -> NBDM_BuildingSegment:
+    return NBDM_BuildingSegment(
+        segment_name=_name,
+        occupancy=NBDM_BuildingSegmentOccupancy(total_occupants=_occupants),
+    )
+
+
+def test_building_aggregates_are_cached():
+    building = NBDM_Building()
+    building.add_building_segment(_segment("A", 1))
+    building.add_building_segment(_segment("B", 2))
+
+    occupancy = building.occupancy
+    assert occupancy.total_occupants == 3
+    assert building.occupancy is occupancy
+    assert building.geometry is building.geometry
+    assert building.performance is building.performance
+
+    # -- The cache is never serialized
+    assert "_aggregates" not in serialization.to_dict(building)
+
+
+def test_building_aggregates_invalidated_on_segment_changes():
+    building = NBDM_Building()
+    building.add_building_segment(_segment("A", 1))
+    assert building.occupancy.total_occupants == 1
+
+    building.add_building_segment(_segment("B", 2))
+    assert building.occupancy.total_occupants == 3
+
+    # -- In-place edits need an explicit invalidate
+    building.get_building_segment("B").occupancy.total_occupants = 5
+    assert building.occupancy.total_occupants == 3
+    building.invalidate_aggregates()
+    assert building.occupancy.total_occupants == 6
+
+    building.remove_segment_by_name("A")
+    assert building.occupancy.total_occupants == 5
+
+    building.clear_building_segments()
+    building.add_building_segment(_segment("C", 7))
+    assert building.occupancy.total_occupants == 7
+
+
+def test_subtract_buildings_matches_segments_by_name():
+    building_a = NBDM_Building()
+    building_a.add_building_segment(_segment("A", 5))
+    building_a.add_building_segment(_segment("B", 5))
+    building_b = NBDM_Building()
+    building_b.add_building_segment(_segment("AA", 1))
+    building_b.add_building_segment(_segment("B", 2))
+
+    difference = building_a - building_b
+    assert difference.building_segment_names == ["B"]
+    assert difference.occupancy.total_occupants == 3
+
+
+def test_building_change_tracker_reuses_unchanged_segments():
+    building_a = NBDM_Building()
+    building_b = NBDM_Building()
+    for name in ("A", "B", "C"):
+        building_a.add_building_segment(_segment(name, 5))
+        building_b.add_building_segment(_segment(name, 1))
+
+    tracker = BuildingChangeTracker()
+    difference = tracker.subtract(building_a, building_b)
+    assert tracker.subtract(building_a, building_b) is difference
+
+    building_b.add_building_segment(_segment("B", 2))
+    new_difference = tracker.subtract(building_a, building_b)
+    assert new_difference is not difference
+    assert new_difference.get_building_segment("A") is difference.get_building_segment(
+        "A"
+    )
+    assert new_difference.get_building_segment("C") is difference.get_building_segment(
+        "C"
+    )
+    assert new_difference.get_building_segment("B").occupancy.total_occupants == 3
+
+
+def test_update_building_segments_keeps_unchanged_segments():
+    building_a = NBDM_Building()
+    building_b = NBDM_Building()
+    for name in ("A", "B", "C"):
+        building_a.add_building_segment(_segment(name, 5))
+        building_b.add_building_segment(_segment(name, 1))
+
+    tracker = BuildingChangeTracker()
+    difference = tracker.subtract(building_a, building_b)
+    version = building_b.version
+    segment_a = building_b.get_building_segment("A")
+
+    # -- Equal (but new) Segments are not replaced, so nothing has changed
+    building_b.update_building_segments([_segment(n, 1) for n in ("A", "B", "C")])
+    assert building_b.version == version
+    assert building_b.get_building_segment("A") is segment_a
+    assert tracker.subtract(building_a, building_b) is difference
+
+    # -- Only the edited Segment is replaced, and any missing Segment is removed
+    building_b.update_building_segments([_segment("A", 1), _segment("B", 2)])
+    assert building_b.building_segment_names == ["A", "B"]
+    assert building_b.get_building_segment("A") is segment_a
+    new_difference = tracker.subtract(building_a, building_b)
+    assert new_difference.building_segment_names == ["A", "B"]
+    assert new_difference.get_building_segment("A") is difference.get_building_segment(
+        "A"
+    )
+    assert new_difference.get_building_segment("B").occupancy.total_occupants == 3
+    assert building_b.occupancy.total_occupants == 3
@@ -0,0 +1,122 @@
+import copy
+import json
+import pickle
+import threading
+import time
+
+import pytest
+
+from NBDM.model.collections import LazyDict
+
+
+def _lazy_dict(_calls: list) -> LazyDict:
+    d = LazyDict(a=1)
+    for key, value in (("b", 2), ("c", 3)):
+        d.set_loader(key, lambda k=key, v=value: _calls.append(k) or v)
+    return d
+
+
+def test_lazy_dict_loads_on_access() -> None:
+    calls = []
+    d = _lazy_dict(calls)
+    assert list(d.keys()) == ["a", "b", "c"]
+    assert len(d) == 3 and "b" in d
+    assert d.unloaded_keys == ["b", "c"]
+    assert calls == []
+
+    assert d["b"] == 2
+    assert d["b"] == 2
+    assert calls == ["b"]
+    assert d.is_loaded("b") and not d.is_loaded("c")
+
+    assert d.get("c") == 3
+    assert d.get("x", 0) == 0
+    assert calls == ["b", "c"]
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda d: list(d.values()),
+        lambda d: list(d.items()),
+        dict,
+        lambda d: {**d},
+        lambda d: d == {"a": 1, "b": 2, "c": 3},
+        json.dumps,
+        lambda d: pickle.loads(pickle.dumps(d)),
+        lambda d: d.copy(),
+    ],
+)
+def test_lazy_dict_loads_all_values(func) -> None:
+    d = _lazy_dict([])
+    func(d)
+    assert not d.unloaded_keys
+    assert dict(d) == {"a": 1, "b": 2, "c": 3}
+
+
+def test_lazy_dict_edit() -> None:
+    calls = []
+    d = _lazy_dict(calls)
+    d["b"] = 20
+    del d["c"]
+    assert d == {"a": 1, "b": 20}
+    assert calls == []
+
+    d = _lazy_dict(calls)
+    assert d.pop("b") == 2
+    assert d.popitem() == ("c", 3)
+    assert d.setdefault("a", 10) == 1
+    d.update(b=5)
+    assert d == {"a": 1, "b": 5}
+
+    d = _lazy_dict(calls)
+    d.clear()
+    assert not d and not d.unloaded_keys
+
+
+def test_lazy_dict_deepcopy_shares_loaders() -> None:
+    calls = []
+    d = _lazy_dict(calls)
+    d_copy = copy.deepcopy(d)
+    assert d_copy.unloaded_keys == ["b", "c"]
+    assert calls == []
+
+    assert d_copy == {"a": 1, "b": 2, "c": 3}
+    assert d.unloaded_keys == ["b", "c"]
+
+
+def test_lazy_dict_loads_once_across_threads() -> None:
+    calls = []
+
+    def _loader() -> list:
+        calls.append("b")
+        time.sleep(0.05)
+        return []
+
+    d = LazyDict()
+    d.set_loader("b", _loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(d["b"])) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["b"]
+    assert len(results) == 4 and all(r is results[0] for r in results)
+
+
+def test_lazy_dict_load_all_errors() -> None:
+    def _bad_loader() -> int:
+        raise ValueError("bad data")
+
+    d = _lazy_dict([])
+    d.set_loader("x", _bad_loader)
+    with pytest.raises(ValueError):
+        d.load_all()
+    assert d.unloaded_keys == ["x"]
+
+    errors = []
+    d.load_all(lambda key, e: errors.append((key, str(e))))
+    assert errors == [("x", "bad data")]
+    assert d == {"a": 1, "b": 2, "c": 3}
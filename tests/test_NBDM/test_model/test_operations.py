@@ -0,0 +1,97 @@
+from functools import reduce
+
+import pytest
+from ph_units.unit_type import Unit
+
+from NBDM.model import operations, serialization
+from NBDM.model.envelope import NBDM_AssemblyType
+from NBDM.model.geometry import NBDM_BuildingSegmentGeometry
+from NBDM.model.occupancy import NBDM_BuildingSegmentOccupancy
+from NBDM.model.performance import (
+    NBDM_BuildingSegmentPerformance,
+    NBDM_MonthlySeries,
+    NBDM_SiteEnergy,
+)
+
+
+def _geometry(_area: float) -> NBDM_BuildingSegmentGeometry:
+    return NBDM_BuildingSegmentGeometry(
+        Unit(_area, "FT2"), Unit(_area * 2, "FT2"), Unit(_area * 10, "FT3")
+    )
+
+
+def test_operation_plan_is_cached() -> None:
+    plan = operations.get_operation_plan(NBDM_BuildingSegmentGeometry)
+    assert plan is operations.get_operation_plan(NBDM_BuildingSegmentGeometry)
+    assert plan.field_names == (
+        "area_envelope",
+        "area_floor_area_net_interior_weighted",
+        "volume_net_interior",
+    )
+
+
+def test_add_subtract_with_failed_fields() -> None:
+    geom_a = _geometry(1.0)
+    geom_b = _geometry(2.0)
+    geom_b.volume_net_interior = Unit(1.0, "M3")
+
+    added = geom_a + geom_b
+    assert added.area_envelope == Unit(3.0, "FT2")
+    assert added.volume_net_interior is None
+
+    subtracted = geom_b - geom_a
+    assert subtracted.area_floor_area_net_interior_weighted == Unit(2.0, "FT2")
+    assert subtracted.volume_net_interior is None
+
+    with pytest.raises(Exception):
+        geom_a + NBDM_BuildingSegmentOccupancy()
+
+
+def test_subtract_keeps_first_string_fields() -> None:
+    assembly_a = NBDM_AssemblyType(
+        "Wall", Unit(0.5, "BTU/HR-FT2-F"), Unit(2.0, "HR-FT2-F/BTU"), "Exterior", "Room"
+    )
+    assembly_b = NBDM_AssemblyType(
+        "Roof", Unit(0.2, "BTU/HR-FT2-F"), Unit(5.0, "HR-FT2-F/BTU"), "Ground", "Attic"
+    )
+
+    subtracted = operations.subtract_NBDM_Objects(assembly_a, assembly_b)
+    assert subtracted.name == "Wall"
+    assert subtracted.ext_exposure == "Exterior"
+    assert subtracted.int_exposure == "Room"
+    assert subtracted.u_value == Unit(0.3, "BTU/HR-FT2-F")
+    assert subtracted.r_value == Unit(-3.0, "HR-FT2-F/BTU")
+
+
+def test_sum_matches_adding_one_at_a_time() -> None:
+    geoms = [_geometry(float(i)) for i in range(1, 6)]
+    geoms[3].volume_net_interior = "not a unit"
+    assert NBDM_BuildingSegmentGeometry.sum(geoms) == reduce(lambda x, y: x + y, geoms)
+
+    occs = [NBDM_BuildingSegmentOccupancy(i, i * 2.5) for i in range(5)]
+    assert NBDM_BuildingSegmentOccupancy.sum(occs) == NBDM_BuildingSegmentOccupancy(
+        10, 25.0
+    )
+
+
+def test_sum_nested_performance(
+    sample_NBDM_BuildingSegmentPerformance: NBDM_BuildingSegmentPerformance,
+) -> None:
+    perf_a = NBDM_BuildingSegmentPerformance(
+        site_energy=NBDM_SiteEnergy(consumption_gas=Unit(1.0, "KBTU"))
+    )
+    perf_a.monthly.heating_demand = NBDM_MonthlySeries([1.0] * 12)
+    perfs = [perf_a, sample_NBDM_BuildingSegmentPerformance, perf_a]
+
+    expected = reduce(lambda x, y: x + y, perfs)
+    total = NBDM_BuildingSegmentPerformance.sum(perfs)
+    assert serialization.to_dict(total) == serialization.to_dict(expected)
+    assert total.monthly.heating_demand.total == Unit(24.0, "KBTU")
+
+
+def test_sum_single_and_empty() -> None:
+    geom = _geometry(1.0)
+    assert NBDM_BuildingSegmentGeometry.sum([geom]) is geom
+
+    with pytest.raises(ValueError):
+        NBDM_BuildingSegmentGeometry.sum([])
@@ -1,10 +1,15 @@
 from copy import copy
 
+import pytest
+from ph_units.unit_type import Unit
+
 from NBDM.model import serialization
 from NBDM.model.performance import (
     NBDM_AnnualCoolingDemandEnergy,
     NBDM_AnnualHeatingDemandEnergy,
     NBDM_BuildingSegmentPerformance,
+    NBDM_MonthlyPerformance,
+    NBDM_MonthlySeries,
     NBDM_PeakCoolingLoad,
     NBDM_PeakHeatingLoad,
     NBDM_SiteEnergy,
@@ -102,3 +107,69 @@ def test_add_building_segment_performance(
     )
     assert perf_3.peak_heating_load == perf_1.peak_heating_load + perf_2.peak_heating_load
     assert perf_3.peak_cooling_load == perf_1.peak_cooling_load + perf_2.peak_cooling_load
+
+
+# --- Monthly Series
+def test_monthly_series() -> None:
+    series = NBDM_MonthlySeries(list(range(12)), "KWH")
+
+    assert series.JAN == Unit(0.0, "KWH")
+    assert series.DEC == Unit(11.0, "KWH")
+    assert series.total == Unit(66.0, "KWH")
+    assert series.peak == Unit(11.0, "KWH")
+    assert series.peak_month == "DEC"
+
+    with pytest.raises(ValueError):
+        NBDM_MonthlySeries([1.0, 2.0], "KWH")
+    with pytest.raises(AttributeError):
+        series.not_a_month
+
+
+def test_add_subtract_monthly_series() -> None:
+    series_kwh = NBDM_MonthlySeries([1.0] * 12, "KWH")
+    series_kbtu = series_kwh.as_a("KBTU")
+
+    assert (series_kwh + series_kwh).values.tolist() == [2.0] * 12
+    assert (series_kwh - series_kwh).total == Unit(0.0, "KWH")
+
+    # -- The other series is converted to the first series' unit
+    total = series_kwh + series_kbtu
+    assert total.unit == "KWH"
+    assert total.values.tolist() == pytest.approx([2.0] * 12)
+
+    with pytest.raises(TypeError):
+        series_kwh + NBDM_MonthlySeries([1.0] * 12, "FT2")
+
+
+def test_monthly_performance_to_dict() -> None:
+    monthly = NBDM_MonthlyPerformance(heating_demand=NBDM_MonthlySeries(list(range(12))))
+    d1 = serialization.to_dict(monthly)
+    obj = NBDM_MonthlyPerformance.from_dict(d1)
+    d2 = serialization.to_dict(obj)
+
+    assert d1 == d2
+    assert d1["heating_demand"]["values"] == [float(i) for i in range(12)]
+    assert obj == monthly
+
+
+def test_building_segment_performance_without_monthly_from_dict(
+    sample_NBDM_BuildingSegmentPerformance: NBDM_BuildingSegmentPerformance,
+):
+    d1 = serialization.to_dict(sample_NBDM_BuildingSegmentPerformance)
+    d1.pop("monthly")
+    obj = NBDM_BuildingSegmentPerformance.from_dict(d1)
+
+    assert obj.monthly == NBDM_MonthlyPerformance()
+
+
+def test_add_building_segment_monthly_performance(
+    sample_NBDM_BuildingSegmentPerformance: NBDM_BuildingSegmentPerformance,
+):
+    perf_1 = copy(sample_NBDM_BuildingSegmentPerformance)
+    perf_1.monthly = NBDM_MonthlyPerformance(
+        heating_demand=NBDM_MonthlySeries([10.0] * 12)
+    )
+    perf_2 = copy(perf_1)
+
+    assert (perf_1 + perf_2).monthly.heating_demand.total == Unit(240.0, "KBTU")
+    assert (perf_1 - perf_2).monthly.heating_demand.total == Unit(0.0, "KBTU")
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+from ph_units.unit_type import Unit
+
+from NBDM.model import serialization
+from NBDM.model.geometry import NBDM_BuildingSegmentGeometry
+from NBDM.model.project import NBDM_Project
+from NBDM.model.team import NBDM_TeamContactInfo
+
+
+@dataclass
+class Example:
+    name: str
+    area: float = 1.0
+
+
+def test_deserialization_plan_is_cached():
+    plan = serialization.get_deserialization_plan(NBDM_BuildingSegmentGeometry)
+    assert plan is serialization.get_deserialization_plan(NBDM_BuildingSegmentGeometry)
+    assert plan.field_types == {
+        "area_envelope": Unit,
+        "area_floor_area_net_interior_weighted": Unit,
+        "volume_net_interior": Unit,
+    }
+    assert all(f.from_dict == Unit.from_dict for f in plan.fields)
+    assert not any(f.required for f in plan.fields)
+
+
+def test_build_from_dict_required_fields():
+    plan = serialization.get_deserialization_plan(Example)
+    assert [f.required for f in plan.fields] == [True, False]
+
+    obj = serialization.build_NBDM_obj_from_dict(Example, {"name": "A"})
+    assert obj == Example("A")
+
+    with pytest.raises(serialization.FromDictException):
+        serialization.build_NBDM_obj_from_dict(Example, {"area": 2.0})
+
+
+def test_build_from_dict_with_missing_fields():
+    # -- Fields with defaults may be left out
+    obj = serialization.build_NBDM_obj_from_dict(NBDM_TeamContactInfo, {"city": "A"})
+    assert obj.city == "A"
+    assert obj.state == NBDM_TeamContactInfo().state
+
+
+def test_project_from_dict(sample_NBDM_Project: NBDM_Project):
+    d1 = serialization.to_dict(sample_NBDM_Project)
+    d2 = serialization.to_dict(NBDM_Project.from_dict(d1))
+    assert d1 == d2
@@ -0,0 +1,48 @@
+import copy
+import pickle
+from dataclasses import dataclass, field
+
+import pytest
+from ph_units.unit_type import Unit
+
+from NBDM.model import serialization
+from NBDM.model.performance import NBDM_BuildingSegmentPerformance, NBDM_SiteEnergy
+from NBDM.model.project import NBDM_Project
+from NBDM.model.slots import add_slots
+
+
+@add_slots
+@dataclass
+class Example:
+    value: float = 1.0
+    unit: Unit = field(default_factory=Unit)
+
+
+def test_add_slots():
+    obj = Example()
+    assert obj.value == 1.0
+    assert Example.__slots__ == ("value", "unit")
+    assert not hasattr(obj, "__dict__")
+
+    with pytest.raises(AttributeError):
+        obj.not_a_field = 1
+
+
+def test_slotted_model_objects_copy_and_pickle(
+    sample_NBDM_BuildingSegmentPerformance: NBDM_BuildingSegmentPerformance,
+):
+    site_energy = NBDM_SiteEnergy(consumption_gas=Unit(1.0, "KBTU"))
+    assert not hasattr(site_energy, "__dict__")
+
+    for obj in (
+        copy.copy(sample_NBDM_BuildingSegmentPerformance),
+        copy.deepcopy(sample_NBDM_BuildingSegmentPerformance),
+        pickle.loads(pickle.dumps(sample_NBDM_BuildingSegmentPerformance)),
+    ):
+        assert obj == sample_NBDM_BuildingSegmentPerformance
+
+
+def test_slotted_project_to_dict(sample_NBDM_Project: NBDM_Project):
+    d1 = serialization.to_dict(sample_NBDM_Project)
+    d2 = serialization.to_dict(NBDM_Project.from_dict(d1))
+    assert d1 == d2
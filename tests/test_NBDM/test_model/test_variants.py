@@ -1,4 +1,6 @@
 from NBDM.model import serialization
+from NBDM.model.building import NBDM_BuildingSegment
+from NBDM.model.occupancy import NBDM_BuildingSegmentOccupancy
 from NBDM.model.project import NBDM_Project, NBDM_Variant, NBDM_Variants
 
 
@@ -45,3 +47,53 @@ def test_change_from_baseline_variant(sample_NBDM_Project: NBDM_Project):
     assert change_var.variant_name == baseline_var.variant_name
     assert len(change_var.building_segments) == len(baseline_var.building_segments)
     assert change_var.building_segment_names == baseline_var.building_segment_names
+
+
+def _variants(*_names: str) -> NBDM_Variants:
+    variants = NBDM_Variants()
+    for i, name in enumerate(_names, start=1):
+        variants.baseline.add_building_segment(
+            NBDM_BuildingSegment(name, occupancy=NBDM_BuildingSegmentOccupancy(i, i))
+        )
+        variants.proposed.add_building_segment(
+            NBDM_BuildingSegment(name, occupancy=NBDM_BuildingSegmentOccupancy(1, 1))
+        )
+    return variants
+
+
+def test_change_from_baseline_variant_is_cached():
+    variants = _variants("A", "B")
+    change_var = variants.change_from_baseline_variant
+
+    assert variants.change_from_baseline_variant is change_var
+    assert serialization.to_dict(change_var) == serialization.to_dict(
+        variants.baseline - variants.proposed
+    )
+
+
+def test_change_from_baseline_variant_updates_after_changes():
+    variants = _variants("A", "B")
+    version = variants.baseline.version
+    seg_a = variants.change_from_baseline_variant.get_building_segment("A")
+    seg_b = variants.change_from_baseline_variant.get_building_segment("B")
+
+    # -- Only the segments which changed are re-calculated
+    variants.baseline.add_building_segment(
+        NBDM_BuildingSegment("B", occupancy=NBDM_BuildingSegmentOccupancy(5, 5))
+    )
+    assert variants.baseline.version != version
+    change_var = variants.change_from_baseline_variant
+    assert change_var.get_building_segment("A") is seg_a
+    assert change_var.get_building_segment("B") is not seg_b
+    assert change_var.get_building_segment("B").occupancy.total_dwelling_units == 4
+
+    # -- In-place edits
+    variants.proposed.get_building_segment("A").occupancy.total_dwelling_units = 0
+    variants.proposed.invalidate_aggregates("A")
+    change_var = variants.change_from_baseline_variant
+    assert change_var.get_building_segment("A").occupancy.total_dwelling_units == 1
+    assert change_var.building.occupancy.total_dwelling_units == 5
+
+    variants.baseline.remove_segment_by_name("B")
+    variants.proposed.remove_segment_by_name("B")
+    assert variants.change_from_baseline_variant.building_segment_names == ["A"]
@@ -0,0 +1,143 @@
+import pathlib
+import shutil
+from typing import Iterator
+
+import pytest
+from ph_units.unit_type import Unit
+
+from NBDM.from_JSON.read import NBDM_Project_from_json_file
+from NBDM.model import serialization
+from NBDM.model.project import NBDM_Project
+from NBDM.portfolio.store import PortfolioStatistics, PortfolioStore
+
+JSON_FILE = pathlib.Path("tests/_source_json/la_mora.json")
+
+
+def _project(_zone: str, _electricity: float) -> NBDM_Project:
+    """Return the La Mora project, in the climate zone and with the electricity given."""
+    project = NBDM_Project_from_json_file(JSON_FILE)
+    project.site.climate.zone_passive_house = _zone
+    for segment in project.variants.proposed.building_segments:
+        segment.performance.site_energy.consumption_electricity = Unit(
+            _electricity, "KBTU"
+        )
+    project.variants.proposed.invalidate_aggregates()
+    return project
+
+
+@pytest.fixture
+def store() -> Iterator[PortfolioStore]:
+    store = PortfolioStore(":memory:")
+    # -- La Mora has 55,289 ft2 of floor area
+    for zone, electricity in (("5", 552_890.0), ("5", 2_211_560.0), ("6", 1_105_780.0)):
+        store.add_project(_project(zone, electricity))
+    yield store
+    store.close()
+
+
+def test_query(store: PortfolioStore) -> None:
+    assert len(store) == 3
+
+    rows = store.query(climate_zone="5", site_eui_kbtu_ft2__gt=20.0)
+    assert len(rows) == 1
+    assert rows[0]["site_eui_kbtu_ft2"] == pytest.approx(40.0)
+    assert rows[0]["floor_area_ft2"] == pytest.approx(55_289.0)
+    assert rows[0]["city"] == "Yonkers, NY"
+    assert rows[0]["variant"] == "proposed"
+
+    rows = store.query(climate_zone__in=["5", "6"], _order_by="site_eui_kbtu_ft2")
+    assert [round(r["site_eui_kbtu_ft2"]) for r in rows] == [10, 20, 40]
+
+    # -- The (unchanged) Baseline variant is stored as well
+    rows = store.query("baseline")
+    assert [round(r["site_eui_kbtu_ft2"], 1) for r in rows] == [26.7, 26.7, 26.7]
+
+    # -- Values which were never entered are stored as NULL
+    assert store.query(source_eui_kbtu_ft2=None, site_eui_kbtu_ft2__le=10.0)
+
+
+def test_query_bad_filters(store: PortfolioStore) -> None:
+    with pytest.raises(ValueError):
+        store.query(not_a_column=1)
+    with pytest.raises(ValueError):
+        store.query(site_eui_kbtu_ft2__about=1)
+    with pytest.raises(ValueError):
+        store.query(_order_by="id; DROP TABLE projects")
+
+
+def test_statistics(store: PortfolioStore) -> None:
+    stats = store.statistics("site_eui_kbtu_ft2", _group_by="climate_zone")
+    assert [s.group for s in stats] == ["5", "6"]
+    assert stats[0].count == 2
+    assert stats[0].minimum == pytest.approx(10.0)
+    assert stats[0].maximum == pytest.approx(40.0)
+    assert stats[0].mean == pytest.approx(25.0)
+
+    (total,) = store.statistics("site_eui_kbtu_ft2", climate_zone="6")
+    assert total == PortfolioStatistics(None, 1, *(pytest.approx(20.0),) * 3)
+
+    with pytest.raises(ValueError):
+        store.statistics("city")
+
+
+def test_get_and_remove_project(store: PortfolioStore) -> None:
+    project = _project("7", 1.0)
+    project_id = store.add_project(project)
+    assert serialization.to_dict(store.get_project(project_id)) == serialization.to_dict(
+        project
+    )
+
+    store.remove_project(project_id)
+    assert project_id not in store.project_ids
+    assert not store.query(climate_zone="7")
+    assert not store.query("baseline", climate_zone="7")
+    with pytest.raises(KeyError):
+        store.get_project(project_id)
+
+
+def test_add_json_files(tmp_path: pathlib.Path) -> None:
+    json_files = [tmp_path / "a.json", tmp_path / "b.json"]
+    for json_file in json_files:
+        shutil.copy(JSON_FILE, json_file)
+
+    db_path = tmp_path / "portfolio.db"
+    with PortfolioStore(db_path) as store:
+        result = store.add_json_files(json_files)
+        assert not result.errors
+        ids = list(result.project_ids.values())
+        assert len(set(ids)) == 2
+
+    # -- Unchanged files are not added again
+    with PortfolioStore(db_path) as store:
+        assert list(store.add_json_files(json_files).project_ids.values()) == ids
+        assert len(store) == 2
+
+        # -- Changed files replace the old project
+        json_files[0].write_text(json_files[0].read_text().replace("Yonkers", "Albany"))
+        new_id = store.add_json_file(json_files[0])
+        assert new_id not in ids
+        assert len(store) == 2
+        assert [r["city"] for r in store.query(_order_by="city")] == [
+            "Albany, NY",
+            "Yonkers, NY",
+        ]
+
+
+def test_add_json_files_skips_bad_files(tmp_path: pathlib.Path) -> None:
+    good_file = tmp_path / "good.json"
+    shutil.copy(JSON_FILE, good_file)
+    bad_file = tmp_path / "bad.json"
+    bad_file.write_text('{"project_name": ')
+    missing_file = tmp_path / "missing.json"
+
+    with PortfolioStore(tmp_path / "portfolio.db") as store:
+        result = store.add_json_files([bad_file, good_file, missing_file])
+        assert list(result.project_ids) == [good_file]
+        assert list(result.errors) == [bad_file, missing_file]
+        assert store.project_ids == [result.project_ids[good_file]]
+
+        # -- A changed file which can no longer be read in keeps its old project
+        good_file.write_text('{"project_name": ')
+        result = store.add_json_files([good_file])
+        assert list(result.errors) == [good_file]
+        assert len(store) == 1
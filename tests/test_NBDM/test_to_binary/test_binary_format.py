@@ -0,0 +1,118 @@
+import math
+import pathlib
+
+import pytest
+
+from NBDM.from_binary.read import NBDM_Project_from_binary_file
+from NBDM.from_binary.unpacker import BinaryFormatError, unpack
+from NBDM.from_JSON.read import NBDM_Project_from_json_file
+from NBDM.model import serialization
+from NBDM.model.project import NBDM_Project
+from NBDM.to_binary.packer import (
+    FORMAT_VERSION,
+    HEADER,
+    MAGIC,
+    TAG_RECORD,
+    TAG_STR,
+    TAG_STR_REF,
+    pack,
+)
+from NBDM.to_binary.write import NBDM_Project_to_binary_file
+
+JSON_FILE = pathlib.Path("tests/_source_json/la_mora.json")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        63,
+        -64,
+        2**70,
+        -(2**70),
+        1.5,
+        -0.0,
+        float("inf"),
+        "",
+        "Ünïcode ✓",
+        [],
+        [1.0, 2.5, -3.0],
+        [1.0, 2, None, "a", "a"],
+        {},
+        {"a": {"value": 1.0, "unit": "M2"}, "b": {"value": 2.0, "unit": "M2"}},
+        {"a": [{"x": 1}, {"x": 2}, {"y": 1}], "x": "y"},
+    ],
+)
+def test_pack_unpack_round_trip(value) -> None:
+    assert unpack(pack(value)) == value
+
+
+def test_pack_nan() -> None:
+    assert math.isnan(unpack(pack(float("nan"))))
+    assert math.isnan(unpack(pack([1.0, float("nan")]))[1])
+
+
+def test_repeated_keys_and_strings_are_written_once() -> None:
+    one = len(pack([{"value": 1.0, "unit": "KWH/M2"}]))
+    many = len(pack([{"value": 1.0, "unit": "KWH/M2"}] * 10))
+    # -- Each repeat is only the record (2 bytes), float (9 bytes) and string-ref (2 bytes)
+    assert many - one == 9 * 13
+
+
+def test_pack_unsupported_types() -> None:
+    with pytest.raises(TypeError):
+        pack({"a": object()})
+    with pytest.raises(TypeError):
+        pack({1: "a"})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"NOPE!" + bytes(10),
+        HEADER.pack(MAGIC, FORMAT_VERSION + 1) + pack(None)[HEADER.size :],
+        pack("abc")[:-1],
+        pack([1.0, 2.0])[:-1],
+        pack({"a": 1}) + b"\x00",
+        HEADER.pack(MAGIC, FORMAT_VERSION) + b"\xff",
+        # -- Invalid UTF-8 text
+        HEADER.pack(MAGIC, FORMAT_VERSION) + bytes((TAG_STR, 2)) + b"\xc3\x28",
+        # -- Unknown string and schema indexes
+        HEADER.pack(MAGIC, FORMAT_VERSION) + bytes((TAG_STR_REF, 0)),
+        pack([{"a": "x"}])[:-3] + bytes((TAG_STR_REF, 5)),
+        pack([{"a": 1.0}, {"a": 2.0}])[:-11] + bytes((TAG_RECORD, 3)),
+    ],
+)
+def test_unpack_bad_data(data: bytes) -> None:
+    with pytest.raises(BinaryFormatError):
+        unpack(data)
+
+
+def test_project_binary_file_round_trip(tmp_path: pathlib.Path) -> None:
+    project = NBDM_Project_from_json_file(JSON_FILE)
+    binary_file = tmp_path / "project.ccb"
+    NBDM_Project_to_binary_file(project, binary_file)
+
+    new_project = NBDM_Project_from_binary_file(binary_file)
+    assert isinstance(new_project, NBDM_Project)
+    assert serialization.to_dict(new_project) == serialization.to_dict(project)
+
+    assert unpack(binary_file.read_bytes()) == serialization.to_dict(project)
+    assert binary_file.stat().st_size < JSON_FILE.stat().st_size / 4
+    assert not binary_file.with_name("project.ccb.tmp").exists()
+
+
+def test_sample_project_binary_round_trip(
+    tmp_path: pathlib.Path, sample_NBDM_Project: NBDM_Project
+) -> None:
+    binary_file = tmp_path / "project.ccb"
+    NBDM_Project_to_binary_file(sample_NBDM_Project, binary_file)
+    new_project = NBDM_Project_from_binary_file(binary_file)
+    assert serialization.to_dict(new_project) == serialization.to_dict(
+        sample_NBDM_Project
+    )
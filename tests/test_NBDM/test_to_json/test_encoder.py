@@ -0,0 +1,76 @@
+import io
+import json
+import pathlib
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import pytest
+from ph_units.unit_type import Unit
+
+from NBDM.model import serialization
+from NBDM.model.enums import building_type
+from NBDM.model.project import NBDM_Project
+from NBDM.to_JSON.encoder import get_class_encoder, write_NBDM_obj_as_json
+from NBDM.to_JSON.write import NBDM_Project_to_json_file
+
+
+@dataclass
+class Empty:
+    pass
+
+
+@dataclass
+class Example:
+    name: str = 'Ünïcode "quoted"\n'
+    value: float = float("nan")
+    count: int = 2
+    flag: bool = True
+    nothing: Any = None
+    kind: building_type = building_type.MULTIFAMILY
+    monthly: array = field(default_factory=lambda: array("d", [1.0, -2.5, 1e-20]))
+    area: Unit = field(default_factory=lambda: Unit(1.5, "M2"))
+    items: List[Empty] = field(default_factory=lambda: [Empty(), Empty()])
+    children: Dict[str, Empty] = field(default_factory=dict)
+
+
+def _as_json(_obj: Any) -> str:
+    stream = io.StringIO()
+    write_NBDM_obj_as_json(_obj, stream)
+    return stream.getvalue()
+
+
+def test_class_encoder_is_cached():
+    encoder = get_class_encoder(Example)
+    assert encoder is get_class_encoder(Example)
+    assert encoder.fields[0] == ("name", '"name": ')
+
+
+@pytest.mark.parametrize(
+    "obj", [Empty(), Example(), Example(children={"a": Empty()}, items=[])]
+)
+def test_encoder_matches_json_dumps(obj: Any):
+    assert _as_json(obj) == json.dumps(serialization.to_dict(obj), indent=4)
+
+
+def test_encoder_project_matches_json_dumps(sample_NBDM_Project: NBDM_Project):
+    expected = json.dumps(serialization.to_dict(sample_NBDM_Project), indent=4)
+    assert _as_json(sample_NBDM_Project) == expected
+
+
+def test_encoder_not_serializable():
+    with pytest.raises(TypeError):
+        _as_json(Example(nothing=object()))
+
+
+def test_write_json_file_error_keeps_existing_file(tmp_path: pathlib.Path):
+    output_file = tmp_path / "project.json"
+    output_file.write_text("old")
+
+    project = NBDM_Project()
+    project.project_name = object()  # type: ignore
+    with pytest.raises(TypeError):
+        NBDM_Project_to_json_file(project, output_file)
+
+    assert output_file.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [output_file]